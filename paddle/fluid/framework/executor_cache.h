@@ -103,12 +103,31 @@ class InterpreterCoreInfoCache {
                                               const int64_t& place_hash_key,
                                               bool is_grad,
                                               bool in_pir_mode) {
+    int64_t key = program_id;
     if (in_pir_mode) {
       int64_t scope_i = reinterpret_cast<int64_t>(scope);
-      program_id = hash_with_seed(program_id, scope_i);
-      program_id = hash_with_seed(program_id, place_hash_key);
+      key = hash_with_seed(key, scope_i);
+      key = hash_with_seed(key, place_hash_key);
+    }
+    auto iter = info_map_.find(key);
+    if (iter == info_map_.end()) {
+      iter = info_map_.emplace(key, InterpreterCoreInfo()).first;
+      // NOTE: record the keys derived from program_id, so that the cached
+      // interpreter cores can be erased when the program is released.
+      program_keys_[program_id].push_back(key);
+    }
+    return iter->second.GetMutable(is_grad);
+  }
+
+  void Erase(int64_t program_id) {
+    auto iter = program_keys_.find(program_id);
+    if (iter == program_keys_.end()) {
+      return;
+    }
+    for (auto key : iter->second) {
+      info_map_.erase(key);
     }
-    return info_map_[program_id].GetMutable(is_grad);
+    program_keys_.erase(iter);
   }
 
   void UpdateSkipEagerDeleteVars(int64_t program_id,
@@ -139,10 +158,12 @@ class InterpreterCoreInfoCache {
     // to avoid problems caused by destructor order of static
     // object.
     info_map_.clear();
+    program_keys_.clear();
   }
 
  private:
   std::unordered_map<int64_t, InterpreterCoreInfo> info_map_;
+  std::unordered_map<int64_t, std::vector<int64_t>> program_keys_;
 };
 
 std::shared_ptr<InterpreterCore> CreateProgramInterpreterCoreInfoToCache(
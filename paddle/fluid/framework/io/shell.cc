@@ -13,6 +13,7 @@
 // limitations under the License.
 
 #include <array>
+#include <mutex>
 #define GLOG_NO_ABBREVIATED_SEVERITIES  // msvc conflict logging with windows.h
 #include "paddle/fluid/framework/io/shell.h"
 
@@ -170,6 +171,32 @@ static int read_from_pipe(FILE* fp, std::string* output) {
   return 0;
 }
 
+#if defined(_WIN32) || defined(__APPLE__) || defined(PADDLE_ARM)
+#else
+// NOTE: shell_popen can be called from many threads at once, e.g. by the
+// HDFS transfers which run without the GIL. SIGCHLD is process wide, so it is
+// reset to the default handler when the first pipe is opened and restored
+// when the last one is closed, otherwise a thread may restore a handler that
+// reaps the children of the others.
+static std::mutex sigchld_mutex;
+static int sigchld_users = 0;
+static sighandler_t sigchld_old_handler = SIG_DFL;
+
+static void acquire_default_sigchld() {
+  std::lock_guard<std::mutex> lock(sigchld_mutex);
+  if (sigchld_users++ == 0) {
+    sigchld_old_handler = signal(SIGCHLD, SIG_DFL);
+  }
+}
+
+static void release_default_sigchld() {
+  std::lock_guard<std::mutex> lock(sigchld_mutex);
+  if (--sigchld_users == 0) {
+    signal(SIGCHLD, sigchld_old_handler);
+  }
+}
+#endif
+
 std::shared_ptr<FILE> shell_popen(const std::string& cmd,
                                   const std::string& mode,
                                   int* err_no,
@@ -205,8 +232,7 @@ std::shared_ptr<FILE> shell_popen(const std::string& cmd,
     child_end = pipe_fds[0];
   }
 
-  sighandler_t old_handler;
-  old_handler = signal(SIGCHLD, SIG_DFL);
+  acquire_default_sigchld();
 
   fcntl(parent_end, F_SETFD, FD_CLOEXEC);
 
@@ -218,11 +244,11 @@ std::shared_ptr<FILE> shell_popen(const std::string& cmd,
   FILE* fp = fdopen(parent_end, mode.c_str());
   if (fp == nullptr) {
     *err_no = -1;
-    signal(SIGCHLD, old_handler);
+    release_default_sigchld();
     return nullptr;
   }
 
-  return {fp, [cmd, child_pid, old_handler, err_no, status](FILE* fp) {
+  return {fp, [cmd, child_pid, err_no, status](FILE* fp) {
             VLOG(3) << "Closing pipe[" << cmd << "]";
             if (fclose(fp)) {
               *err_no = -1;
@@ -246,7 +272,7 @@ std::shared_ptr<FILE> shell_popen(const std::string& cmd,
               *err_no = -1;
             }
 
-            signal(SIGCHLD, old_handler);
+            release_default_sigchld();
           }};
 #endif
 }
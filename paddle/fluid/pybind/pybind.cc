@@ -2469,7 +2469,8 @@ All parameter, weight, gradient are variables in Paddle.
       py::arg("cmd"),
       py::arg("time_out") = 0,
       py::arg("sleep_inter") = 0,
-      py::arg("redirect_stderr") = false);
+      py::arg("redirect_stderr") = false,
+      py::call_guard<py::gil_scoped_release>());
   m.def("set_variable",
         static_cast<void (*)(  // NOLINT
             Scope *,
@@ -2992,6 +2993,10 @@ All parameter, weight, gradient are variables in Paddle.
     pybind11::gil_scoped_release release;
     framework::InterpreterCoreInfoCache::Instance().Finalize();
   });
+  m.def("clear_executor_cache_of_program", [](int64_t program_id) {
+    pybind11::gil_scoped_release release;
+    framework::InterpreterCoreInfoCache::Instance().Erase(program_id);
+  });
 
   m.def("parse_safe_eager_deletion_skip_vars",
         paddle::framework::details::ParseSafeEagerDeletionSkipVarsSet);
@@ -14,9 +14,13 @@
 
 
 import logging
+import math
 import os
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from .cost_model import get_mem
 from .prune import _PRUNE_HISTORY_FUNC
 from .utils import (
     gbs_search_all,
@@ -155,3 +159,216 @@ class CustomizeSearch(SearchAlgo):
         new_cfg = self.all_tasks[self.idx]
         self.idx += 1
         return new_cfg
+
+
+class ModelBasedSearch(SearchAlgo):
+    """
+    Launch the candidate with the best predicted metric instead of walking
+    the candidates in a fixed order.
+
+    A bayesian linear regression on log-scaled parallel degrees is refitted
+    from the finished trials before every pick, and candidates are ranked by
+    the upper confidence bound ``mean + exploration * std`` of the predicted
+    log metric. The first ``warmup_trials`` picks are spread evenly over the
+    candidates to seed the model, and the search stops once the best bound is
+    not above the best measured metric by more than ``min_improvement``
+    (relative). Candidates whose memory estimated by ``cost_model.get_mem``
+    exceeds ``per_card_memory`` are ranked behind all the others, both in
+    warmup and by the model, they are not dropped since the estimate may be
+    wrong and they are still launched once the others run out. The estimate
+    also breaks ties between equal predictions.
+
+    The options are read from ``tuner_cfg["search_algo"]``:
+    ``warmup_trials`` (default 3), ``min_improvement`` (default 0.01),
+    ``exploration`` (default 1.0) and ``l2_reg`` (default 1.0).
+    """
+
+    _FEATURE_KEYS = [
+        "dp_degree",
+        "mp_degree",
+        "pp_degree",
+        "vpp_degree",
+        "sharding_degree",
+        "micro_batch_size",
+    ]
+
+    def __init__(self, tuner_cfg):
+        super().__init__(tuner_cfg)
+        self.idx = 0
+        algo_cfg = tuner_cfg.get("search_algo", {})
+        self.warmup_trials = algo_cfg.get("warmup_trials", 3)
+        self.min_improvement = algo_cfg.get("min_improvement", 0.01)
+        self.exploration = algo_cfg.get("exploration", 1.0)
+        self.l2_reg = algo_cfg.get("l2_reg", 1.0)
+        metric_cfg = tuner_cfg.get("metric_cfg", {})
+        self.maximize = (
+            metric_cfg.get("OptimizationDirection", "Maximize") == "Maximize"
+        )
+
+        self.all_tasks = search_all(tuner_cfg)
+        mems = [self._estimate_mem(cfg) for cfg in self.all_tasks]
+        self.mems = np.asarray(
+            [mem if mem is not None else 0.0 for mem in mems], dtype="float64"
+        )
+        per_card_memory = tuner_cfg.get("per_card_memory", None)
+        self.over_memory = np.asarray(
+            [
+                per_card_memory is not None
+                and mem is not None
+                and mem > per_card_memory
+                for mem in mems
+            ],
+            dtype="bool",
+        )
+        if self.over_memory.any():
+            logger.info(
+                f"{int(self.over_memory.sum())} tasks exceeding per_card_memory by memory estimation are ranked last."
+            )
+        self.features = (
+            np.stack([self._featurize(cfg) for cfg in self.all_tasks])
+            if self.all_tasks
+            else np.zeros([0, 0])
+        )
+        # NOTE: Seed the model with candidates spread over the search space.
+        self.warmup_idxs = (
+            sorted(
+                set(
+                    np.linspace(0, len(self.all_tasks) - 1, self.warmup_trials)
+                    .round()
+                    .astype("int64")
+                    .tolist()
+                )
+            )
+            if self.all_tasks
+            else []
+        )
+        # NOTE: Indices of the candidates which are neither launched nor pruned.
+        self.remaining = list(range(len(self.all_tasks)))
+        self.launched = []
+
+    def _estimate_mem(self, cfg):
+        model_cfg = self.tuner_cfg.get("model_cfg", {})
+        try:
+            return get_mem(
+                self.tuner_cfg["num_gpus"],
+                cfg,
+                model_cfg["num_layers"],
+                model_cfg["hidden_size"],
+                model_cfg["num_attention_heads"],
+                model_cfg["vocab_size"],
+                model_cfg["seq_length"],
+                model_cfg["global_batch_size"],
+            )
+        except (AssertionError, KeyError, TypeError, ZeroDivisionError):
+            return None
+
+    def _featurize(self, cfg):
+        logs = [math.log2(max(cfg[key], 1)) for key in self._FEATURE_KEYS]
+        return np.asarray(
+            [1.0]
+            + logs
+            + [v * v for v in logs]
+            + [
+                float(cfg["sharding_stage"]),
+                float(bool(cfg["use_recompute"])),
+            ],
+            dtype="float64",
+        )
+
+    def _score(self, value):
+        # NOTE: Scores are always maximized and log-scaled so that the
+        # improvement threshold is relative to the current best metric.
+        return math.log(value) if self.maximize else -math.log(value)
+
+    def _observations(self, history_cfgs):
+        features, scores = [], []
+        for idx in self.launched:
+            cfg = self.all_tasks[idx]
+            metric = self._find_metric(cfg, history_cfgs)
+            if metric is not None:
+                features.append(self.features[idx])
+                scores.append(self._score(metric))
+        return features, scores
+
+    def _find_metric(self, cfg, history_cfgs):
+        for history_cfg in history_cfgs:
+            if all(history_cfg.get(key) == value for key, value in cfg.items()):
+                metric = history_cfg.get("time", -1)
+                if metric is not None and metric > 0:
+                    return metric
+                return None
+        return None
+
+    def _predict(self, features, scores):
+        x = np.stack(features)
+        y = np.asarray(scores, dtype="float64")
+        offset = y.mean()
+        # NOTE: The prior of the weights is N(0, var / l2_reg), and the noise
+        # variance is taken from the spread of the observed scores.
+        precision = x.T @ x + self.l2_reg * np.eye(x.shape[1])
+        weights = np.linalg.solve(precision, x.T @ (y - offset))
+        var = max(y.var(), 1e-4)
+        cands = self.features[self.remaining]
+        mean = cands @ weights + offset
+        std = np.sqrt(
+            var
+            * np.einsum("ij,ji->i", cands, np.linalg.solve(precision, cands.T))
+        )
+        return mean + self.exploration * std
+
+    def _warmup_order(self):
+        warmup_idxs = set(self.warmup_idxs)
+        return sorted(
+            range(len(self.remaining)),
+            key=lambda pos: (
+                bool(self.over_memory[self.remaining[pos]]),
+                self.remaining[pos] not in warmup_idxs,
+            ),
+        )
+
+    def search_once(self, history_cfgs):
+        if not self.remaining:
+            return None
+
+        features, scores = self._observations(history_cfgs)
+        if len(self.launched) < self.warmup_trials or not scores:
+            order = self._warmup_order()
+            predicted = None
+        else:
+            predicted = self._predict(features, scores)
+            # NOTE: Candidates over the memory go last, and the lower
+            # estimated memory is preferred among equal predictions.
+            order = np.lexsort(
+                (
+                    self.mems[self.remaining],
+                    -predicted,
+                    self.over_memory[self.remaining],
+                )
+            ).tolist()
+
+        new_cfg = None
+        dropped = set()
+        for pos in order:
+            idx = self.remaining[pos]
+            cfg = self.all_tasks[idx]
+            if self.prune(self.tuner_cfg, cfg, history_cfgs, self.pruned_cfgs):
+                self.pruned_cfgs.append(cfg)
+                dropped.add(idx)
+                continue
+            if predicted is not None:
+                best = max(scores)
+                gain = math.exp(predicted[pos] - best) - 1
+                if gain < self.min_improvement:
+                    logger.info(
+                        f"Stop model based search since the predicted improvement {gain:.4f} is less than {self.min_improvement}."
+                    )
+                    return None
+            new_cfg = cfg
+            self.pruned_cfgs.append(cfg)
+            self.launched.append(idx)
+            dropped.add(idx)
+            break
+
+        self.remaining = [i for i in self.remaining if i not in dropped]
+        self.idx = len(self.all_tasks) - len(self.remaining)
+        return new_cfg
@@ -48,6 +48,11 @@ class AutoTuner:
 
             tuner_cfg["candidates"] = gbs_default_candidates(tuner_cfg)
             self.algo = GBSSearch(tuner_cfg)
+        elif search_algo == "model_based":
+            from .search import ModelBasedSearch
+
+            tuner_cfg["candidates"] = default_candidates(tuner_cfg)
+            self.algo = ModelBasedSearch(tuner_cfg)
         elif search_algo == "customize":
             from .search import CustomizeSearch
 
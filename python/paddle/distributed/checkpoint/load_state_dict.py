@@ -14,17 +14,23 @@
 
 from __future__ import annotations
 
+import collections
 import copy
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 import paddle
 from paddle.base.framework import (
     _current_expected_place,
 )
 from paddle.distributed.communication.group import is_initialized
 from paddle.distributed.fleet.utils.log_util import logger
+from paddle.framework.chunked_io import _default_num_threads, _is_chunked_file
 
 from .metadata import LocalTensorIndex, LocalTensorMetadata
 from .utils import (
@@ -50,6 +56,94 @@ class ReadItem:
 PATH_TO_CHECKPOINT_FILES: dict[str, tuple[list, list]] = {}
 
 
+class StorageFile:
+    """
+    A data file of checkpoint to be read by current rank.
+
+    If the file is saved in chunked format, it is memory mapped and only the
+    slices to be loaded are read from disk. Otherwise, the whole file is
+    loaded as numpy.ndarray at the first access. The file can be accessed
+    by several reader threads at the same time.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._state_dict = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._state_dict is None:
+                self._state_dict = paddle.load(
+                    self.path,
+                    return_numpy=True,
+                    mmap=_is_chunked_file(self.path),
+                )
+        return self._state_dict
+
+    def __contains__(self, key):
+        return key in self._load()
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+
+def read_storage_chunk(storage_file, item):
+    """
+    Read the slice of storage local tensor described by read item as a
+    contiguous numpy.ndarray.
+    """
+    assert (
+        item.local_tensor_index.tensor_key in storage_file
+    ), f"{item.local_tensor_index.tensor_key} not found in {storage_file.path}"
+    storage_local_tensor = storage_file[item.local_tensor_index.tensor_key]
+    if len(item.lengths) > 0:
+        storage_local_tensor = storage_local_tensor[
+            tuple(
+                slice(offset, offset + length)
+                for offset, length in zip(item.storage_offset, item.lengths)
+            )
+        ]
+    if (
+        isinstance(storage_local_tensor, np.memmap)
+        or not storage_local_tensor.flags.c_contiguous
+    ):
+        # NOTE: copy here to read the data from disk in the reader thread
+        storage_local_tensor = np.array(storage_local_tensor)
+    return storage_local_tensor
+
+
+def read_storage_chunks(source_state_dict, read_items, load_infos):
+    """
+    Read the storage chunks of read_items with a bounded thread pool and
+    yield them in the order of read_items. At most twice the number of
+    threads chunks are read ahead, so reading overlaps with the copying
+    and broadcasting of previous chunks while the host memory is bounded.
+    """
+    num_threads = _default_num_threads()
+    read_items = iter(read_items)
+    futures = collections.deque()
+    with ThreadPoolExecutor(max_workers=num_threads) as pool:
+
+        def submit():
+            item = next(read_items, None)
+            if item is not None:
+                _, file_name = load_infos[item.local_tensor_index]
+                assert file_name in source_state_dict
+                futures.append(
+                    pool.submit(
+                        read_storage_chunk, source_state_dict[file_name], item
+                    )
+                )
+
+        for _ in range(2 * num_threads):
+            submit()
+        while len(futures) > 0:
+            chunk = futures.popleft().result()
+            submit()
+            yield chunk
+
+
 def get_checkpoint_files(path, use_cache=True):
     global PATH_TO_CHECKPOINT_FILES
     if use_cache and path in PATH_TO_CHECKPOINT_FILES:
@@ -72,6 +166,21 @@ def get_checkpoint_files(path, use_cache=True):
     return (metadata_files, local_data_files)
 
 
+def get_referenced_data_files(path, metadata_list):
+    """
+    Get the accessible data files in previous checkpoint directories which
+    are referenced by an incremental checkpoint.
+    """
+    referenced_files = set()
+    for metadata in metadata_list:
+        for file_name in metadata.storage_metadata.values():
+            if os.path.dirname(file_name) != "" and os.path.isfile(
+                os.path.join(path, file_name)
+            ):
+                referenced_files.add(file_name)
+    return sorted(referenced_files)
+
+
 def get_rank_to_files(
     metadata_list, local_data_files, state_dict, process_group, use_dist
 ):
@@ -479,7 +588,8 @@ def load_state_dict(
         path(str): The directory to load checkpoint files.
         process_group(paddle.distributed.collective.Group): ProcessGroup to be used for cross-rank synchronization. Use the default process group which contains all cards.
         coordinator_rank(int): The rank used to coordinate the checkpoint. Rank0 is used by default.
-        offload(bool): Whether to offload the checkpoint data from GPU to CPU.
+        offload(bool): Whether to offload the checkpoint data from GPU to CPU. The checkpoint data is always kept on
+            CPU now and only the slices to load are copied to GPU, so this argument is kept for compatibility.
     Example:
         .. code-block:: python
 
@@ -530,6 +640,11 @@ def load_state_dict(
         metadata_list = []
         for file in metadata_files:
             metadata_list.append(paddle.load(os.path.join(path, file)))
+        # NOTE: the tensors unchanged in incremental checkpoint are stored in
+        # the data files of previous checkpoints
+        local_data_files = local_data_files + get_referenced_data_files(
+            path, metadata_list
+        )
 
         rank_to_files, missing_keys = get_rank_to_files(
             metadata_list,
@@ -565,18 +680,12 @@ def load_state_dict(
             rank_to_files, rank_to_local_data_files
         )
 
-        source_state_dict = {}
-        for file in local_load_files:
-            if offload:
-                state_dict_numpy = paddle.load(
-                    os.path.join(path, file), return_numpy=True
-                )
-                source_state_dict[file] = {
-                    key: paddle.to_tensor(value, place=paddle.CPUPlace())
-                    for key, value in state_dict_numpy.items()
-                }
-            else:
-                source_state_dict[file] = paddle.load(os.path.join(path, file))
+        # NOTE: the data files are read lazily and only the slices needed
+        # are copied to device, so the checkpoint data always stays on cpu
+        source_state_dict = {
+            file: StorageFile(os.path.join(path, file))
+            for file in local_load_files
+        }
 
         _load_state_dict(
             flat_state_dict,
@@ -616,6 +725,27 @@ def _load_state_dict(
         read_items = get_read_items(
             metadata_list, target_state_dict, process_group, use_dist
         )
+        # NOTE: read_items and load_infos are the same in all ranks, sort the
+        # items by file and offset so that each file is read sequentially.
+        read_items.sort(
+            key=lambda item: (
+                load_infos[item.local_tensor_index][1],
+                item.local_tensor_index.tensor_key,
+                item.local_tensor_index.global_offset,
+                item.storage_offset,
+                item.rank,
+            )
+        )
+        cur_rank = paddle.distributed.get_rank()
+        storage_chunks = read_storage_chunks(
+            source_state_dict,
+            [
+                item
+                for item in read_items
+                if load_infos[item.local_tensor_index][0] == cur_rank
+            ],
+            load_infos,
+        )
         for item in read_items:
             assert (
                 item.local_tensor_index in load_infos
@@ -627,36 +757,10 @@ def _load_state_dict(
             cur_chunk_tensor = None
             # The src rank need to load the state_dict.
             if src_rank == paddle.distributed.get_rank():
-                assert file_name in source_state_dict
-                storage_state_dict = source_state_dict[file_name]
-                assert item.local_tensor_index.tensor_key in storage_state_dict
-                storage_local_tensor = storage_state_dict[
-                    item.local_tensor_index.tensor_key
-                ]
-
-                if offload:
-                    storage_local_tensor = paddle.to_tensor(
-                        storage_local_tensor, place=_current_expected_place()
-                    )
-
-                storage_offsets = item.storage_offset
-                storage_lengths = item.lengths
-                storage_ends = [
-                    storage_offset + storage_length
-                    for storage_offset, storage_length in zip(
-                        storage_offsets, storage_lengths
-                    )
-                ]
-                # The storage_chunk_tensor and storage_local_tensor share the same memory.
-                if len(storage_lengths) > 0:
-                    storage_chunk_tensor = paddle.slice(
-                        storage_local_tensor,
-                        list(range(len(storage_lengths))),
-                        storage_offsets,
-                        storage_ends,
-                    )
-                else:
-                    storage_chunk_tensor = storage_local_tensor
+                # The storage chunk has been sliced and read by reader threads.
+                storage_chunk_tensor = paddle.to_tensor(
+                    next(storage_chunks), place=_current_expected_place()
+                )
             # The read item rank need to be assigned
             if item.rank == paddle.distributed.get_rank():
                 assert (
@@ -705,7 +809,6 @@ def _load_state_dict(
             else:
                 # Assign value remotely: src_rank broadcasts the ckpt, and the parameters to be loaded receive the data broadcast by src_rank.
                 if src_rank == paddle.distributed.get_rank():
-                    storage_chunk_tensor = storage_chunk_tensor.contiguous()
                     paddle.distributed.broadcast(
                         storage_chunk_tensor, src=src_rank, group=process_group
                     )
@@ -716,6 +819,7 @@ def _load_state_dict(
                         tmp_tensor, src=src_rank, group=process_group
                     )
                     paddle.assign(tmp_tensor, cur_chunk_tensor)
+        storage_chunks.close()
 
         for k, v in target_state_dict.items():
             if k in state_dict_in_cpu:
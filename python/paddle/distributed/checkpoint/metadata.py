@@ -40,5 +40,9 @@ class LocalTensorIndex:
 @dataclass
 class Metadata:
     state_dict_metadata: dict[str, list[LocalTensorMetadata]] = None
+    # The file storing each local tensor, a file of previous checkpoint is
+    # referenced by its path relative to the checkpoint directory.
     storage_metadata: dict[LocalTensorIndex, str] = None
     flat_mapping: dict[str, tuple[str]] = None
+    # The content hash of each local tensor, only recorded by incremental save.
+    content_hash: dict[LocalTensorIndex, str] = None
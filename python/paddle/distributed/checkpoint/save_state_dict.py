@@ -13,15 +13,20 @@
 # limitations under the License.
 from __future__ import annotations
 
+import hashlib
 import multiprocessing
 import os
 import time
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 import paddle
 from paddle.distributed.communication.group import is_initialized
 from paddle.distributed.fleet.utils.log_util import logger
+from paddle.framework.chunked_io import _is_chunked_file
 
+from .load_state_dict import PATH_TO_CHECKPOINT_FILES, get_checkpoint_files
 from .metadata import LocalTensorIndex, LocalTensorMetadata, Metadata
 from .utils import (
     compute_local_shape_and_global_offset,
@@ -88,6 +93,49 @@ def check_file_name(file_name, process_group):
         ), f"id:{id} !=  all_unique_id[0]:{file_name}"
 
 
+def compute_content_hash(local_tensor):
+    """
+    Compute the hash of the content of local tensor, dtype and shape of the
+    tensor are also hashed.
+    """
+    value = np.asarray(local_tensor.numpy())
+    content_hash = hashlib.blake2b(digest_size=16)
+    content_hash.update(f"{value.dtype.str}{value.shape}".encode())
+    content_hash.update(np.ascontiguousarray(value).reshape(-1).view(np.uint8))
+    return content_hash.hexdigest()
+
+
+def is_referenced_file(file_name):
+    """
+    Whether the data file locates in a previous checkpoint directory.
+    """
+    return os.path.dirname(file_name) != ""
+
+
+def load_base_metadata(base_path, path):
+    """
+    Load storage metadata and content hash of the base checkpoint, the data
+    files in them are converted to paths relative to :attr:`path`.
+    """
+    metadata_files, _ = get_checkpoint_files(base_path, use_cache=False)
+    base_storage_metadata = {}
+    base_content_hash = {}
+    for file in metadata_files:
+        metadata = paddle.load(os.path.join(base_path, file))
+        if metadata.content_hash is None:
+            continue
+        for tensor_index, file_name in metadata.storage_metadata.items():
+            base_storage_metadata[tensor_index] = os.path.relpath(
+                os.path.join(base_path, file_name), path
+            )
+        base_content_hash.update(metadata.content_hash)
+    if len(base_content_hash) == 0:
+        logger.warning(
+            f"No content hash found in the base checkpoint:{base_path}, all tensors will be saved."
+        )
+    return base_storage_metadata, base_content_hash
+
+
 def merge_state_dict_metadata(global_state_dict_metadata):
     assert isinstance(
         global_state_dict_metadata, list
@@ -134,7 +182,7 @@ def dedup_tensor(
     """
 
     for tensor_index, file_name in global_storage_metadata.items():
-        rank = int(file_name.split(".")[0].split("_")[0])
+        rank = int(os.path.basename(file_name).split(".")[0].split("_")[0])
         if (
             tensor_index in local_storage_metadata
             and rank != paddle.distributed.get_rank()
@@ -148,6 +196,9 @@ def save_state_dict(
     process_group: Group | None = None,
     coordinator_rank: int = 0,
     async_save: bool = False,
+    incremental: bool = False,
+    base_path: str | None = None,
+    use_chunked_format: bool = False,
 ) -> None:
     """
     Save the state_dict of model to path.
@@ -158,6 +209,16 @@ def save_state_dict(
         process_group(paddle.distributed.collective.Group): ProcessGroup to be used for cross-rank synchronization. Use the default process group which contains all cards.
         coordinator_rank(int): The rank used to save non distributed values. Rank0 is used by default.
         async_save(bool): Async save the state_dict, default is False.
+        incremental(bool): Whether to record the content hash of each local tensor, so that the checkpoint can be used
+            as the base of later incremental saves. Default is False.
+        base_path(str|None): The directory of a previous checkpoint saved with ``incremental=True``. If set, the local
+            tensors whose content is the same as in the base checkpoint are not saved again, and the metadata references
+            the data files of the base checkpoint instead. The base checkpoint should not be removed unless the
+            checkpoint is compacted by ``compact_checkpoint``. ``incremental`` is set to True if ``base_path`` is set.
+            Default is None.
+        use_chunked_format(bool): Whether to save the data files in the chunked format of ``paddle.save``, which
+            ``load_state_dict`` memory maps to read only the slices it needs instead of loading the whole file. The
+            files can not be loaded by releases without the chunked format. Default is False.
 
     Examples:
         .. code-block:: python
@@ -170,6 +231,9 @@ def save_state_dict(
             >>> sharded_w1 = dist.shard_tensor(w1, mesh, [dist.Shard(0), dist.Replicate()])
             >>> state_dict = {"w1": sharded_w1}
             >>> dist.save_state_dict(state_dict, "./checkpoint")
+            >>> # save the unchanged tensors only once
+            >>> dist.save_state_dict(state_dict, "./checkpoint_0", incremental=True)
+            >>> dist.save_state_dict(state_dict, "./checkpoint_1", base_path="./checkpoint_0")
             >>> # doctest: -SKIP
 
     """
@@ -203,10 +267,19 @@ def save_state_dict(
         logger.debug(f"file_name:{file_name}")
         if use_dist:
             check_file_name(file_name, process_group)
+        if base_path is not None:
+            incremental = True
+            base_storage_metadata, base_content_hash = load_base_metadata(
+                base_path, path
+            )
+        else:
+            base_storage_metadata, base_content_hash = {}, {}
         metadata = Metadata()
         local_state_dict = {}
         local_state_dict_metadata = {}
         local_storage_metadata = {}
+        local_content_hash = {}
+        reused_keys = []
         for key, val in flat_state_dict.items():
             if isinstance(val, paddle.Tensor):
                 # Case1: not initialized means this tensor is placed in another mesh which do not contain this rank
@@ -244,13 +317,25 @@ def save_state_dict(
                 local_state_dict_metadata[key] = LocalTensorMetadata(
                     global_offset, local_shape, local_tenosr_dtype
                 )
-                local_storage_metadata[
-                    LocalTensorIndex(key, tuple(global_offset))
-                ] = file_name
+                tensor_index = LocalTensorIndex(key, tuple(global_offset))
+                local_storage_metadata[tensor_index] = file_name
+                if incremental:
+                    content_hash = compute_content_hash(local_tensor)
+                    local_content_hash[tensor_index] = content_hash
+                    if (
+                        base_content_hash.get(tensor_index, None)
+                        == content_hash
+                    ):
+                        # reference the unchanged tensor in base checkpoint
+                        local_storage_metadata[tensor_index] = (
+                            base_storage_metadata[tensor_index]
+                        )
+                        reused_keys.append(key)
 
         global_state_dict_metadata = []
         global_storage_metadata = []
         global_flatten_mapping = []
+        global_content_hash = []
         if use_dist:
             paddle.distributed.all_gather_object(
                 global_state_dict_metadata,
@@ -263,16 +348,23 @@ def save_state_dict(
             paddle.distributed.all_gather_object(
                 global_flatten_mapping, mapping, process_group
             )
+            if incremental:
+                paddle.distributed.all_gather_object(
+                    global_content_hash, local_content_hash, process_group
+                )
         else:
             global_state_dict_metadata.append(local_state_dict_metadata)
             global_storage_metadata.append(local_storage_metadata)
             global_flatten_mapping.append(mapping)
+            global_content_hash.append(local_content_hash)
 
         metadata.state_dict_metadata = merge_state_dict_metadata(
             global_state_dict_metadata
         )
         metadata.storage_metadata = dedup_key_in_dict(global_storage_metadata)
         metadata.flat_mapping = dedup_key_in_dict(global_flatten_mapping)
+        if incremental:
+            metadata.content_hash = dedup_key_in_dict(global_content_hash)
         if coordinator_rank == paddle.distributed.get_rank():
             logger.debug(f"metadata:{metadata}")
             paddle.save(metadata, os.path.join(path, f"{unique_id}.metadata"))
@@ -280,6 +372,12 @@ def save_state_dict(
         dedup_tensor(
             local_state_dict, local_storage_metadata, metadata.storage_metadata
         )
+        for key in reused_keys:
+            local_state_dict.pop(key, None)
+        if incremental:
+            logger.info(
+                f"Incremental save: {len(reused_keys)} local tensors are referenced from {base_path}, {len(local_state_dict)} local tensors are saved."
+            )
 
         if async_save:
             cpu_state_dict = copy_dict_to_cpu(local_state_dict)
@@ -294,6 +392,7 @@ def save_state_dict(
                     p = ctx.Process(
                         target=paddle.save,
                         args=(cpu_state_dict, os.path.join(path, file_name)),
+                        kwargs={'use_chunked_format': use_chunked_format},
                     )
                     p.start()
                     return p
@@ -308,4 +407,79 @@ def save_state_dict(
             p = start_process()
             async_save_queue.append(p)
         else:
-            paddle.save(local_state_dict, os.path.join(path, file_name))
+            paddle.save(
+                local_state_dict,
+                os.path.join(path, file_name),
+                use_chunked_format=use_chunked_format,
+            )
+
+
+def compact_checkpoint(path: str) -> None:
+    """
+    Copy the tensors referenced from previous checkpoints by an incremental
+    checkpoint into its own directory and update the metadata, after that
+    the previous checkpoints can be removed safely. It should be called by
+    only one process after the checkpoint is saved.
+
+    Args:
+        path(str): The directory of the checkpoint to compact.
+
+    Examples:
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('run in distributed mode')
+            >>> import paddle.distributed as dist
+            >>> from paddle.distributed.checkpoint.save_state_dict import compact_checkpoint
+            >>> dist.save_state_dict(state_dict, "./checkpoint_1", base_path="./checkpoint_0")
+            >>> if dist.get_rank() == 0:
+            ...     compact_checkpoint("./checkpoint_1")
+            >>> # doctest: -SKIP
+    """
+    with paddle.base.dygraph.guard():
+        metadata_files, _ = get_checkpoint_files(path, use_cache=False)
+        for metadata_file in metadata_files:
+            metadata_path = os.path.join(path, metadata_file)
+            metadata = paddle.load(metadata_path)
+            file_to_tensor_indices = {}
+            for tensor_index, file_name in metadata.storage_metadata.items():
+                if is_referenced_file(file_name):
+                    if file_name not in file_to_tensor_indices:
+                        file_to_tensor_indices[file_name] = []
+                    file_to_tensor_indices[file_name].append(tensor_index)
+            if len(file_to_tensor_indices) == 0:
+                continue
+
+            unique_id = metadata_file.split(".")[0]
+            for i, (file_name, tensor_indices) in enumerate(
+                sorted(file_to_tensor_indices.items())
+            ):
+                file_path = os.path.join(path, file_name)
+                # NOTE: the local tensors of chunked file are memory mapped
+                # and written to the new file without loading the whole file,
+                # the new file keeps the format of the source file
+                use_chunked_format = _is_chunked_file(file_path)
+                source_state_dict = paddle.load(
+                    file_path, mmap=use_chunked_format
+                )
+                rank = os.path.basename(file_name).split("_")[0]
+                new_file_name = f"{rank}_{unique_id}.compacted{i}.distcp"
+                paddle.save(
+                    {
+                        tensor_index.tensor_key: source_state_dict[
+                            tensor_index.tensor_key
+                        ]
+                        for tensor_index in tensor_indices
+                    },
+                    os.path.join(path, new_file_name),
+                    use_chunked_format=use_chunked_format,
+                )
+                for tensor_index in tensor_indices:
+                    metadata.storage_metadata[tensor_index] = new_file_name
+                logger.info(
+                    f"Compact {len(tensor_indices)} local tensors from {file_name} to {new_file_name}."
+                )
+
+            # the metadata is replaced only after all data files are written
+            paddle.save(metadata, metadata_path + ".tmp")
+            os.replace(metadata_path + ".tmp", metadata_path)
+        PATH_TO_CHECKPOINT_FILES.pop(path, None)
@@ -21,11 +21,11 @@ import numpy as np
 import paddle
 from paddle import framework
 from paddle.distributed.communication import stream
+from paddle.distributed.communication.group import _get_global_group
 
-from .serialization_utils import (
-    convert_object_to_tensor,
-    convert_tensor_to_object,
-)
+from .batch_isend_irecv import P2POp, batch_isend_irecv
+from .broadcast import broadcast
+from .serialization_utils import pack_object, unpack_object
 
 if TYPE_CHECKING:
     from paddle import Tensor
@@ -34,6 +34,12 @@ if TYPE_CHECKING:
 
     _T = TypeVar("_T")
 
+# NOTE: Objects are gathered to the first rank of the group with
+# point-to-point ops and broadcast from it, which moves the actual bytes
+# twice, when padding every object to the largest one would move more than
+# this many times the actual bytes.
+_OBJECT_PADDING_RATIO = 2
+
 
 def all_gather(
     tensor_list: list[Tensor],
@@ -123,23 +129,79 @@ def all_gather_object(
         framework.in_dynamic_mode()
     ), "all_gather_object doesn't support static graph mode."
 
-    tensor, len_of_tensor = convert_object_to_tensor(obj)
+    data = pack_object(obj)
+    tensor = paddle.to_tensor(data)
 
-    # gather len_of_tensor from all ranks
+    # gather the size of objects from all ranks
     list_len_of_tensor = []
-    all_gather(list_len_of_tensor, len_of_tensor, group)
-    # get the max length from list
-    max_len_of_tensor = int(max(list_len_of_tensor).item())
-    # resize the input tensor to max length avoid hang in all gather
-    # Note(liyurui): Maybe we should support various length all_gather?
-    # Now this operation is efficient for we don't support resize in python.
-    numpy_data = tensor.numpy()
-    numpy_data = np.resize(numpy_data, [max_len_of_tensor])
-    input_tensor = paddle.to_tensor(numpy_data)
-
-    tensor_list = []
-    all_gather(tensor_list, input_tensor, group)
-    for i, tensor in enumerate(tensor_list):
-        object_list.append(
-            convert_tensor_to_object(tensor, list_len_of_tensor[i])
-        )
+    all_gather(
+        list_len_of_tensor,
+        paddle.to_tensor([data.size], dtype="int64"),
+        group,
+    )
+    sizes = paddle.concat(list_len_of_tensor).numpy().tolist()
+    max_size = max(sizes)
+
+    if _use_p2p_object_gather(group, sizes):
+        gathered = _all_gather_v(tensor, sizes, group).numpy()
+        offsets = np.cumsum([0, *sizes[:-1]]).tolist()
+    else:
+        # pad the input tensor to the max size to avoid hang in all gather
+        if data.size < max_size:
+            tensor = paddle.concat(
+                [tensor, paddle.zeros([max_size - data.size], dtype="uint8")]
+            )
+        tensor_list = []
+        all_gather(tensor_list, tensor, group)
+        gathered = paddle.concat(tensor_list).numpy()
+        offsets = [i * max_size for i in range(len(sizes))]
+
+    for offset, size in zip(offsets, sizes):
+        object_list.append(unpack_object(gathered[offset : offset + size]))
+
+
+def _use_p2p_object_gather(group: Group | None, sizes: list[int]) -> bool:
+    group = _get_global_group() if group is None else group
+    if group.backend != "NCCL":
+        return False
+    return max(sizes) * len(sizes) > _OBJECT_PADDING_RATIO * sum(sizes)
+
+
+def _all_gather_v(
+    tensor: Tensor, sizes: list[int], group: Group | None
+) -> Tensor:
+    """
+    Gather 1-D tensors of different sizes from all ranks, the i-th rank
+    contributes ``sizes[i]`` elements to the concatenated output. The tensors
+    are sent to the first rank of the group with batched point-to-point ops,
+    which only connects it with the other ranks instead of all pairs of
+    ranks, and the concatenated ``sum(sizes)`` elements are broadcast from it.
+    """
+    group = _get_global_group() if group is None else group
+    src = group.ranks[0]
+    if group.rank == 0:
+        tensor_list = [tensor]
+        p2p_ops = []
+        for group_rank in range(1, group.nranks):
+            recv_tensor = paddle.empty([sizes[group_rank]], dtype=tensor.dtype)
+            tensor_list.append(recv_tensor)
+            p2p_ops.append(
+                P2POp(
+                    paddle.distributed.irecv,
+                    recv_tensor,
+                    group.ranks[group_rank],
+                    group,
+                )
+            )
+        if p2p_ops:
+            for task in batch_isend_irecv(p2p_ops):
+                task.wait()
+        gathered = paddle.concat(tensor_list)
+    else:
+        for task in batch_isend_irecv(
+            [P2POp(paddle.distributed.isend, tensor, src, group)]
+        ):
+            task.wait()
+        gathered = paddle.empty([sum(sizes)], dtype=tensor.dtype)
+    broadcast(gathered, src, group)
+    return gathered
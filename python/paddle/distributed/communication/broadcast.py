@@ -15,15 +15,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 import paddle
 import paddle.distributed as dist
 from paddle import framework
 from paddle.distributed.communication import stream
 
-from .serialization_utils import (
-    convert_object_to_tensor,
-    convert_tensor_to_object,
-)
+from .serialization_utils import pack_object, unpack_object
 
 if TYPE_CHECKING:
     from paddle import Tensor
@@ -118,32 +117,27 @@ def broadcast_object_list(
     ), "broadcast_object_list doesn't support static graph mode."
 
     rank = dist.get_rank()
-    obj_tensors = []
     obj_nums = len(object_list)
 
     if rank == src:
-        obj_sizes = []
-        for obj in object_list:
-            obj_tensor, obj_size = convert_object_to_tensor(obj)
-            obj_tensors.append(obj_tensor)
-            obj_sizes.append(obj_size)
-        obj_size_tensor = paddle.stack(obj_sizes)
+        obj_datas = [pack_object(obj) for obj in object_list]
+        obj_size_tensor = paddle.to_tensor(
+            [data.size for data in obj_datas], dtype="int64"
+        )
     else:
         obj_size_tensor = paddle.empty([obj_nums], dtype="int64")
     broadcast(obj_size_tensor, src, group)
+    # NOTE: fetch all sizes at once instead of syncing once per object
+    obj_sizes = obj_size_tensor.numpy().tolist()
 
     if rank == src:
-        # cast to uint8 to keep the same dtype
-        obj_data_tensor = paddle.concat(obj_tensors).cast("uint8")
+        obj_data_tensor = paddle.to_tensor(np.concatenate(obj_datas))
     else:
-        data_len = paddle.sum(obj_size_tensor).item()
-        obj_data_tensor = paddle.empty([data_len], dtype="uint8")
+        obj_data_tensor = paddle.empty([sum(obj_sizes)], dtype="uint8")
     broadcast(obj_data_tensor, src, group)
 
+    obj_data = obj_data_tensor.numpy()
     offset = 0
-    for i in range(obj_nums):
-        data_len = obj_size_tensor[i]
-        object_list[i] = convert_tensor_to_object(
-            obj_data_tensor[offset : offset + data_len], data_len
-        )
+    for i, data_len in enumerate(obj_sizes):
+        object_list[i] = unpack_object(obj_data[offset : offset + data_len])
         offset += data_len
@@ -12,23 +12,77 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import io
 import pickle
+import struct
 
 import numpy as np
 
 import paddle
 
+# NOTE: An object is packed as a length-prefixed frame:
+#   [num_buffers, pickle_size, buffer_size * num_buffers] (uint64 each)
+#   pickle data
+#   out-of-band buffers, each starting at a multiple of _BUFFER_ALIGNMENT
+# so that numpy payloads are copied into the frame once and unpickled as
+# views of the received data instead of being copied into the pickle stream.
+_FRAME_HEADER = struct.Struct('<QQ')
+_BUFFER_ALIGNMENT = 64
+
+
+def _align(size):
+    return -(-size // _BUFFER_ALIGNMENT) * _BUFFER_ALIGNMENT
+
+
+def pack_object(obj):
+    """Pickle the object with protocol 5 into a uint8 numpy array."""
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    views = [buffer.raw() for buffer in buffers]
+    header = _FRAME_HEADER.pack(len(views), len(data)) + struct.pack(
+        f'<{len(views)}Q', *(view.nbytes for view in views)
+    )
+    offset = len(header) + len(data)
+    offsets = []
+    for view in views:
+        offset = _align(offset)
+        offsets.append(offset)
+        offset += view.nbytes
+
+    frame = np.zeros([offset], dtype=np.uint8)
+    frame[: len(header)] = np.frombuffer(header, dtype=np.uint8)
+    frame[len(header) : len(header) + len(data)] = np.frombuffer(
+        data, dtype=np.uint8
+    )
+    for view, offset in zip(views, offsets):
+        frame[offset : offset + view.nbytes] = np.frombuffer(
+            view, dtype=np.uint8
+        )
+    return frame
+
+
+def unpack_object(frame):
+    """Load the object from a uint8 numpy array made by ``pack_object``."""
+    frame = memoryview(np.ascontiguousarray(frame, dtype=np.uint8))
+    num_buffers, data_size = _FRAME_HEADER.unpack_from(frame)
+    buffer_sizes = struct.unpack_from(
+        f'<{num_buffers}Q', frame, _FRAME_HEADER.size
+    )
+    offset = _FRAME_HEADER.size + 8 * num_buffers
+    data = frame[offset : offset + data_size]
+    offset += data_size
+    buffers = []
+    for size in buffer_sizes:
+        offset = _align(offset)
+        buffers.append(frame[offset : offset + size])
+        offset += size
+    return pickle.loads(data, buffers=buffers)
+
 
 def convert_object_to_tensor(obj):
-    _pickler = pickle.Pickler
-    f = io.BytesIO()
-    _pickler(f).dump(obj)
-    data = np.frombuffer(f.getvalue(), dtype=np.uint8)
+    data = pack_object(obj)
     tensor = paddle.to_tensor(data)
     return tensor, tensor.numel()
 
 
 def convert_tensor_to_object(tensor, len_of_tensor):
-    _unpickler = pickle.Unpickler
-    return _unpickler(io.BytesIO(tensor.numpy()[:len_of_tensor])).load()
+    return unpack_object(tensor.numpy()[:len_of_tensor])
@@ -765,7 +765,9 @@ class DygraphShardingOptimizerV2:
         group_idx = 0
         for color, params in color_dict.items():
             logger.info(f"Tensor Fusion Color {color}: ")
-            var_groups = assign_group_by_size(params, group_size)
+            var_groups = assign_group_by_size(
+                params, group_size, comm_group, self.comm_overlap
+            )
             for _, parameters in var_groups.items():
                 buffer = FusedCommBuffer(
                     group_idx,
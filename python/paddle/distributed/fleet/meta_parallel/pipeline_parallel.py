@@ -506,7 +506,10 @@ class PipelineParallel(MetaParallelBase):
                 if act == HOOK_ACTION.REDUCE:
                     # parse the relative dst rank to absolute dst rank for sharding
                     dst = comm_group.ranks[dst]
-                var_groups = assign_group_by_size(parameter_list, group_size)
+                # NOTE: the buffers are only used by the overlap hooks
+                var_groups = assign_group_by_size(
+                    parameter_list, group_size, comm_group, comm_overlap=True
+                )
 
                 for group_idx, parameters in var_groups.items():
                     buffer = FusedCommBuffer(
@@ -27,6 +27,7 @@ from paddle.distributed import collective
 from paddle.framework import core
 from paddle.nn import ClipGradByGlobalNorm
 
+from ...utils.offload_helper import get_offload_engine
 from .group_sharded_storage import GradStorage
 from .group_sharded_utils import GroupShardedClipGrad, Type, device_guard
 
@@ -1188,7 +1189,8 @@ def _OptimizerWrapper(optimizer, offload, group, update_params_slice):
 def _device2cpu(trans_param, convert_dtype=False):
     if convert_dtype:
         trans_param = paddle.cast(trans_param, Type.fp32.value)
-    tmp_p = trans_param.cpu()
+    # NOTE: copy on a side stream without blocking the computation stream
+    tmp_p = get_offload_engine().to_host(trans_param)
     trans_param._clear_data()
     return tmp_p
 
@@ -1197,7 +1199,7 @@ def _cpu2device(param):
     if DEV in paddle.device.get_all_custom_device_type():
         tmp_p = param.fw_storage._copy_to(paddle.CustomPlace(DEV, DEV_ID), True)
     else:
-        tmp_p = param.fw_storage.cuda(DEV_ID)
+        tmp_p = get_offload_engine().to_device(param.fw_storage)
     if (
         tmp_p.dtype == Type.fp32.value
         and param2dtype[param.name] == Type.fp16.value
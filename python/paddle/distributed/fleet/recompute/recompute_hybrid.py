@@ -22,6 +22,7 @@ from paddle.framework import core
 
 from ..meta_parallel.parallel_layers.random import get_rng_state_tracker
 from ..meta_parallel.pp_utils import utils
+from ..utils.offload_helper import get_offload_engine
 from .recompute import (
     check_recompute_necessary,
     detach_variable,
@@ -151,13 +152,7 @@ class _HPRecomputeFunction(PyLayer):
                 state = arg.stop_gradient
                 if partition:
                     ctx.tensor_shapes.append(arg.shape)
-                    partition = _split_activation(
-                        arg.detach(), mp_group
-                    ).clone()
-                    # TODO(shenliang03) not use calculate stream to D2H to speed
-                    arg = partition.cpu() if offload else partition
-                else:
-                    arg = arg.cpu() if offload else arg
+                    arg = _split_activation(arg.detach(), mp_group).clone()
                 arg.stop_gradient = state
                 tensor_inputs.append(arg)
                 ctx.tensor_indices.append(i)
@@ -177,6 +172,10 @@ class _HPRecomputeFunction(PyLayer):
             else:
                 ctx.inputs.append(arg)
 
+        if offload:
+            # NOTE: copy to host on a side stream to overlap with computation
+            ctx.offload_group = get_offload_engine().offload(tensor_inputs)
+            tensor_inputs = []
         ctx.save_for_backward(*tensor_inputs)
 
         if paddle.is_tensor(outputs):
@@ -193,9 +192,12 @@ class _HPRecomputeFunction(PyLayer):
             inputs = list(ctx.inputs)
             tensor_indices = ctx.tensor_indices
             tensor_shapes = ctx.tensor_shapes
-            tensors = list(ctx.saved_tensor())
+            if ctx.offload:
+                tensors = get_offload_engine().load(ctx.offload_group)
+                ctx.offload_group = None
+            else:
+                tensors = list(ctx.saved_tensor())
 
-            device_id = paddle.distributed.ParallelEnv().device_id
             for i, idx in enumerate(tensor_indices):
                 if ctx.partition:
                     state = tensors[i].stop_gradient
@@ -205,9 +207,7 @@ class _HPRecomputeFunction(PyLayer):
                         .reshape_(tensor_shapes[i])
                     )
                     tensors[i].stop_gradient = state
-                inputs[idx] = (
-                    tensors[i].cuda(device_id) if ctx.offload else tensors[i]
-                )
+                inputs[idx] = tensors[i]
 
             tracer = framework._dygraph_tracer()
             tracer._has_grad = True
@@ -18,13 +18,14 @@ from __future__ import annotations
 
 import abc
 import functools
-import multiprocessing
 import os
 import re
 import shutil
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Callable, Literal, TypedDict, TypeVar
+from urllib.parse import urlsplit
 
 # (TODO: GhostScreaming) It will be removed later.
 from paddle.base import core
@@ -521,6 +522,9 @@ class HDFSClient(FS):
 
         self._time_out = time_out
         self._sleep_inter = sleep_inter
+        # NOTE: each hadoop command starts a JVM, so batched operations pass
+        # many paths to one command, bounded to keep the command line short
+        self._max_paths_per_cmd = 256
         self._base_cmd = " ".join(self.pre_commands)
         self._bd_err_re = re.compile(
             r'\s?responseErrorMsg\s?\:.*, errorCode\:\s?[0-9]+, path\:'
@@ -534,7 +538,7 @@ class HDFSClient(FS):
         for x in range(retry_times + 1):
             ret, output = core.shell_execute_cmd(exe_cmd, 0, 0, redirect_stderr)
             ret = int(ret)
-            if ret == 0:
+            if ret == 0 or x == retry_times:
                 break
             time.sleep(retry_sleep_second)
         if ret == 134:
@@ -670,6 +674,172 @@ class HDFSClient(FS):
 
         return None
 
+    @staticmethod
+    def _normalize_path(fs_path):
+        # NOTE: hadoop may print the path with or without scheme and authority
+        path = urlsplit(fs_path).path if "://" in fs_path else fs_path
+        if path.startswith("hdfs:") or path.startswith("afs:"):
+            path = path.split(":", 1)[1]
+        return os.path.normpath(path) if path else path
+
+    def _path_batches(self, fs_paths):
+        for i in range(0, len(fs_paths), self._max_paths_per_cmd):
+            yield fs_paths[i : i + self._max_paths_per_cmd]
+
+    def _run_ls_cmd(self, cmd):
+        # NOTE: `ls` fails if any path doesn't exist, which is expected here,
+        # so only retry when it failed without listing anything
+        ret, lines = self._run_cmd(cmd, redirect_stderr=True, retry_times=0)
+        if ret != 0 and (
+            self._test_match(lines)
+            or not any(
+                len(l.split()) == 8 or "No such file or directory" in l
+                for l in lines
+            )
+        ):
+            print('raise exception: ')
+            print('\n'.join(lines))
+            raise ExecuteError(cmd)
+        return lines
+
+    @_handle_errors()
+    def _stat(self, fs_paths):
+        """
+        Stat the paths with one hadoop command per batch of paths.
+
+        Returns:
+            dict: Map each existing path to whether it's a directory, paths
+            that don't exist are not in the dict.
+        """
+        normalized = [self._normalize_path(p) for p in fs_paths]
+        stats = {}
+        for paths in self._path_batches(list(dict.fromkeys(fs_paths))):
+            cmd = "ls -d " + " ".join(paths)
+            lines = self._run_ls_cmd(cmd)
+
+            for line in lines:
+                arr = line.split()
+                if len(arr) != 8:
+                    continue
+                stats[self._normalize_path(arr[7])] = arr[0][0] == 'd'
+
+        return {p: stats[n] for p, n in zip(fs_paths, normalized) if n in stats}
+
+    def is_exist_batch(self, fs_paths: list[str]) -> list[bool]:
+        """
+        Whether the remote HDFS paths exist, it costs one hadoop command for
+        many paths instead of one for each path.
+
+        Args:
+            fs_paths(list[str]): The HDFS paths.
+
+        Returns:
+            list[bool]: Whether each path exists.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> # doctest: +REQUIRES(env:DISTRIBUTED)
+                >>> from paddle.distributed.fleet.utils import HDFSClient
+
+                >>> hadoop_home = "/home/client/hadoop-client/hadoop/"
+                >>> configs = {
+                ...     "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                ...     "hadoop.job.ugi": "hello,hello123"
+                ... }
+
+                >>> client = HDFSClient(hadoop_home, configs)
+                >>> ret = client.is_exist_batch(["hdfs:/test_a", "hdfs:/test_b"])
+
+        """
+        stats = self._stat(fs_paths)
+        return [p in stats for p in fs_paths]
+
+    def is_dir_batch(self, fs_paths: list[str]) -> list[bool]:
+        """
+        Whether the remote HDFS paths are directories, it costs one hadoop
+        command for many paths instead of two for each path.
+
+        Args:
+            fs_paths(list[str]): The HDFS paths.
+
+        Returns:
+            list[bool]: Whether each path exists and it's a directory.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> # doctest: +REQUIRES(env:DISTRIBUTED)
+                >>> from paddle.distributed.fleet.utils import HDFSClient
+
+                >>> hadoop_home = "/home/client/hadoop-client/hadoop/"
+                >>> configs = {
+                ...     "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                ...     "hadoop.job.ugi": "hello,hello123"
+                ... }
+
+                >>> client = HDFSClient(hadoop_home, configs)
+                >>> ret = client.is_dir_batch(["hdfs:/test_a", "hdfs:/test_b"])
+
+        """
+        stats = self._stat(fs_paths)
+        return [stats.get(p, False) for p in fs_paths]
+
+    @_handle_errors()
+    def ls_dir_batch(
+        self, fs_paths: list[str]
+    ) -> list[tuple[list[str], list[str]]]:
+        """
+        List the directories and files under each remote HDFS directory, it
+        costs one hadoop command for many directories.
+
+        Args:
+            fs_paths(list[str]): The HDFS directory paths.
+
+        Returns:
+            list[tuple]: The subdirectories and files of each path, it's
+            ([], []) if the path isn't a directory or doesn't exist.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> # doctest: +REQUIRES(env:DISTRIBUTED)
+                >>> from paddle.distributed.fleet.utils import HDFSClient
+
+                >>> hadoop_home = "/home/client/hadoop-client/hadoop/"
+                >>> configs = {
+                ...     "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                ...     "hadoop.job.ugi": "hello,hello123"
+                ... }
+
+                >>> client = HDFSClient(hadoop_home, configs)
+                >>> subdirs = client.ls_dir_batch(["hdfs:/test_a", "hdfs:/test_b"])
+
+        """
+        index = {self._normalize_path(p): ([], []) for p in fs_paths}
+        for paths in self._path_batches(fs_paths):
+            cmd = "ls " + " ".join(paths)
+            lines = self._run_ls_cmd(cmd)
+
+            for line in lines:
+                arr = line.split()
+                if len(arr) != 8:
+                    continue
+                path = self._normalize_path(arr[7])
+                result = index.get(os.path.dirname(path))
+                if result is None:
+                    continue
+                dirs, files = result
+                if arr[0][0] == 'd':
+                    dirs.append(os.path.basename(path))
+                else:
+                    files.append(os.path.basename(path))
+
+        return [index[self._normalize_path(p)] for p in fs_paths]
+
     @_handle_errors()
     def is_dir(self, fs_path: str) -> bool:
         """
@@ -698,10 +868,7 @@ class HDFSClient(FS):
                 >>> ret = client.is_file("hdfs:/test_hdfs_client")
 
         """
-        if not self.is_exist(fs_path):
-            return False
-
-        return self._is_dir(fs_path)
+        return self._stat([fs_path]).get(fs_path, False)
 
     def _is_dir(self, fs_path):
         cmd = f"test -d {fs_path}"
@@ -778,12 +945,7 @@ class HDFSClient(FS):
                 >>> ret = client.is_exist("hdfs:/test_hdfs_client")
 
         """
-        cmd = f"test -e {fs_path} "
-        ret, out = self._run_cmd(cmd, redirect_stderr=True, retry_times=1)
-        if ret != 0:
-            return False
-
-        return True
+        return fs_path in self._stat([fs_path])
 
     def upload_dir(
         self, local_dir: str, dest_dir: str, overwrite: bool = False
@@ -841,10 +1003,6 @@ class HDFSClient(FS):
 
         """
 
-        def __subprocess_upload(hdfs_path_single, datas):
-            for data in datas:
-                self._try_upload(data, hdfs_path_single)
-
         def get_local_files(path):
             """
             get local files
@@ -879,18 +1037,20 @@ class HDFSClient(FS):
             self.delete(fs_path)
             self.mkdirs(fs_path)
 
-        procs = []
-        for i in range(multi_processes):
-            process_datas = self._split_files(all_files, i, multi_processes)
-            p = multiprocessing.Process(
-                target=__subprocess_upload, args=(fs_path, process_datas)
-            )
-            procs.append(p)
-            p.start()
+        self._run_in_pool(
+            self._try_upload,
+            [(f, fs_path) for f in all_files],
+            multi_processes,
+        )
 
-        # complete the processes
-        for proc in procs:
-            proc.join()
+    def _run_in_pool(self, func, args_list, num_workers):
+        # NOTE: the work is done by hadoop commands in child processes, so a
+        # bounded pool of threads is enough to run them concurrently
+        num_workers = max(1, min(num_workers, len(args_list)))
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            futures = [pool.submit(func, *args) for args in args_list]
+            for future in futures:
+                future.result()
 
     @_handle_errors()
     def _try_upload(self, local_path, fs_path):
@@ -939,37 +1099,21 @@ class HDFSClient(FS):
 
         """
 
-        def __subprocess_download(local_path, datas):
-            """
-            download file from HDFS
-            Args:
-                local_path(str): the local file path
-                datas(str): the hdfs file path list
-            """
-            for data in datas:
-                self._try_download(data, local_path)
-
-        if not self.is_exist(fs_path):
+        stats = self._stat([fs_path])
+        if fs_path not in stats:
             raise FSFileNotExistsError(f"{fs_path} not exits")
         # download file
-        if self.is_file(fs_path):
+        if not stats[fs_path]:
             return self._try_download(fs_path, local_path)
         # download dir
-        dirs, all_filenames = self.ls_dir(fs_path)
+        dirs, all_filenames = self.ls_dir_batch([fs_path])[0]
         all_files = [fs_path + "/" + i for i in all_filenames]
         all_files.extend([fs_path + "/" + i for i in dirs])
-        procs = []
-        for i in range(multi_processes):
-            process_datas = self._split_files(all_files, i, multi_processes)
-            p = multiprocessing.Process(
-                target=__subprocess_download, args=(local_path, process_datas)
-            )
-            procs.append(p)
-            p.start()
-
-        # complete the processes
-        for proc in procs:
-            proc.join()
+        self._run_in_pool(
+            self._try_download,
+            [(f, local_path) for f in all_files],
+            multi_processes,
+        )
 
     @_handle_errors()
     def _try_download(self, fs_path, local_path):
@@ -1063,14 +1207,18 @@ class HDFSClient(FS):
                 >>> client.mv("hdfs:/test_hdfs_client", "hdfs:/test_hdfs_client2")
 
         """
-        if overwrite and self.is_exist(fs_dst_path):
-            self.delete(fs_dst_path)
+        if not overwrite and not test_exists:
+            return self._try_mv(fs_src_path, fs_dst_path)
+
+        stats = self._stat([fs_src_path, fs_dst_path])
+        if overwrite and fs_dst_path in stats:
+            self._delete(fs_dst_path, stats.pop(fs_dst_path))
 
         if test_exists:
-            if not self.is_exist(fs_src_path):
+            if fs_src_path not in stats:
                 raise FSFileNotExistsError(f"{fs_src_path} is not exists")
 
-            if self.is_exist(fs_dst_path):
+            if fs_dst_path in stats:
                 raise FSFileExistsError(f"{fs_dst_path} exists already")
 
         return self._try_mv(fs_src_path, fs_dst_path)
@@ -1084,7 +1232,7 @@ class HDFSClient(FS):
             if ret != 0:
                 raise ExecuteError(cmd)
         except Exception as e:
-            if not self.is_exist(fs_src_path) and self.is_exist(fs_dst_path):
+            if self.is_exist_batch([fs_src_path, fs_dst_path]) == [False, True]:
                 return
             raise e
 
@@ -1125,10 +1273,13 @@ class HDFSClient(FS):
                 >>> client.delete("hdfs:/test_hdfs_client")
 
         """
-        if not self.is_exist(fs_path):
+        stats = self._stat([fs_path])
+        if fs_path not in stats:
             return
 
-        is_dir = self._is_dir(fs_path)
+        return self._delete(fs_path, stats[fs_path])
+
+    def _delete(self, fs_path, is_dir):
         if is_dir:
             return self._rmr(fs_path)
 
@@ -0,0 +1,274 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import weakref
+from collections import OrderedDict, defaultdict, deque
+
+import paddle
+from paddle.base.framework import _dygraph_place_guard
+from paddle.framework import _current_expected_place_, core
+
+
+class PinnedMemoryPool:
+    """
+    Pinned host buffers reused by shape and dtype, so that offloading the
+    same activations every step does not allocate pinned memory again.
+
+    Args:
+        max_bytes(int): The max bytes of the free buffers kept in the pool,
+            the least recently released ones are freed beyond it.
+    """
+
+    def __init__(self, max_bytes=4 * 1024**3):
+        self._max_bytes = max_bytes
+        self._free = defaultdict(list)
+        # free buffers from the least recently released, id -> (key, nbytes)
+        self._lru = OrderedDict()
+        self._free_bytes = 0
+
+    @staticmethod
+    def _nbytes(tensor):
+        return math.prod(tensor.shape) * core.size_of_dtype(tensor.dtype)
+
+    def copy_from(self, tensor):
+        buffers = self._free[(tuple(tensor.shape), tensor.dtype)]
+        if buffers:
+            host = buffers.pop()
+            _, nbytes = self._lru.pop(id(host))
+            self._free_bytes -= nbytes
+            host.copy_(tensor, False)
+            return host
+        return tensor._copy_to(core.CUDAPinnedPlace(), False)
+
+    def release(self, host):
+        """
+        Put the buffer back for reuse.
+
+        Returns:
+            list[Tensor]: The buffers evicted from the pool.
+        """
+        key = (tuple(host.shape), host.dtype)
+        nbytes = self._nbytes(host)
+        self._free[key].append(host)
+        self._lru[id(host)] = (key, nbytes)
+        self._free_bytes += nbytes
+        evicted = []
+        while self._free_bytes > self._max_bytes:
+            host_id, (key, nbytes) = self._lru.popitem(last=False)
+            buffers = self._free[key]
+            evicted.append(
+                buffers.pop(
+                    next(i for i, b in enumerate(buffers) if id(b) == host_id)
+                )
+            )
+            if not buffers:
+                del self._free[key]
+            self._free_bytes -= nbytes
+        return evicted
+
+    def clear(self):
+        self._free.clear()
+        self._lru.clear()
+        self._free_bytes = 0
+
+
+class OffloadGroup:
+    """
+    Tensors offloaded together by OffloadEngine.offload, which are loaded
+    back together by OffloadEngine.load.
+    """
+
+    def __init__(self, hosts, stop_gradients):
+        self.hosts = hosts
+        self.stop_gradients = stop_gradients
+        self.loaded = None
+        self.event = None
+
+
+class OffloadEngine:
+    """
+    Offload device tensors to pinned host memory and load them back. All the
+    copies run in order on a side stream so that they overlap with the
+    computation, and loading a group prefetches the group offloaded before
+    it, which is the next one needed when the groups are loaded in reverse
+    order as in backward.
+
+    Args:
+        max_inflight(int): The max number of offloaded groups whose copies
+            are still running, the device tensors are kept alive until their
+            copies finish, so this bounds the extra device memory.
+        max_pinned_bytes(int): The max bytes of the free pinned buffers kept
+            for reuse.
+    """
+
+    def __init__(self, max_inflight=2, max_pinned_bytes=4 * 1024**3):
+        self._max_inflight = max_inflight
+        self._async = paddle.is_compiled_with_cuda()
+        self._pool = PinnedMemoryPool(max_pinned_bytes)
+        self._place = None
+        self._stream = None
+        self._inflight = deque()
+        self._groups = []
+
+    def _copy_stream(self):
+        if self._stream is None:
+            self._place = core.CUDAPlace(
+                paddle.distributed.ParallelEnv().device_id
+            )
+            self._stream = paddle.device.Stream(self._place)
+        # the copies must wait for the computation issued before them
+        self._stream.wait_stream(paddle.device.current_stream(self._place))
+        return self._stream
+
+    def _empty_like(self, host):
+        # NOTE: allocate on the compute stream which uses the tensor, so the
+        # memory is released safely after being used there
+        with _dygraph_place_guard(self._place):
+            return paddle.empty(host.shape, host.dtype)
+
+    def _wait_inflight(self):
+        while self._inflight and (
+            len(self._inflight) > self._max_inflight
+            or self._inflight[0][0].query()
+        ):
+            event, _ = self._inflight.popleft()
+            event.synchronize()
+
+    def offload(self, tensors):
+        """
+        Start copying the tensors to host.
+
+        Returns:
+            OffloadGroup: The handle to load the tensors back with.
+        """
+        stop_gradients = [t.stop_gradient for t in tensors]
+        if not self._async:
+            return OffloadGroup([t.cpu() for t in tensors], stop_gradients)
+
+        stream = self._copy_stream()
+        with paddle.device.stream_guard(stream):
+            hosts = [self._pool.copy_from(t) for t in tensors]
+        # NOTE: keep the device tensors alive until they are copied, since
+        # their memory may be reused by the computation once released
+        self._inflight.append((stream.record_event(), tensors))
+        self._wait_inflight()
+
+        group = OffloadGroup(hosts, stop_gradients)
+        self._groups = [g for g in self._groups if g() is not None]
+        self._groups.append(weakref.ref(group))
+        return group
+
+    def _start_load(self, group):
+        stream = self._copy_stream()
+        outs = [self._empty_like(host) for host in group.hosts]
+        with paddle.device.stream_guard(stream):
+            for out, host in zip(outs, group.hosts):
+                out.copy_(host, False)
+        group.event = stream.record_event()
+        # the later copies into these buffers run after this one on the same
+        # stream, so they can be reused right away
+        evicted = []
+        for host in group.hosts:
+            evicted.extend(self._pool.release(host))
+        # NOTE: the buffers evicted from the pool are kept alive until the
+        # copies from them finish, as the device tensors being offloaded
+        if evicted:
+            self._inflight.append((group.event, evicted))
+        group.hosts = None
+        group.loaded = outs
+
+    def load(self, group):
+        """
+        Load the tensors of the group back to the current device.
+
+        Returns:
+            list[Tensor]: The tensors, in the order they were offloaded.
+        """
+        if not self._async:
+            place = _current_expected_place_()
+            tensors = [host._copy_to(place, True) for host in group.hosts]
+        else:
+            if group.loaded is None:
+                self._start_load(group)
+            groups = [g() for g in self._groups]
+            if group in groups:
+                idx = groups.index(group)
+                self._groups.pop(idx)
+                # prefetch the group needed next in backward
+                for prev in reversed(groups[:idx]):
+                    if prev is not None:
+                        if prev.loaded is None:
+                            self._start_load(prev)
+                        break
+            paddle.device.current_stream(self._place).wait_event(group.event)
+            tensors = group.loaded
+            group.loaded = None
+
+        for tensor, stop_gradient in zip(tensors, group.stop_gradients):
+            tensor.stop_gradient = stop_gradient
+        return tensors
+
+    def reset(self):
+        """
+        Wait for the running copies and free the pinned buffers kept for
+        reuse, the groups offloaded before are not prefetched after this.
+        """
+        while self._inflight:
+            event, _ = self._inflight.popleft()
+            event.synchronize()
+        if self._stream is not None:
+            self._stream.synchronize()
+        self._groups = []
+        self._pool.clear()
+
+    def to_host(self, tensor):
+        """
+        Copy the tensor to host on the side stream and wait for the copy, the
+        computation stream is not blocked.
+        """
+        if not self._async:
+            return tensor.cpu()
+        stream = self._copy_stream()
+        # NOTE: copy to CPUPlace rather than pinned memory, since the result
+        # is computed by CPU kernels and pinned tensors use the GPU backend
+        with paddle.device.stream_guard(stream):
+            host = tensor._copy_to(core.CPUPlace(), False)
+        stream.record_event().synchronize()
+        return host
+
+    def to_device(self, tensor):
+        """
+        Copy the host tensor to the current device on the side stream, the
+        computation after this waits for the copy without blocking the host.
+        """
+        if not self._async:
+            return tensor._copy_to(_current_expected_place_(), True)
+        stream = self._copy_stream()
+        out = self._empty_like(tensor)
+        with paddle.device.stream_guard(stream):
+            out.copy_(tensor, False)
+        current_stream = paddle.device.current_stream(self._place)
+        current_stream.wait_event(stream.record_event())
+        return out
+
+
+__offload_engine__ = None
+
+
+def get_offload_engine():
+    global __offload_engine__
+    if __offload_engine__ is None:
+        __offload_engine__ = OffloadEngine()
+    return __offload_engine__
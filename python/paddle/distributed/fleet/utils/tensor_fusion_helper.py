@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import itertools
+import json
 import os
+import time
 import weakref
 from collections import OrderedDict
 from distutils.util import strtobool
@@ -73,7 +76,195 @@ def get_current_device_type():
     return __current_device_type__
 
 
-def assign_group_by_size(parameters, group_size=128 * 1024 * 1024):
+class GradBucketPlanner:
+    """
+    Plan the buckets of FusedCommBuffer from the order in which gradients get
+    ready in backward and an alpha-beta model of the communication of each
+    comm group. The order is recorded in the first step and saved to
+    ``plan_dir``, so that the buckets are planned from it when the buffers are
+    built in later runs, the buffers keep their layout until then.
+
+    The layout of the planned buffers is saved with the plan too, since the
+    sharded checkpoints depend on it, planning a different layout for the
+    same parameters later, e.g. after the parameters changed, raises an error
+    instead of breaking the resuming from these checkpoints.
+    """
+
+    # the largest fraction of a bucket's communication time spent on latency
+    max_latency_ratio = 0.1
+    min_bucket_size = 1024 * 1024
+    probe_sizes = [2**20, 2**22, 2**24, 2**26]
+
+    def __init__(self, plan_dir):
+        self._plan_dir = plan_dir
+        self._path = os.path.join(
+            plan_dir,
+            f"bucket_plan.rank{paddle.distributed.get_rank()}.json",
+        )
+        self._ready_order = {}
+        # alpha and beta of each comm group, keyed by its ranks
+        self._models = {}
+        # hash of the planned layout, keyed by the hash of parameter names
+        self._layouts = {}
+        self._planned = set()
+        self._recording = True
+        if os.path.exists(self._path):
+            with open(self._path) as f:
+                plan = json.load(f)
+            self._ready_order = plan["ready_order"]
+            self._models = plan["models"]
+            self._layouts = plan["layouts"]
+            self._recording = False
+
+    def record_ready(self, param):
+        if not self._recording or param.name in self._ready_order:
+            return
+        self._ready_order[param.name] = len(self._ready_order)
+        if self._planned and self._planned.issubset(self._ready_order):
+            self._save()
+
+    def _save(self):
+        self._recording = False
+        os.makedirs(self._plan_dir, exist_ok=True)
+        plan = {
+            "ready_order": self._ready_order,
+            "models": self._models,
+            "layouts": self._layouts,
+        }
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(plan, f)
+        os.replace(tmp_path, self._path)
+        logger.info(f"Save the plan of tensor fusion buckets to {self._path}")
+
+    def _measure(self, comm_group):
+        times = []
+        for size in self.probe_sizes:
+            x = paddle.zeros([size // 4], dtype="float32")
+            # warm up
+            paddle.distributed.all_reduce(x, group=comm_group)
+            paddle.device.synchronize()
+            start = time.perf_counter()
+            for _ in range(3):
+                paddle.distributed.all_reduce(x, group=comm_group)
+            paddle.device.synchronize()
+            times.append((time.perf_counter() - start) / 3)
+        times = paddle.to_tensor(times, dtype="float64")
+        paddle.distributed.all_reduce(
+            times, op=paddle.distributed.ReduceOp.MAX, group=comm_group
+        )
+        beta, alpha = np.polyfit(self.probe_sizes, times.numpy(), 1)
+        return [max(float(alpha), 0.0), max(float(beta), 1e-15)]
+
+    def _bucket_size(self, group_size, model):
+        if model is None:
+            return group_size
+        # the smallest bucket whose latency is at most max_latency_ratio of
+        # its communication time, smaller buckets start communication earlier
+        alpha, beta = model
+        ratio = self.max_latency_ratio
+        size = alpha * (1 - ratio) / (beta * ratio)
+        return int(min(max(size, self.min_bucket_size), group_size))
+
+    @staticmethod
+    def _hash(obj):
+        return hashlib.md5(json.dumps(obj).encode()).hexdigest()
+
+    def plan(self, parameters, group_size, comm_group=None):
+        """
+        Sort the parameters by the order their gradients get ready and choose
+        the bucket size. The parameters and the bucket size are returned as
+        they are if the ready order of the parameters is not recorded yet.
+
+        Returns:
+            tuple: The sorted parameters and the bucket size in bytes.
+        """
+        names = [p.name for p in parameters]
+        self._planned.update(names)
+        if not self._recording and not self._planned.issubset(
+            self._ready_order
+        ):
+            # the parameters changed since the plan was saved, record again
+            # unless the buffers are already built with a planned layout
+            if self._layouts:
+                raise RuntimeError(
+                    f"The parameters changed since the plan of tensor fusion "
+                    f"buckets was saved to {self._path}, which would change "
+                    f"the layout of the buffers in sharded checkpoints. "
+                    f"Please remove it to plan again."
+                )
+            self._ready_order = {}
+            self._recording = True
+
+        ready = [self._ready_order.get(name) for name in names]
+        group_key = (
+            ",".join(str(rank) for rank in comm_group.ranks)
+            if comm_group is not None
+            else ""
+        )
+        model = self._models.get(group_key)
+        if comm_group is not None and comm_group.nranks > 1:
+            # NOTE: every rank of the group must build the same buckets, so
+            # all ranks follow the plan of the first rank in the group
+            plan = [ready, model]
+            paddle.distributed.broadcast_object_list(
+                plan, src=comm_group.ranks[0], group=comm_group
+            )
+            ready, model = plan
+            if model is None:
+                model = self._measure(comm_group)
+            self._models[group_key] = model
+
+        if any(order is None for order in ready):
+            # NOTE: keep the layout before the plan is recorded, so that the
+            # layout only changes once, when the plan is used in a later run
+            return parameters, group_size
+
+        parameters = [parameters[i] for i in np.argsort(ready, kind="stable")]
+        group_size = self._bucket_size(group_size, model)
+        layout = self._hash([[p.name for p in parameters], group_size])
+        key = self._hash(sorted(names))
+        if key not in self._layouts:
+            self._layouts[key] = layout
+            self._save()
+        elif self._layouts[key] != layout:
+            raise RuntimeError(
+                f"The planned layout of tensor fusion buckets differs from "
+                f"the one saved in {self._path}, which the sharded checkpoints "
+                f"depend on. Please remove it to plan again."
+            )
+        return parameters, group_size
+
+
+__bucket_planner__ = None
+
+
+def get_bucket_planner():
+    """
+    Return the GradBucketPlanner if FLAGS_fused_comm_bucket_plan_dir is set,
+    otherwise None.
+    """
+    global __bucket_planner__
+    if __bucket_planner__ is None:
+        plan_dir = os.getenv("FLAGS_fused_comm_bucket_plan_dir")
+        __bucket_planner__ = GradBucketPlanner(plan_dir) if plan_dir else False
+    return __bucket_planner__ or None
+
+
+def assign_group_by_size(
+    parameters,
+    group_size=128 * 1024 * 1024,
+    comm_group=None,
+    comm_overlap=False,
+):
+    planner = get_bucket_planner()
+    # NOTE: buckets only need a plan when their gradients are communicated by
+    # the backward hooks, i.e. with comm_overlap
+    if planner is not None and comm_overlap and comm_group is not None:
+        parameters, group_size = planner.plan(
+            parameters, group_size, comm_group
+        )
+
     is_sparse_gradient = [False] * len(parameters)
 
     group_indices = core.eager_assign_group_by_size(
@@ -592,6 +783,10 @@ class FusedCommBuffer:
     def add_grad(self, param, use_comm=True):
         assert param.name in self._params_step_dict
 
+        planner = get_bucket_planner()
+        if planner is not None:
+            planner.record_ready(param)
+
         if not self._release_grads or self._params_step_dict[param.name] > 0:
             current_ptr = get_grad_address(param, self.use_main_grad)
             if self._grads_to_addr[param.name] != current_ptr:
@@ -764,7 +959,12 @@ def obtain_storage(
     if len(parameters) < 1:
         return [], []
 
-    var_groups = assign_group_by_size(parameters, group_size=group_size)
+    var_groups = assign_group_by_size(
+        parameters,
+        group_size=group_size,
+        comm_group=comm_group,
+        comm_overlap=comm_overlap,
+    )
     storage = []
     buffers = []
     for group_idx, parameters in var_groups.items():
@@ -160,7 +160,9 @@ class HTTPMaster(Master):
                 time.sleep(0.1)
                 continue
 
-            rjson = self.client.get_prefix(prefix)
+            # NOTE: the server holds the request until all peers arrived, the
+            # put above is retried on timeout in case the server restarted
+            rjson = self.client.get_prefix(prefix, wait=size, timeout=10)
             self.ctx.logger.debug(f"sync peers {rjson}")
             if rjson and len(rjson) == size:
                 if self.ctx.args.sort_ip:
@@ -179,7 +181,7 @@ class HTTPMaster(Master):
                         ret[int(k.split('/')[-1])] = v
                     return ret, rank
             else:
-                time.sleep(0.5)
+                time.sleep(0.1)
         return [], 0
 
 
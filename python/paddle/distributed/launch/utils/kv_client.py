@@ -48,11 +48,17 @@ class KVClient:
         except:
             return ""
 
-    def get_prefix(self, key):
+    def get_prefix(self, key, wait=0, timeout=10):
+        """
+        Get all items whose key starts with key. If wait is set, the server
+        holds the request until there are at least wait items or timeout
+        seconds passed.
+        """
         key = key if key.startswith('/') else f"/{key}"
         u = f"{self.endpoint}{key}"
+        params = {'wait': wait, 'timeout': timeout} if wait > 0 else None
         try:
-            r = httpx.get(u, timeout=None, follow_redirects=True)
+            r = httpx.get(u, params=params, timeout=None, follow_redirects=True)
             if r.status_code == 200:
                 return r.json()
         except:
@@ -12,26 +12,88 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import http.server as SimpleHTTPServer
 import json
 import threading
-from http.server import HTTPServer
+import time
+from http.server import ThreadingHTTPServer
 from multiprocessing import Process
+from urllib.parse import parse_qs, urlsplit
 
 from .topology import SingleNodeTopology
 
 
+class KVStore:
+    """
+    Key-value store with keys kept sorted, so that a prefix lookup only
+    visits the matching keys, and a condition to wait for a prefix to reach
+    an expected number of keys.
+    """
+
+    def __init__(self, kv=None):
+        self.cond = threading.Condition()
+        self.kv = dict(kv or {})
+        self.keys = sorted(self.kv)
+
+    def put(self, key, value):
+        with self.cond:
+            if key not in self.kv:
+                bisect.insort(self.keys, key)
+            self.kv[key] = value
+            self.cond.notify_all()
+
+    def delete(self, key):
+        with self.cond:
+            if key not in self.kv:
+                return False
+            del self.kv[key]
+            del self.keys[bisect.bisect_left(self.keys, key)]
+            self.cond.notify_all()
+            return True
+
+    def _prefix_keys(self, prefix):
+        start = bisect.bisect_left(self.keys, prefix)
+        end = start
+        while end < len(self.keys) and self.keys[end].startswith(prefix):
+            end += 1
+        return self.keys[start:end]
+
+    def get_prefix(self, prefix, wait=0, timeout=0):
+        """
+        Return the items whose key starts with prefix, if wait is set block
+        until there are at least wait of them or timeout seconds passed.
+        """
+        end = time.monotonic() + timeout
+        with self.cond:
+            keys = self._prefix_keys(prefix)
+            while len(keys) < wait:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.cond.wait(remaining)
+                keys = self._prefix_keys(prefix)
+            return {k: self.kv[k] for k in keys}
+
+
 class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
     def do_GET(self):
-        with self.server.kv_lock:
-            ret = {}
-            for k, v in self.server.kv.items():
-                if k.startswith(self.path):
-                    ret[k] = v.decode(encoding="utf-8")
-            if ret:
-                self.output(200, json.dumps(ret).encode("utf-8"))
-            else:
-                self.output(404)
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        try:
+            wait = int(query.get('wait', [0])[0])
+            timeout = min(
+                float(query.get('timeout', [0])[0]), self.server.max_wait
+            )
+        except ValueError:
+            self.output(400)
+            return
+        items = self.server.store.get_prefix(url.path, wait, timeout)
+        if items:
+            ret = {k: v.decode(encoding="utf-8") for k, v in items.items()}
+            self.output(200, json.dumps(ret).encode("utf-8"))
+        else:
+            self.output(404)
 
     def do_PUT(self):
         self.do_POST()
@@ -40,20 +102,16 @@ class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
         content_length = int(self.headers['Content-Length'] or 0)
         try:
             value = self.rfile.read(content_length)
-            with self.server.kv_lock:
-                self.server.kv[self.path] = value
-                self.output(200)
-                return
+            self.server.store.put(self.path, value)
+            self.output(200)
         except:
             self.output(500)
 
     def do_DELETE(self):
-        with self.server.kv_lock:
-            if self.path in self.server.kv:
-                del self.server.kv[self.path]
-                self.output(200)
-            else:
-                self.output(404)
+        if self.server.store.delete(self.path):
+            self.output(200)
+        else:
+            self.output(404)
 
     def output(self, code, value=''):
         self.send_response(code)
@@ -67,11 +125,16 @@ class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
         return
 
 
-class KVServer(HTTPServer):
+class KVServer(ThreadingHTTPServer):
+    # NOTE: all peers connect at about the same time, the default listen
+    # backlog of 5 resets connections when there are many pods
+    request_queue_size = 1024
+    # the longest time in seconds a GET request waits for keys
+    max_wait = 30
+
     def __init__(self, port):
         super().__init__(('', port), KVHandler)
-        self.kv_lock = threading.Lock()
-        self.kv = {'/healthy': b'ok'}
+        self.store = KVStore({'/healthy': b'ok'})
         self.port = port
         self.stopped = False
         self.started = False
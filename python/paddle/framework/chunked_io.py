@@ -0,0 +1,313 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This file contains the chunked checkpoint format used by `paddle.save` and
+# `paddle.async_save` when `use_chunked_format=True`. The layout of a chunked
+# checkpoint file is:
+#
+#   | magic(8 bytes) | header length(8 bytes) | pickled header | padding |
+#   | raw tensor data, each tensor aligned to _CHUNKED_ALIGNMENT bytes ... |
+#
+# The pickled header keeps the saved object with every tensor replaced by a
+# `_TensorIndex`, which records where the raw data of the tensor locates, so
+# a tensor can be read (or memory mapped) alone without unpickling others.
+
+import collections
+import os
+import pickle
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import paddle
+from paddle.base import core
+
+_CHUNKED_MAGIC = b'PDCHUNK1'
+_CHUNKED_PREFIX = struct.Struct('<8sQ')
+# NOTE: data section starts at a page aligned offset, tensors in it start at
+# cache line aligned offsets
+_CHUNKED_DATA_ALIGNMENT = 4096
+_CHUNKED_ALIGNMENT = 64
+# tensors larger than this are split into several write jobs
+_CHUNKED_WRITE_SIZE = 64 << 20
+
+
+def _aligned(nbytes, alignment):
+    return (nbytes + alignment - 1) // alignment * alignment
+
+
+def _default_num_threads():
+    return min(8, os.cpu_count() or 1)
+
+
+class _TensorIndex:
+    """
+    Placeholder of a tensor in the header of chunked checkpoint.
+
+    Args:
+        offset(int): offset of the raw data relative to the data section.
+        shape(tuple): shape of the tensor.
+        dtype(str): numpy dtype string of the raw data.
+        name(str|None): name of the saved Tensor, None if the saved object
+            is a numpy.ndarray or DenseTensor.
+        is_ndarray(bool): whether the saved object is a numpy.ndarray.
+    """
+
+    __slots__ = ('offset', 'shape', 'dtype', 'name', 'is_ndarray')
+
+    def __init__(self, offset, shape, dtype, name, is_ndarray):
+        self.offset = offset
+        self.shape = shape
+        self.dtype = dtype
+        self.name = name
+        self.is_ndarray = is_ndarray
+
+    @property
+    def numel(self):
+        return int(np.prod(self.shape, dtype='int64'))
+
+    @property
+    def nbytes(self):
+        return self.numel * np.dtype(self.dtype).itemsize
+
+    def __getstate__(self):
+        return (self.offset, self.shape, self.dtype, self.name, self.is_ndarray)
+
+    def __setstate__(self, state):
+        (
+            self.offset,
+            self.shape,
+            self.dtype,
+            self.name,
+            self.is_ndarray,
+        ) = state
+
+
+class _ChunkedSaveTask:
+    """
+    Save an object in chunked checkpoint format.
+
+    Constructing the task stages all tensors to host in the calling thread:
+    copies of GPU tensors are issued to pinned memory asynchronously and an
+    event is recorded after each one, so the snapshot is ordered before any
+    later computation on the same stream. Host tensors are copied only if
+    :attr:`snapshot` is True. :code:`run` writes the staged tensors with a
+    thread pool, each write job waits only for the copy of its own tensor,
+    so device to host copies overlap with file writing.
+
+    Args:
+        obj(Object): the object to be saved.
+        path(str): the file path to save the object.
+        protocol(int): pickle protocol used for the header.
+        num_threads(int): number of threads writing tensor data.
+        snapshot(bool): whether to copy host tensors and numpy arrays, so
+            that later in-place updates do not change the saved data before
+            :code:`run` finishes.
+    """
+
+    def __init__(self, obj, path, protocol=4, num_threads=None, snapshot=True):
+        if not isinstance(path, str):
+            raise ValueError(
+                f"chunked format only supports saving objects to file, but got {type(path)}"
+            )
+        if not isinstance(protocol, int) or protocol < 2 or protocol > 4:
+            raise ValueError(
+                f"Expected 1<'protocol'<5, but received protocol={protocol}"
+            )
+        self._path = path
+        self._protocol = protocol
+        self._num_threads = num_threads or _default_num_threads()
+        self._snapshot = snapshot
+        self._staged = []
+        self._nbytes = 0
+        self._skeleton = self._build_skeleton(obj)
+
+    def _stage(self, obj):
+        is_ndarray = isinstance(obj, np.ndarray)
+        name = None
+        event = None
+        if is_ndarray:
+            if self._snapshot:
+                host = np.array(obj, order='C')
+            else:
+                host = np.require(obj, requirements='C')
+        elif isinstance(obj, core.eager.Tensor):
+            name = obj.name
+            if not obj.is_contiguous():
+                obj = obj.contiguous()
+            place = obj.place
+            copy = False
+            if place.is_gpu_place():
+                obj = obj._copy_to(core.CUDAPinnedPlace(), False)
+                event = paddle.device.Event(place)
+                event.record()
+            elif place.is_cpu_place() or place.is_cuda_pinned_place():
+                copy = self._snapshot
+            else:
+                obj = obj.cpu()
+            # NOTE: DenseTensor.__array__ copies host data right away unless
+            # copy is False, the view of the pinned copy must not be read
+            # before the event of the copy is synchronized in _write
+            host = obj.value().get_tensor().__array__(copy=copy)
+        else:
+            # DenseTensor, it is copied if not on cpu
+            host = np.asarray(obj)
+
+        offset = _aligned(self._nbytes, _CHUNKED_ALIGNMENT)
+        index = _TensorIndex(
+            offset, tuple(host.shape), host.dtype.str, name, is_ndarray
+        )
+        self._nbytes = offset + host.nbytes
+        # NOTE: the staged tensor is kept alive until its data is written
+        self._staged.append((index, host, obj, event))
+        return index
+
+    def _build_skeleton(self, obj):
+        if isinstance(obj, (np.ndarray, core.eager.Tensor, core.DenseTensor)):
+            return self._stage(obj)
+        elif type(obj) in (dict, collections.OrderedDict):
+            skeleton = type(obj)()
+            for key, value in obj.items():
+                skeleton[key] = self._build_skeleton(value)
+            return skeleton
+        elif type(obj) in (list, tuple):
+            return type(obj)(self._build_skeleton(value) for value in obj)
+        else:
+            return obj
+
+    def _write(self, job):
+        i, begin, end = job
+        index, host, _, event = self._staged[i]
+        if event is not None:
+            event.synchronize()
+        data = host.reshape(-1).view(np.uint8)
+        with open(self._tmp_path, 'r+b') as f:
+            f.seek(self._data_start + index.offset + begin)
+            f.write(data[begin:end])
+
+    def run(self):
+        header = pickle.dumps(
+            {'version': 1, 'obj': self._skeleton}, protocol=self._protocol
+        )
+        prefix = _CHUNKED_PREFIX.pack(_CHUNKED_MAGIC, len(header))
+        self._data_start = _aligned(
+            len(prefix) + len(header), _CHUNKED_DATA_ALIGNMENT
+        )
+        self._tmp_path = self._path + '.tmp'
+        with open(self._tmp_path, 'wb') as f:
+            f.write(prefix)
+            f.write(header)
+            f.truncate(self._data_start + self._nbytes)
+
+        jobs = []
+        for i, (index, *_) in enumerate(self._staged):
+            for begin in range(0, index.nbytes, _CHUNKED_WRITE_SIZE):
+                jobs.append(
+                    (i, begin, min(begin + _CHUNKED_WRITE_SIZE, index.nbytes))
+                )
+        try:
+            with ThreadPoolExecutor(max_workers=self._num_threads) as pool:
+                # NOTE: consume the results to raise exceptions of jobs
+                list(pool.map(self._write, jobs))
+        finally:
+            self._staged = []
+        # the checkpoint is visible only after all data written
+        os.replace(self._tmp_path, self._path)
+
+
+def _save_chunked(obj, path, protocol=4, num_threads=None):
+    # the data is written before returning, no snapshot is needed
+    _ChunkedSaveTask(obj, path, protocol, num_threads, snapshot=False).run()
+
+
+def _is_chunked_file(path):
+    if not isinstance(path, str) or not os.path.isfile(path):
+        return False
+    with open(path, 'rb') as f:
+        return f.read(len(_CHUNKED_MAGIC)) == _CHUNKED_MAGIC
+
+
+def _read_chunked_header(f):
+    magic, header_len = _CHUNKED_PREFIX.unpack(f.read(_CHUNKED_PREFIX.size))
+    if magic != _CHUNKED_MAGIC:
+        raise ValueError(f"{f.name} is not a chunked checkpoint file.")
+    header = pickle.loads(f.read(header_len))
+    data_start = _aligned(
+        _CHUNKED_PREFIX.size + header_len, _CHUNKED_DATA_ALIGNMENT
+    )
+    return header, data_start
+
+
+def _map_tensor_index(obj, func):
+    if isinstance(obj, _TensorIndex):
+        return func(obj)
+    elif type(obj) in (dict, collections.OrderedDict):
+        for key, value in obj.items():
+            obj[key] = _map_tensor_index(value, func)
+        return obj
+    elif type(obj) in (list, tuple):
+        return type(obj)(_map_tensor_index(value, func) for value in obj)
+    else:
+        return obj
+
+
+def _load_chunked(path, to_tensor, mmap=False, keep_name_table=False):
+    """
+    Load an object saved in chunked format, :attr:`to_tensor` converts a
+    loaded numpy.ndarray and its `_TensorIndex` to the returned object.
+
+    If :attr:`mmap` is True, the file is memory mapped in copy-on-write mode
+    and the arrays passed to :attr:`to_tensor` are views of the mapping, so
+    the data is only read from disk when accessed, and writing to the arrays
+    never modifies the file.
+
+    If :attr:`keep_name_table` is True and the saved object is a dict, the
+    mapping from keys to names of saved Tensors is returned as the item
+    `StructuredToParameterName@@` like the pickle format does.
+    """
+    with open(path, 'rb') as f:
+        header, data_start = _read_chunked_header(f)
+        if mmap:
+            data = np.memmap(f, dtype=np.uint8, mode='c')
+
+        def read(index):
+            if index.numel == 0:
+                arr = np.empty(index.shape, dtype=index.dtype)
+            elif mmap:
+                begin = data_start + index.offset
+                arr = (
+                    data[begin : begin + index.nbytes]
+                    .view(index.dtype)
+                    .reshape(index.shape)
+                )
+            else:
+                f.seek(data_start + index.offset)
+                arr = np.fromfile(
+                    f, dtype=index.dtype, count=index.numel
+                ).reshape(index.shape)
+            return to_tensor(arr, index)
+
+        obj = header['obj']
+        name_table = None
+        if keep_name_table and isinstance(obj, dict):
+            name_table = {
+                key: value.name
+                for key, value in obj.items()
+                if isinstance(value, _TensorIndex) and value.name
+            }
+        obj = _map_tensor_index(obj, read)
+        if name_table is not None:
+            obj["StructuredToParameterName@@"] = name_table
+        return obj
@@ -43,6 +43,12 @@ from paddle.base.framework import (
     in_pir_mode,
 )
 
+from .chunked_io import (
+    _ChunkedSaveTask,
+    _is_chunked_file,
+    _load_chunked,
+    _save_chunked,
+)
 from .io_utils import (
     _is_file_path,
     _is_memory_buffer,
@@ -63,18 +69,22 @@ if TYPE_CHECKING:
     from paddle._typing import NestedStructure
     from paddle.nn.layer.layers import _StateDict
 
-    class _EmptyDict(TypedDict):
-        pass
+    class _AsyncSaveOptions(TypedDict):
+        use_chunked_format: NotRequired[bool]
+        num_threads: NotRequired[int]
 
     class _LoadOptions(TypedDict):
         model_filename: NotRequired[str]
         params_filename: NotRequired[str]
         keep_name_table: NotRequired[bool]
         return_numpy: NotRequired[bool]
+        mmap: NotRequired[bool]
 
     class _SaveOptions(TypedDict):
         use_binary_format: NotRequired[bool]
         pickle_protocol: NotRequired[Literal[2, 3, 4]]
+        use_chunked_format: NotRequired[bool]
+        num_threads: NotRequired[int]
 
 
 __all__ = []
@@ -96,14 +106,15 @@ def async_save(
     path: str | BytesIO,
     protocol: Literal[2, 3, 4] = 4,
     sync_other_task: bool = False,
-    **configs: Unpack[_EmptyDict],
+    **configs: Unpack[_AsyncSaveOptions],
 ) -> None:
     '''
     async version of paddle.save.
     Note:
         currently only support dygraph mode.
     Note:
-        any argument passed through configs will be overridden by default setting.
+        any argument passed through configs except ``use_chunked_format`` and ``num_threads``
+        will be overridden by default setting.
     Args:
         obj(Object) : The object to be saved.
         path(str|BytesIO) : The path/buffer of the object to be saved.
@@ -111,7 +122,12 @@ def async_save(
         protocol(int, optional): The protocol version of pickle module must be greater than 1 and less than 5.
                                  Default: 4
         sync_other_task(bool) : Determine whether to wait other async save task to be finished before this one be put in queue.
-        **configs(dict, optional): compatible argument to paddle.save, but will be overridden by default setting.
+        **configs(dict, optional): compatible argument to paddle.save, the following options are supported:
+          use_chunked_format(bool): If True, save the object in chunked format, tensors are copied to host
+          asynchronously and written by a thread pool while the copies are in flight, see ``paddle.save``.
+          Default: False
+          num_threads(int): The number of threads writing tensor data in chunked format.
+          Default: min(8, os.cpu_count())
     Examples:
         .. code-block:: python
             :name: code-example-1
@@ -131,11 +147,29 @@ def async_save(
         raise ValueError(
             "async_save currently is not supported in static mode."
         )
+    use_chunked_format = configs.pop('use_chunked_format', False)
+    num_threads = configs.pop('num_threads', None)
     if len(configs) > 0:
         warnings.warn(
             "configs are not supported in async mode, will be overridden by default settings."
         )
 
+    if use_chunked_format:
+        if not isinstance(obj, (dict, core.eager.Tensor)):
+            raise TypeError(
+                f"currently async_save does not support this type: {type(obj)}"
+            )
+        # NOTE: device to host copies are issued here so that the saved
+        # tensors are not affected by later computation, the data is written
+        # after each copy finishes in the background
+        task = _ChunkedSaveTask(obj, path, protocol, num_threads)
+        if sync_other_task:
+            clear_async_save_task_queue()
+        t = threading.Thread(target=task.run)
+        t.start()
+        async_save_queue.append(t)
+        return
+
     # TODO: make this part async
     def move_state_dict_to_cpu(sd):
         for k, v in sd.items():
@@ -365,6 +399,7 @@ def _parse_load_config(configs):
         'params_filename',
         'keep_name_table',
         'return_numpy',
+        'mmap',
     ]
 
     # input check
@@ -384,12 +419,18 @@ def _parse_load_config(configs):
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
     inner_config.return_numpy = configs.get('return_numpy', False)
+    inner_config.mmap = configs.get('mmap', False)
 
     return inner_config
 
 
 def _parse_save_config(configs):
-    supported_configs = ['use_binary_format', 'pickle_protocol']
+    supported_configs = [
+        'use_binary_format',
+        'pickle_protocol',
+        'use_chunked_format',
+        'num_threads',
+    ]
 
     # input check
     for key in configs:
@@ -406,6 +447,8 @@ def _parse_save_config(configs):
     inner_config = _SaveLoadConfig()
     inner_config.use_binary_format = configs.get('use_binary_format', False)
     inner_config.pickle_protocol = configs.get('pickle_protocol', None)
+    inner_config.use_chunked_format = configs.get('use_chunked_format', False)
+    inner_config.num_threads = configs.get('num_threads', None)
 
     return inner_config
 
@@ -596,6 +639,26 @@ def _ndarray_to_tensor(obj, return_numpy):
         return _to_LodTensor(obj)
 
 
+def _chunked_array_to_tensor(arr, index, return_numpy, mmap=False):
+    if index.is_ndarray or return_numpy:
+        return arr
+    if mmap and in_dygraph_mode():
+        # NOTE: share the memory mapped data with a cpu Tensor, it is
+        # copied to the place of parameter when calling `set_state_dict`
+        kwargs = {'name': index.name} if index.name else {}
+        return core.eager.Tensor(
+            value=arr,
+            place=core.CPUPlace(),
+            persistable=False,
+            zero_copy=True,
+            **kwargs,
+        )
+    tensor = _ndarray_to_tensor(arr, return_numpy)
+    if index.name and in_dygraph_mode():
+        tensor.name = index.name
+    return tensor
+
+
 def _lod_tensor2varbase(tensor):
     return_var = _create_tensor()
     return_var.value().get_tensor().set(tensor, _current_expected_place())
@@ -801,6 +864,11 @@ def save(
           use_binary_format(bool): When the saved object is static graph variable, you can specify ``use_binary_for_var``.
           If True, save the file in the c++ binary format when saving a single static graph variable; otherwise, save it in pickle format.
           Default: False
+          use_chunked_format(bool): If True, save the tensors of ``obj`` as raw contiguous buffers after a small
+          pickled header, the buffers are written by a thread pool in chunks, and ``paddle.load`` can read each
+          tensor alone. Only saving to file is supported. Default: False
+          num_threads(int): The number of threads writing tensor data when ``use_chunked_format`` is True.
+          Default: min(8, os.cpu_count())
 
     Returns:
         None
@@ -905,6 +973,15 @@ def save(
             >>> tensor = paddle.randn([2, 3], dtype='float32')
             >>> paddle.save(tensor, byio)
 
+        .. code-block:: python
+            :name: code-example-6
+
+            >>> # example 6: save state_dict in chunked format
+            >>> import paddle
+            >>> emb = paddle.nn.Embedding(10, 10)
+            >>> paddle.save(emb.state_dict(), "emb.pdparams", use_chunked_format=True)
+            >>> load_state_dict = paddle.load("emb.pdparams")
+
     '''
     if _is_file_path(path):
         # 1. input check
@@ -932,6 +1009,11 @@ def save(
             f"Type of `use_binary_format` should be bool, but received {type(config.use_binary_format)}."
         )
 
+    if not isinstance(config.use_chunked_format, bool):
+        raise TypeError(
+            f"Type of `use_chunked_format` should be bool, but received {type(config.use_chunked_format)}."
+        )
+
     if config.use_binary_format:
         _save_binary_var(obj, path)
     else:
@@ -942,7 +1024,13 @@ def save(
                 "'pickle_protocol' is a deprecated argument. Please use 'protocol' instead."
             )
 
-        if isinstance(obj, paddle.static.Program):
+        if config.use_chunked_format:
+            if isinstance(obj, paddle.static.Program):
+                raise TypeError(
+                    "`use_chunked_format` does not support saving Program."
+                )
+            _save_chunked(obj, path, protocol, config.num_threads)
+        elif isinstance(obj, paddle.static.Program):
             if in_pir_mode():
                 paddle.core.serialize_pir_program(
                     obj, path, 1, True, False, True
@@ -1062,6 +1150,11 @@ def load(path: str | BytesIO, **configs: Unpack[_LoadOptions]) -> Any:
             by default.
             (3) return_numpy(bool): If specified as True, return tensor as numpy.ndarray, otherwise return tensor as paddle.Tensor.
             Default False.
+            (4) mmap(bool): Only for the file saved with ``use_chunked_format=True``. If specified as True, the file is memory
+            mapped and the returned tensors (or numpy.ndarray if ``return_numpy`` is True) share the mapped data without
+            copying, the data is read from disk only when it is accessed, e.g. copied to parameters by ``set_state_dict``.
+            In dynamic graph mode the returned tensors are on CPU. Modifying them does not change the file, but the file
+            should not be overwritten while they are in use. Default False.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -1180,9 +1273,35 @@ def load(path: str | BytesIO, **configs: Unpack[_LoadOptions]) -> Any:
             >>> # load state_dict
             >>> dict_load = paddle.load(byio)
 
+        .. code-block:: python
+            :name: code-example-6
+
+            >>> # example 6: load state_dict saved in chunked format lazily
+            >>> import paddle
+            >>> emb = paddle.nn.Embedding(10, 10)
+            >>> paddle.save(emb.state_dict(), "emb.pdparams", use_chunked_format=True)
+            >>> # tensors are backed by the memory mapped file
+            >>> state_dict = paddle.load("emb.pdparams", mmap=True)
+            >>> emb.set_state_dict(state_dict)
+
     '''
 
-    if _is_memory_buffer(path) or os.path.isfile(path):
+    if _is_chunked_file(path):
+        config = _parse_load_config(configs)
+        load_result = _load_chunked(
+            path,
+            lambda arr, index: _chunked_array_to_tensor(
+                arr, index, config.return_numpy, config.mmap
+            ),
+            mmap=config.mmap,
+            keep_name_table=bool(config.keep_name_table),
+        )
+    elif configs.get('mmap', False):
+        raise ValueError(
+            "`mmap` is only supported when loading the file saved by `paddle.save` "
+            f"with `use_chunked_format=True`, but {path} is not in chunked format."
+        )
+    elif _is_memory_buffer(path) or os.path.isfile(path):
         config = _parse_load_config(configs)
         exception_type = pickle.UnpicklingError
         try:
@@ -1212,6 +1212,10 @@ class DynamicGraphAdapter:
         self._amp_custom_lists = {}
         self._use_fp16_guard = True
 
+        # whether to keep losses and metric outputs on device, see `defer_sync`
+        self._defer_sync = False
+        self._pending_metric_outs = []
+
         if self._nranks > 1:
             dist.init_parallel_env()
             strategy = paddle.distributed.parallel.ParallelStrategy()
@@ -1233,6 +1237,48 @@ class DynamicGraphAdapter:
     def mode(self, value):
         self.model.mode = value
 
+    @contextlib.contextmanager
+    def defer_sync(self):
+        """
+        Within this context, losses are returned as Tensors and metric
+        outputs are kept on device instead of being copied to host, so the
+        host doesn't wait for the device every step. The metrics are updated
+        with the kept outputs in `sync_metrics`.
+        """
+        self._defer_sync = True
+        try:
+            yield
+        finally:
+            self._defer_sync = False
+
+    def sync_metrics(self):
+        for metric, metric_outs in self._pending_metric_outs:
+            metric.update(*[to_numpy(m) for m in metric_outs])
+        self._pending_metric_outs = []
+
+    def _fetch(self, var):
+        return var.detach() if self._defer_sync else to_numpy(var)
+
+    def _update_metrics(self, outputs, labels):
+        metrics = []
+        for metric in self.model._metrics:
+            metric_outs = metric.compute(*(to_list(outputs) + labels))
+            if self._defer_sync:
+                self._pending_metric_outs.append(
+                    (
+                        metric,
+                        [
+                            m.detach() if isinstance(m, paddle.Tensor) else m
+                            for m in to_list(metric_outs)
+                        ],
+                    )
+                )
+                metrics.append(None)
+            else:
+                m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
+                metrics.append(m)
+        return metrics
+
     # TODO multi device in dygraph mode not implemented at present time
     def train_batch(self, inputs, labels=None, update=True):
         assert (
@@ -1277,16 +1323,12 @@ class DynamicGraphAdapter:
                 self.model._optimizer.minimize(final_loss)
                 self.model.network.clear_gradients()
 
-        metrics = []
-        for metric in self.model._metrics:
-            metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
-            metrics.append(m)
+        metrics = self._update_metrics(outputs, labels)
 
         return (
-            ([to_numpy(l) for l in losses], metrics)
+            ([self._fetch(l) for l in losses], metrics)
             if len(metrics) > 0
-            else [to_numpy(l) for l in losses]
+            else [self._fetch(l) for l in losses]
         )
 
     def eval_batch(self, inputs, labels=None):
@@ -1337,17 +1379,13 @@ class DynamicGraphAdapter:
                     self._merge_count[self.mode + '_total'] += samples
                     self._merge_count[self.mode + '_batch'] = samples
 
-        metrics = []
-        for metric in self.model._metrics:
-            # cut off padding value.
-            metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
-            metrics.append(m)
+        # cut off padding value.
+        metrics = self._update_metrics(outputs, labels)
 
         if self.model._loss and len(metrics):
-            return [to_numpy(l) for l in losses], metrics
+            return [self._fetch(l) for l in losses], metrics
         elif self.model._loss:
-            return [to_numpy(l) for l in losses]
+            return [self._fetch(l) for l in losses]
         else:
             return metrics
 
@@ -1469,6 +1507,77 @@ class DynamicGraphAdapter:
             self.model._scaler = None
 
 
+class _DeferredLogs(dict):
+    """
+    Logs passed to callbacks by :code:`Model.fit` with :attr:`defer_sync`.
+    The losses and metrics of the latest step are kept on device, they are
+    synchronized to host when any of them is read, e.g. by ProgBarLogger
+    every `log_freq` steps. Other keys like `step` and `batch_size` are read
+    without synchronization.
+    """
+
+    def __init__(self, model, logs):
+        super().__init__(logs)
+        self._model = model
+        self._lazy_keys = set(model._metrics_name())
+        self._pending_losses = None
+
+    def defer(self, losses):
+        self._pending_losses = losses
+
+    def sync(self):
+        if self._pending_losses is not None:
+            losses, self._pending_losses = self._pending_losses, None
+            self._model._adapter.sync_metrics()
+            self._model._update_logs(self, losses)
+
+    def _sync_key(self, key):
+        if key in self._lazy_keys:
+            self.sync()
+
+    def __getitem__(self, key):
+        self._sync_key(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self._sync_key(key)
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        if self._pending_losses is not None and key in self._lazy_keys:
+            return True
+        return super().__contains__(key)
+
+    def __len__(self):
+        if self._pending_losses is not None:
+            return len(self._lazy_keys.union(super().keys()))
+        return super().__len__()
+
+    def __iter__(self):
+        self.sync()
+        return super().__iter__()
+
+    def keys(self):
+        self.sync()
+        return super().keys()
+
+    def values(self):
+        self.sync()
+        return super().values()
+
+    def items(self):
+        self.sync()
+        return super().items()
+
+    def copy(self):
+        self.sync()
+        return dict(super().items())
+
+    def __repr__(self):
+        self.sync()
+        return super().__repr__()
+
+
 class Model:
     """
 
@@ -2214,6 +2323,7 @@ class Model:
         callbacks: Sequence[Callback] | Callback | None = None,
         accumulate_grad_batches: int = 1,
         num_iters: int | None = None,
+        defer_sync: bool = False,
     ) -> None:
         """
 
@@ -2262,6 +2372,13 @@ class Model:
             num_iters (int|None, optional): The number of iterations to evaluate the model.
                 If None, evaluate on whole input dataset, otherwise, evaluate `num_iters` times.
                 Default: None.
+            defer_sync (bool, optional): Whether to keep the losses and metric outputs on
+                device in dynamic graph mode, instead of copying them to host every step,
+                which waits for the device to finish the step. If True, they are copied
+                only when callbacks read the losses or metrics from logs, e.g. every
+                `log_freq` steps by :ref:`api_paddle_callbacks_ProgBarLogger`, and at least
+                every `log_freq` steps and at the end of each epoch, so the host runs ahead
+                of the device. The values read are the same as without it. Default: False.
 
         Returns:
             None
@@ -2427,7 +2544,13 @@ class Model:
         cbks.on_begin('train')
         for epoch in range(epochs):
             cbks.on_epoch_begin(epoch)
-            logs = self._run_one_epoch(train_loader, cbks, 'train')
+            logs = self._run_one_epoch(
+                train_loader,
+                cbks,
+                'train',
+                defer_sync=defer_sync,
+                log_freq=log_freq,
+            )
             cbks.on_epoch_end(epoch, logs)
 
             if do_eval and epoch % eval_freq == 0:
@@ -2437,7 +2560,13 @@ class Model:
                     {'steps': eval_steps, 'metrics': self._metrics_name()},
                 )
 
-                eval_logs = self._run_one_epoch(eval_loader, cbks, 'eval')
+                eval_logs = self._run_one_epoch(
+                    eval_loader,
+                    cbks,
+                    'eval',
+                    defer_sync=defer_sync,
+                    log_freq=log_freq,
+                )
 
                 cbks.on_end('eval', eval_logs)
             if self.stop_training:
@@ -2774,9 +2903,19 @@ class Model:
         data_loader,
         callbacks,
         mode,
-        logs={},
+        logs=None,
+        defer_sync=False,
+        log_freq=10,
     ):
+        # NOTE: not a shared default, logs left by a previous epoch or another
+        # Model, e.g. with other metrics, would be passed to callbacks
+        logs = {} if logs is None else logs
         outputs = []
+        # NOTE: the losses and metrics are kept on device until read from
+        # logs by callbacks, only the latest losses are needed for logs
+        defer_sync = defer_sync and mode != 'predict' and in_dynamic_mode()
+        if defer_sync:
+            logs = _DeferredLogs(self, logs)
         for step, data in enumerate(data_loader):
             # Data might come from different types of data_loader and have
             # different format, as following:
@@ -2809,23 +2948,27 @@ class Model:
                         or step + 1 == len(data_loader)
                     )
 
-                outs = getattr(self, mode + '_batch')(*_inputs)
+                if defer_sync:
+                    with self._adapter.defer_sync():
+                        outs = getattr(self, mode + '_batch')(*_inputs)
+                else:
+                    outs = getattr(self, mode + '_batch')(*_inputs)
 
                 if self._metrics and self._loss:
-                    metrics = [[float(l) for l in outs[0]]]
+                    losses = outs[0]
                 elif self._loss:
-                    metrics = [[float(l) for l in outs]]
+                    losses = outs
                 else:
-                    metrics = []
-
-                # metrics
-                for metric in self._metrics:
-                    res = metric.accumulate()
-                    metrics.extend(to_list(res))
-
-                assert len(self._metrics_name()) == len(metrics)
-                for k, v in zip(self._metrics_name(), metrics):
-                    logs[k] = v
+                    losses = []
+
+                if defer_sync:
+                    logs.defer(losses)
+                    # NOTE: bound the metric outputs kept on device even if
+                    # no callback reads the logs
+                    if (step + 1) % log_freq == 0:
+                        logs.sync()
+                else:
+                    self._update_logs(logs, losses)
             else:
                 if self._inputs is not None:
                     outs = self.predict_batch(data[: len(self._inputs)])
@@ -2852,12 +2995,26 @@ class Model:
                     self.stop_training = True
                     del self.num_iters
                     break
+        if defer_sync:
+            logs.sync()
         self._reset_metrics()
 
         if mode == 'predict':
             return logs, outputs
         return logs
 
+    def _update_logs(self, logs, losses):
+        metrics = [[float(l) for l in losses]] if self._loss else []
+
+        # metrics
+        for metric in self._metrics:
+            res = metric.accumulate()
+            metrics.extend(to_list(res))
+
+        assert len(self._metrics_name()) == len(metrics)
+        for k, v in zip(self._metrics_name(), metrics):
+            logs[k] = v
+
     def summary(
         self,
         input_size: (
@@ -34,6 +34,9 @@ if TYPE_CHECKING:
     class _Dataloader(TypedDict):
         enable: bool
         tuning_steps: int
+        autoscale: NotRequired[bool]
+        min_workers: NotRequired[int]
+        max_workers: NotRequired[int]
 
     class _ConfigKernel(TypedDict):
         kernel: NotRequired[_Kernel]
@@ -67,6 +70,14 @@ def set_config(config: _ConfigKernel | str | None = None) -> None:
     the origin dataloader setting. Tuning parameters are as follows:
 
     - enable(bool): Whether to enable dataloader tuning.
+    - autoscale(bool): Whether to add or retire workers of multi-process DataLoader
+      at runtime by the time waiting for data, prefetch depth is adjusted with
+      worker number as well. Only map-style dataset is supported, and
+      `num_workers` from `paddle.io.get_worker_info` is the worker number when
+      the worker starts. Default: False.
+    - min_workers(int): Min worker number for autoscaling. Default: 1.
+    - max_workers(int): Max worker number for autoscaling. Default: None, half of
+      the CPU count.
 
     Args:
         config (dict|str|None, optional): Configuration for auto-tuning. If it is a
@@ -179,3 +190,15 @@ def set_config(config: _ConfigKernel | str | None = None) -> None:
                     "The `tuning_steps` should be int. Use default parameter instead."
                 )
                 paddle.io.reader.set_autotune_config(use_autotune)
+        if "autoscale" in dataloader_config:
+            if isinstance(dataloader_config['autoscale'], bool):
+                paddle.io.reader.set_autoscale_config(
+                    dataloader_config['autoscale'],
+                    dataloader_config.get('min_workers', 1),
+                    dataloader_config.get('max_workers', None),
+                )
+            else:
+                warnings.warn(
+                    "The auto-tuning configuration of the dataloader is incorrect."
+                    "The `autoscale` should be bool. Use default parameter instead."
+                )
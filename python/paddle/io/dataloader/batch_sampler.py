@@ -14,8 +14,10 @@
 
 from __future__ import annotations
 
+import itertools
 import math
 from typing import (
+    Any,
     Iterable,
     Iterator,
     Sequence,
@@ -155,15 +157,32 @@ class BatchSampler(Sampler[Sequence[int]]):
         # in auto-parallel
         self._acc_steps = 1
 
+        # batch number yielded in the latest iteration, see state_dict
+        self._num_yielded = 0
+        self._num_skip = 0
+
     def __iter__(self) -> Iterator[list[int]]:
         local_batch_size = self.batch_size * self._acc_steps
+        self._num_yielded, self._num_skip = self._num_skip, 0
+
+        sampler_iter = iter(self.sampler)
+        # NOTE: samplers with load_state_dict have skipped yielded indices
+        # themselves, others are skipped by iterating indices here
+        if self._num_yielded > 0 and not hasattr(
+            self.sampler, 'load_state_dict'
+        ):
+            sampler_iter = itertools.islice(
+                sampler_iter, self._num_yielded * local_batch_size, None
+            )
         batch_indices = []
-        for idx in self.sampler:
+        for idx in sampler_iter:
             batch_indices.append(idx)
             if len(batch_indices) == local_batch_size:
+                self._num_yielded += 1
                 yield batch_indices
                 batch_indices = []
         if not self.drop_last and len(batch_indices) > 0:
+            self._num_yielded += 1
             yield batch_indices
 
     def __len__(self) -> int:
@@ -172,6 +191,36 @@ class BatchSampler(Sampler[Sequence[int]]):
         num_samples += int(not self.drop_last) * (local_batch_size - 1)
         return num_samples // local_batch_size
 
+    def state_dict(self) -> dict[str, Any]:
+        """
+        Get the state of the latest iteration, which contains the state of
+        :attr:`sampler` (if :attr:`sampler` implements :code:`state_dict`)
+        and the number of mini-batch indices yielded in the iteration.
+
+        Returns:
+            dict: state with keys :code:`sampler` and :code:`num_yielded`.
+        """
+        sampler_state = None
+        if hasattr(self.sampler, 'state_dict'):
+            sampler_state = self.sampler.state_dict()
+        return {'sampler': sampler_state, 'num_yielded': self._num_yielded}
+
+    def load_state_dict(self, state_dict: dict[str, Any]) -> None:
+        """
+        Load the state returned by :code:`state_dict`, next iteration will
+        resume from the mini-batch after the first :code:`num_yielded`
+        mini-batches of the recorded iteration.
+
+        Args:
+            state_dict(dict): state returned by :code:`state_dict`.
+        """
+        self._num_skip = state_dict['num_yielded']
+        if hasattr(self.sampler, 'load_state_dict'):
+            local_batch_size = self.batch_size * self._acc_steps
+            sampler_state = dict(state_dict.get('sampler') or {})
+            sampler_state['num_yielded'] = self._num_skip * local_batch_size
+            self.sampler.load_state_dict(sampler_state)
+
 
 class _InfiniteIterableSampler(Sampler[Sequence[None]]):
     dataset: IterableDataset
@@ -189,6 +238,54 @@ class _InfiniteIterableSampler(Sampler[Sequence[None]]):
             yield [None] * self.batch_size
 
 
+class _FeistelPermutation:
+    """
+    Seeded bijective mapping on [0, size), which permutes indices lazily
+    without materializing the whole index list.
+
+    Indices are mapped by a balanced Feistel network on the smallest even
+    bit width covering :attr:`size`, outputs out of range are mapped again
+    (cycle walking) until they fall in [0, size), which keeps the mapping
+    a bijection on [0, size).
+    """
+
+    _ROUNDS = 4
+
+    def __init__(self, size, seed):
+        self.size = size
+        half_bits = max((int(size - 1).bit_length() + 1) // 2, 1)
+        self._half_bits = np.uint64(half_bits)
+        self._half_mask = np.uint64((1 << half_bits) - 1)
+        self._keys = (
+            np.random.RandomState(seed)
+            .randint(0, 2**63 - 1, size=self._ROUNDS, dtype=np.int64)
+            .astype(np.uint64)
+        )
+
+    def _round(self, x, key):
+        # splitmix64 finalizer as round function, uint64 arithmetic wraps
+        x = (x ^ key) * np.uint64(0x9E3779B97F4A7C15)
+        x ^= x >> np.uint64(31)
+        x *= np.uint64(0xBF58476D1CE4E5B9)
+        x ^= x >> np.uint64(29)
+        return x & self._half_mask
+
+    def _encrypt(self, x):
+        left = x >> self._half_bits
+        right = x & self._half_mask
+        for key in self._keys:
+            left, right = right, left ^ self._round(right, key)
+        return (left << self._half_bits) | right
+
+    def __call__(self, indices):
+        out = self._encrypt(np.asarray(indices, dtype=np.uint64))
+        out_of_range = out >= self.size
+        while out_of_range.any():
+            out[out_of_range] = self._encrypt(out[out_of_range])
+            out_of_range = out >= self.size
+        return out.astype(np.int64)
+
+
 class DistributedBatchSampler(BatchSampler):
     """Sampler that restricts data loading to a subset of the dataset.
 
@@ -215,6 +312,14 @@ class DistributedBatchSampler(BatchSampler):
             batch indices. Default False.
         drop_last(bool, optional): whether drop the last incomplete(less than a mini-batch) batch dataset size.
             Default False.
+        lazy(bool, optional): whether to generate indices of current rank lazily
+            for each mini-batch instead of building and shuffling the index list
+            of the whole dataset, memory cost is O(batch_size) in lazy mode,
+            which is suitable for datasets with huge sample number. Padding and
+            :attr:`drop_last` behave the same as non-lazy mode, when
+            :attr:`shuffle` is True, indices are shuffled by a bijective mapping
+            seeded by epoch, which gives a different ordering from non-lazy mode.
+            Default False.
 
     Returns:
         DistributedBatchSampler, return an iterable object for indices iterating.
@@ -264,6 +369,7 @@ class DistributedBatchSampler(BatchSampler):
         rank: int | None = None,
         shuffle: bool = False,
         drop_last: bool = False,
+        lazy: bool = False,
     ) -> None:
         self.dataset = dataset
 
@@ -296,6 +402,8 @@ class DistributedBatchSampler(BatchSampler):
             self.local_rank = ParallelEnv().local_rank
 
         self.drop_last = drop_last
+        assert isinstance(lazy, bool), "lazy should be a boolean value"
+        self.lazy = lazy
         self.epoch = 0
         self.num_samples = int(math.ceil(len(self.dataset) * 1.0 / self.nranks))
         self.total_size = self.num_samples * self.nranks
@@ -304,8 +412,20 @@ class DistributedBatchSampler(BatchSampler):
         # in auto-parallel
         self._acc_steps = 1
 
+        # epoch used by the latest iteration and batch number yielded in
+        # it, see state_dict
+        self._iter_epoch = None
+        self._num_yielded = 0
+        self._num_skip = 0
+
     def __iter__(self) -> Iterator[list[int]]:
+        if self.lazy:
+            yield from self._lazy_iter()
+            return
+
         local_batch_size = self.batch_size * self._acc_steps
+        self._iter_epoch = self.epoch
+        self._num_yielded, self._num_skip = self._num_skip, 0
         num_samples = len(self.dataset)
         indices = np.arange(num_samples).tolist()
         # add extra samples to make it evenly divisible
@@ -351,17 +471,75 @@ class DistributedBatchSampler(BatchSampler):
             indices = _get_indices_by_batch_size(indices)
 
         assert len(indices) == self.num_samples
-        _sample_iter = iter(indices)
+        _sample_iter = iter(indices[self._num_yielded * local_batch_size :])
 
         batch_indices = []
         for idx in _sample_iter:
             batch_indices.append(idx)
             if len(batch_indices) == local_batch_size:
+                self._num_yielded += 1
                 yield batch_indices
                 batch_indices = []
         if not self.drop_last and len(batch_indices) > 0:
+            self._num_yielded += 1
             yield batch_indices
 
+    def _local_to_global(self, local_indices):
+        # position in the padded global index list of local position, same
+        # as the subsampling of non-lazy mode: each rank takes batch_size
+        # indices in turn, and the tail less than batch_size * nranks is
+        # split evenly among ranks
+        if self.nranks == 1:
+            return local_indices
+        last_batch_size = self.total_size % (self.batch_size * self.nranks)
+        last_local_batch_size = last_batch_size // self.nranks
+        num_full = (self.total_size - last_batch_size) // self.nranks
+
+        block, offset = np.divmod(local_indices, self.batch_size)
+        global_indices = (
+            block * self.batch_size * self.nranks
+            + self.local_rank * self.batch_size
+            + offset
+        )
+        tail = local_indices >= num_full
+        global_indices[tail] = (
+            self.total_size
+            - last_batch_size
+            + self.local_rank * last_local_batch_size
+            + local_indices[tail]
+            - num_full
+        )
+        return global_indices
+
+    def _lazy_iter(self) -> Iterator[list[int]]:
+        local_batch_size = self.batch_size * self._acc_steps
+        self._iter_epoch = self.epoch
+        self._num_yielded, self._num_skip = self._num_skip, 0
+
+        permutation = None
+        if self.shuffle:
+            permutation = _FeistelPermutation(self.total_size, self.epoch)
+            self.epoch += 1
+
+        dataset_size = len(self.dataset)
+        for start in range(
+            self._num_yielded * local_batch_size,
+            self.num_samples,
+            local_batch_size,
+        ):
+            stop = min(start + local_batch_size, self.num_samples)
+            if self.drop_last and stop - start < local_batch_size:
+                return
+            indices = self._local_to_global(
+                np.arange(start, stop, dtype=np.int64)
+            )
+            if permutation is not None:
+                indices = permutation(indices)
+            # padded indices repeat the dataset from beginning
+            indices %= dataset_size
+            self._num_yielded += 1
+            yield indices.tolist()
+
     def __len__(self) -> int:
         local_batch_size = self.batch_size * self._acc_steps
         num_samples = self.num_samples
@@ -406,3 +584,54 @@ class DistributedBatchSampler(BatchSampler):
                 ...     sampler.set_epoch(epoch)
         """
         self.epoch = epoch
+
+    def state_dict(self) -> dict[str, Any]:
+        """
+        Get the state of the latest iteration, which contains the epoch
+        number used as seed of the iteration and the number of mini-batch
+        indices yielded in it. If no iteration started yet, the state of
+        next iteration will be returned.
+
+        Returns:
+            dict: state with keys :code:`epoch` and :code:`num_yielded`.
+
+        Examples:
+            .. code-block:: python
+
+                >>> import numpy as np
+                >>> from paddle.io import Dataset, DistributedBatchSampler
+
+                >>> class RandomDataset(Dataset): # type: ignore[type-arg]
+                ...     def __len__(self):
+                ...         return 100
+                ...
+                >>> sampler = DistributedBatchSampler(
+                ...     RandomDataset(), batch_size=8, num_replicas=2, rank=0,
+                ...     shuffle=True,
+                ... )
+                >>> sampler_iter = iter(sampler)
+                >>> consumed = [next(sampler_iter) for _ in range(3)]
+                >>> state = sampler.state_dict()
+
+                >>> resumed = DistributedBatchSampler(
+                ...     RandomDataset(), batch_size=8, num_replicas=2, rank=0,
+                ...     shuffle=True,
+                ... )
+                >>> resumed.load_state_dict(state)
+                >>> assert list(resumed) == list(sampler_iter)
+        """
+        if self._iter_epoch is None:
+            return {'epoch': self.epoch, 'num_yielded': 0}
+        return {'epoch': self._iter_epoch, 'num_yielded': self._num_yielded}
+
+    def load_state_dict(self, state_dict: dict[str, Any]) -> None:
+        """
+        Load the state returned by :code:`state_dict`, next iteration will
+        use the recorded epoch and resume from the mini-batch after the first
+        :code:`num_yielded` mini-batches directly.
+
+        Args:
+            state_dict(dict): state returned by :code:`state_dict`.
+        """
+        self.epoch = state_dict['epoch']
+        self._num_skip = state_dict['num_yielded']
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import numbers
 from collections.abc import Mapping, Sequence
 
@@ -109,3 +110,200 @@ def default_convert_fn(batch):
         return [default_convert_fn(d) for d in batch]
     else:
         return batch
+
+
+class SchemaCollateFn:
+    """
+    Schema compiled batch collating function for :code:`paddle.io.DataLoader`,
+    which produces the same batch data as :code:`default_collate_fn` but
+    parses the structure of samples only once.
+
+    On the first calling, the field layout of the first sample (nested list
+    and dictionary, leaf fields and dtype/shape of numpy array fields) is
+    compiled as a flat accessor, later batches are gathered field by field
+    with this accessor and numpy array fields are stacked into preallocated
+    output buffers in place. If numpy array fields are ragged among samples
+    in a batch, they will be padded with :attr:`padding_value` to the max
+    shape of the batch instead of raising error. Batches which do not match
+    the compiled schema, e.g. a sample with missing or extra dictionary keys
+    or a list of different length, fallback to :code:`default_collate_fn`.
+
+    Notes:
+        If :attr:`reuse_buffers` is True, numpy arrays returned by a calling
+        will be overwritten by the next calling. This is safe in
+        :code:`paddle.io.DataLoader`, for batch data is copied into Tensors
+        before collating next batch, except in multi-process mode with
+        :attr:`use_shared_memory` set as False, please set
+        :attr:`reuse_buffers` as False in this case.
+
+    Args:
+        padding_value(int|float, optional): value to pad ragged numpy array
+            fields with. Default 0.
+        reuse_buffers(bool, optional): whether to reuse output buffers of
+            numpy array fields among batches. Default True.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> from paddle.io import DataLoader, Dataset
+            >>> from paddle.io.dataloader.collate import SchemaCollateFn
+
+            >>> class RandomDataset(Dataset): # type: ignore[type-arg]
+            ...     def __getitem__(self, idx):
+            ...         seq_len = np.random.randint(4, 8)
+            ...         return {
+            ...             'ids': np.random.randint(0, 100, [seq_len]),
+            ...             'label': idx % 2,
+            ...         }
+            ...
+            ...     def __len__(self):
+            ...         return 16
+            ...
+            >>> loader = DataLoader(
+            ...     RandomDataset(), batch_size=4, collate_fn=SchemaCollateFn()
+            ... )
+            >>> for data in loader:
+            ...     print(data['ids'].shape[0], data['label'].shape)
+            ...     break
+            4 [4]
+    """
+
+    def __init__(self, padding_value=0, reuse_buffers=True):
+        self._padding_value = padding_value
+        self._reuse_buffers = reuse_buffers
+        # schema is nested list/dict same as sample structure with leaf
+        # field replaced by its index in self._leaves
+        self._schema = None
+        self._leaves = None
+        self._accessor = None
+        self._sizer = None
+        self._sizes = None
+        self._buffers = None
+        self._compiled = False
+
+    def _compile(self, sample):
+        leaves = []
+        # (expr, length) of all dict and list fields
+        sizes = []
+        consts = {}
+
+        def _compile_field(field, expr):
+            if isinstance(field, np.ndarray):
+                leaf = ('ndarray', field.dtype, field.ndim)
+            elif isinstance(field, paddle.Tensor):
+                leaf = ('tensor', None, None)
+            elif isinstance(field, numbers.Number):
+                leaf = ('number', None, None)
+            elif isinstance(field, (str, bytes)):
+                leaf = ('str', None, None)
+            elif isinstance(field, Mapping):
+                sizes.append((expr, len(field)))
+                schema = {}
+                for key in field:
+                    name = f'_k{len(consts)}'
+                    consts[name] = key
+                    schema[key] = _compile_field(field[key], f'{expr}[{name}]')
+                return schema
+            elif isinstance(field, Sequence):
+                sizes.append((expr, len(field)))
+                return [
+                    _compile_field(f, f'{expr}[{i}]')
+                    for i, f in enumerate(field)
+                ]
+            else:
+                raise TypeError(
+                    "batch data con only contains: tensor, numpy.ndarray, "
+                    f"dict, list, number, but got {type(field)}"
+                )
+            leaves.append((expr, *leaf))
+            return len(leaves) - 1
+
+        self._compiled = True
+        try:
+            schema = _compile_field(sample, 's')
+        except TypeError:
+            # unsupported field, always use default_collate_fn
+            return
+        self._schema = schema
+        self._leaves = [leaf[1:] for leaf in leaves]
+        self._buffers = [None] * len(leaves)
+        # NOTE: compile field accessing of a sample as a single lambda
+        # which returns all leaf fields in a tuple, e.g.
+        # lambda s: (s[_k0], s[_k1][0],)
+        exprs = ''.join(f'{leaf[0]},' for leaf in leaves)
+        self._accessor = eval(f'lambda s: ({exprs})', consts)
+        # NOTE: the accessor only reads the fields of the schema, extra dict
+        # keys or list items of a sample would be dropped silently. Since all
+        # keys of the schema are read, a sample matches the schema if all its
+        # dict and list fields have the same lengths, which is checked by
+        # another compiled lambda, e.g. lambda s: (len(s), len(s[_k1]),)
+        self._sizes = tuple(size for _, size in sizes)
+        exprs = ''.join(f'len({expr}),' for expr, _ in sizes)
+        self._sizer = eval(f'lambda s: ({exprs})', consts)
+
+    def _take_buffer(self, leaf_idx, shape, dtype):
+        if not self._reuse_buffers:
+            return np.empty(shape, dtype=dtype)
+        numel = math.prod(shape)
+        buffer = self._buffers[leaf_idx]
+        if buffer is None or buffer.size < numel or buffer.dtype != dtype:
+            buffer = np.empty([numel], dtype=dtype)
+            self._buffers[leaf_idx] = buffer
+        return buffer[:numel].reshape(shape)
+
+    def _collate_ndarray(self, leaf_idx, dtype, ndim, fields):
+        shape = fields[0].shape
+        if any(f.dtype != dtype or f.ndim != ndim for f in fields):
+            return default_collate_fn(list(fields))
+
+        batch_size = len(fields)
+        if all(f.shape == shape for f in fields):
+            out = self._take_buffer(leaf_idx, (batch_size, *shape), dtype)
+            return np.stack(fields, axis=0, out=out)
+
+        # ragged fields, pad to max shape of the batch
+        max_shape = tuple(np.max([f.shape for f in fields], axis=0).tolist())
+        out = self._take_buffer(leaf_idx, (batch_size, *max_shape), dtype)
+        out.fill(self._padding_value)
+        for i, f in enumerate(fields):
+            out[(i, *(slice(0, d) for d in f.shape))] = f
+        return out
+
+    def _restore(self, schema, columns):
+        if isinstance(schema, int):
+            return columns[schema]
+        elif isinstance(schema, Mapping):
+            return {
+                key: self._restore(field, columns)
+                for key, field in schema.items()
+            }
+        else:
+            return [self._restore(field, columns) for field in schema]
+
+    def __call__(self, batch):
+        if not self._compiled:
+            self._compile(batch[0])
+        if self._accessor is None:
+            return default_collate_fn(batch)
+
+        try:
+            if any(self._sizer(sample) != self._sizes for sample in batch):
+                return default_collate_fn(batch)
+            columns = list(zip(*[self._accessor(sample) for sample in batch]))
+        except (KeyError, IndexError, TypeError):
+            return default_collate_fn(batch)
+
+        for i, (fields, (kind, dtype, ndim)) in enumerate(
+            zip(columns, self._leaves)
+        ):
+            if kind == 'ndarray' and all(
+                isinstance(f, np.ndarray) for f in fields
+            ):
+                columns[i] = self._collate_ndarray(i, dtype, ndim, fields)
+            elif kind == 'str':
+                columns[i] = list(fields)
+            else:
+                columns[i] = default_collate_fn(list(fields))
+        return self._restore(self._schema, columns)
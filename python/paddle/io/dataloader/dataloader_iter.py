@@ -39,14 +39,30 @@ from ..multiprocess_utils import (
 from .batch_sampler import _InfiniteIterableSampler
 from .collate import default_collate_fn, default_convert_fn
 from .flat import _flatten_batch, _restore_batch
+from .shm_ring import (
+    _SharedMemoryRingReader,
+    _SharedMemorySlot,
+    _use_shm_ring,
+)
 from .worker import (
     _DatasetKind,
     _IterableDatasetStopIteration,
     _ResumeIteration,
+    _RetireWorker,
     _worker_loop,
     _WorkerException,
 )
 
+# Worker autoscaling decides in windows of steps, see _WorkerAutoScaler
+AUTOSCALE_WINDOW_STEPS = 50
+# add a worker if main process waits for data longer than this ratio of
+# window time
+AUTOSCALE_UP_WAIT_RATIO = 0.05
+# retire a worker if main process hardly waits for data and blocking queue
+# is nearly full during the window
+AUTOSCALE_DOWN_WAIT_RATIO = 0.005
+AUTOSCALE_DOWN_QUEUE_RATIO = 0.8
+
 # NOTE: fix `terminate called without an active exception`
 # if for loop break and program exit immediately(with no model
 # layers processing) after iterate **the first few data** in
@@ -78,6 +94,60 @@ def _clear_loader():
 CleanupFuncRegistrar.register(_clear_loader)
 
 
+class _WorkerAutoScaler:
+    """
+    Decide whether to add or retire DataLoader workers at runtime.
+
+    Time main process waits for data in :code:`__next__` and depth of
+    blocking queue before reading are recorded in each step, every
+    :attr:`window_steps` steps, a worker will be added if waiting time
+    ratio of the window is high, or retired if main process hardly waits
+    and blocking queue keeps nearly full, within
+    [:attr:`min_workers`, :attr:`max_workers`].
+    """
+
+    def __init__(self, min_workers, max_workers, window_steps=None):
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.window_steps = window_steps or AUTOSCALE_WINDOW_STEPS
+        self._reset_window()
+
+    def _reset_window(self):
+        self._steps = 0
+        self._wait_time = 0.0
+        self._queue_depth = 0
+        self._window_start = time.time()
+
+    def step(self, wait_time, queue_depth, queue_capacity, num_workers):
+        """
+        Record a step, return 1 to add a worker, -1 to retire a worker
+        and 0 to keep workers unchanged.
+        """
+        self._steps += 1
+        self._wait_time += wait_time
+        self._queue_depth += queue_depth
+        if self._steps < self.window_steps:
+            return 0
+
+        window_time = max(time.time() - self._window_start, 1e-6)
+        wait_ratio = self._wait_time / window_time
+        mean_queue_depth = self._queue_depth / self._steps
+        self._reset_window()
+
+        if (
+            wait_ratio > AUTOSCALE_UP_WAIT_RATIO
+            and num_workers < self.max_workers
+        ):
+            return 1
+        if (
+            wait_ratio < AUTOSCALE_DOWN_WAIT_RATIO
+            and mean_queue_depth >= queue_capacity * AUTOSCALE_DOWN_QUEUE_RATIO
+            and num_workers > self.min_workers
+        ):
+            return -1
+        return 0
+
+
 class _DataLoaderIterBase:
     """
     Iterator implement of DataLoader, will load and feed mini-batch
@@ -106,7 +176,10 @@ class _DataLoaderIterBase:
         self._dataset_kind = loader.dataset_kind
         self._pin_memory = loader.pin_memory
 
-        self._sampler_iter = iter(self._index_sampler)
+        # state loaded by DataLoader.load_state_dict to resume from
+        self._resume_state = getattr(loader, '_state_dict_to_load', None)
+        loader._state_dict_to_load = None
+        self._init_sampler_iter(self._resume_state)
         if self._auto_collate_batch:
             self._collate_fn = loader.collate_fn or default_collate_fn
         else:
@@ -131,6 +204,40 @@ class _DataLoaderIterBase:
             else:
                 return _InfiniteIterableSampler(self._dataset, 1)
 
+    def _init_sampler_iter(self, state_dict=None):
+        # NOTE: _num_yielded records batches output to user rather than
+        # indices put to workers, prefetched batches are not counted so
+        # that they will be regenerated after resuming
+        self._num_yielded = 0
+        num_skip = 0
+        if state_dict is not None:
+            self._num_yielded = state_dict['num_yielded']
+            sampler_state = state_dict.get('batch_sampler', None)
+            if sampler_state is not None and hasattr(
+                self._batch_sampler, 'load_state_dict'
+            ):
+                sampler_state = dict(sampler_state)
+                sampler_state['num_yielded'] = self._num_yielded
+                self._batch_sampler.load_state_dict(sampler_state)
+            else:
+                num_skip = self._num_yielded
+
+        self._sampler_iter = iter(self._index_sampler)
+        if num_skip > 0:
+            self._sampler_iter = itertools.islice(
+                self._sampler_iter, num_skip, None
+            )
+
+    def state_dict(self):
+        if self._dataset_kind == _DatasetKind.ITER:
+            raise ValueError("state_dict of IterableDataset not supported")
+        state_dict = {'num_yielded': self._num_yielded}
+        if self._auto_collate_batch and hasattr(
+            self._batch_sampler, 'state_dict'
+        ):
+            state_dict['batch_sampler'] = self._batch_sampler.state_dict()
+        return state_dict
+
     def __iter__(self):
         return self
 
@@ -319,6 +426,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                         data = data[0]
                 else:
                     data = self._reader.read_next()
+            self._num_yielded += len(self._places)
             benchmark().after_reader()
 
             return data
@@ -399,10 +507,30 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             self._num_workers, len(self._places)
         )
 
+        # NOTE: in worker autoscaling mode, workers will be added or retired
+        # at runtime, and _outstanding_capacity is adjusted with active
+        # worker number, blocking_queue is created with the max capacity
+        worker_autoscale = getattr(loader, '_worker_autoscale', None)
+        if worker_autoscale is not None:
+            if self._dataset_kind != _DatasetKind.MAP:
+                raise ValueError(
+                    "worker autoscaling of IterableDataset not supported"
+                )
+            self._autoscaler = _WorkerAutoScaler(*worker_autoscale)
+            self._max_outstanding_capacity = self._prefetch_factor * max(
+                self._autoscaler.max_workers, len(self._places)
+            )
+        else:
+            self._autoscaler = None
+            self._max_outstanding_capacity = self._outstanding_capacity
+
         # see _try_put_indices
         self._thread_lock = threading.Lock()
 
-        self._base_seed = np.random.randint(low=0, high=sys.maxsize)
+        if self._resume_state is not None and 'base_seed' in self._resume_state:
+            self._base_seed = self._resume_state['base_seed']
+        else:
+            self._base_seed = np.random.randint(low=0, high=sys.maxsize)
 
         # Note(zhangbo): shm_buffer_size is used for MemoryMapAllocationPool.
         # MemoryMapAllocationPool is used to cache and reuse shm, thus reducing munmap in dataloader.
@@ -427,6 +555,16 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             (self._worker_shm_buffer_size) * 2 * self._num_workers
         )
 
+        # NOTE: see [ shared memory ring ] in worker.py, each worker owns
+        # a ring with enough slots to hold its outstanding batches
+        if self._use_shared_memory and _use_shm_ring():
+            self._shm_ring_slots = (
+                -(-self._outstanding_capacity // self._num_workers) + 1
+            )
+        else:
+            self._shm_ring_slots = 0
+        self._shm_ring_reader = None
+
         # init workers and indices queues and put 2 indices in each indices queue
         self._init_workers()
         for _ in range(self._outstanding_capacity):
@@ -441,7 +579,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # multiprocess worker and indice queue list initial as empty
         self._workers = []
         self._worker_status = []
+        # workers retired by autoscaling, see _retire_worker
+        self._worker_retired = []
         self._indices_queues = []
+        self._shm_ring_free_slots = []
         self._workers_idx_cycle = itertools.cycle(range(self._num_workers))
 
         # create data_queue for workers
@@ -453,36 +594,129 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._thread_done_event = threading.Event()
 
         for i in range(self._num_workers):
-            indices_queue = multiprocessing.Queue()
-            indices_queue.cancel_join_thread()
-            self._indices_queues.append(indices_queue)
-            worker = multiprocessing.Process(
-                target=_worker_loop,
-                args=(
-                    self._dataset,
-                    self._dataset_kind,
-                    indices_queue,
-                    self._data_queue,
-                    self._workers_done_event,
-                    self._auto_collate_batch,
-                    self._collate_fn,
-                    self._drop_last,
-                    self._worker_init_fn,
-                    i,
-                    self._num_workers,
-                    self._use_shared_memory,
-                    self._base_seed,
-                    self._worker_shm_buffer_size,
-                ),
+            self._start_worker(i, self._num_workers)
+
+        if self._shm_ring_slots > 0:
+            self._shm_ring_reader = _SharedMemoryRingReader(
+                self._shm_ring_free_slots
             )
-            worker.daemon = True
-            worker.start()
-            self._workers.append(worker)
-            self._worker_status.append(True)
 
         core._set_process_pids(id(self), tuple(w.pid for w in self._workers))
         _set_SIGCHLD_handler()
 
+    def _start_worker(self, worker_id, num_workers):
+        from paddle.incubate import multiprocessing
+
+        indices_queue = multiprocessing.Queue()
+        indices_queue.cancel_join_thread()
+        shm_ring_free_slots = None
+        if self._shm_ring_slots > 0:
+            shm_ring_free_slots = multiprocessing.Semaphore(
+                self._shm_ring_slots
+            )
+        worker = multiprocessing.Process(
+            target=_worker_loop,
+            args=(
+                self._dataset,
+                self._dataset_kind,
+                indices_queue,
+                self._data_queue,
+                self._workers_done_event,
+                self._auto_collate_batch,
+                self._collate_fn,
+                self._drop_last,
+                self._worker_init_fn,
+                worker_id,
+                num_workers,
+                self._use_shared_memory,
+                self._base_seed,
+                self._worker_shm_buffer_size,
+                self._shm_ring_slots,
+                shm_ring_free_slots,
+            ),
+        )
+        worker.daemon = True
+        worker.start()
+
+        if worker_id == len(self._workers):
+            self._indices_queues.append(indices_queue)
+            self._workers.append(worker)
+            self._worker_status.append(True)
+            self._worker_retired.append(False)
+            if shm_ring_free_slots is not None:
+                self._shm_ring_free_slots.append(shm_ring_free_slots)
+        else:
+            # restart a retired worker slot
+            self._indices_queues[worker_id].cancel_join_thread()
+            self._indices_queues[worker_id].close()
+            self._indices_queues[worker_id] = indices_queue
+            self._workers[worker_id] = worker
+            self._worker_status[worker_id] = True
+            self._worker_retired[worker_id] = False
+            if shm_ring_free_slots is not None:
+                self._shm_ring_free_slots[worker_id] = shm_ring_free_slots
+
+    def _add_worker(self):
+        with self._thread_lock:
+            # NOTE: reuse slot of a retired worker only after it exits, which
+            # means all its batches have been received
+            for worker_id, retired in enumerate(self._worker_retired):
+                if retired and not self._workers[worker_id].is_alive():
+                    break
+            else:
+                worker_id = len(self._workers)
+            # NOTE: num_workers is passed to the worker at start, so that
+            # get_worker_info of the new worker reports the count after
+            # adding it, running workers keep the count they started with,
+            # which is why only map-style dataset is autoscaled
+            num_workers = max(len(self._workers), worker_id + 1)
+            self._start_worker(worker_id, num_workers)
+            self._num_workers = num_workers
+            self._workers_idx_cycle = itertools.cycle(range(self._num_workers))
+        core._set_process_pids(
+            id(self), tuple(w.pid for w in self._workers if w.is_alive())
+        )
+
+    def _retire_worker(self):
+        with self._thread_lock:
+            worker_id = max(
+                i for i, status in enumerate(self._worker_status) if status
+            )
+            # worker exits after processing indices already put to it, no
+            # more indices will be put to it as its status set as False
+            self._indices_queues[worker_id].put(_RetireWorker())
+            self._worker_status[worker_id] = False
+            self._worker_retired[worker_id] = True
+
+    def _autoscale_workers(self, wait_time, queue_depth):
+        num_active_workers = sum(self._worker_status)
+        decision = self._autoscaler.step(
+            wait_time,
+            queue_depth,
+            self._outstanding_capacity,
+            num_active_workers,
+        )
+        if decision == 0:
+            return
+        if decision > 0:
+            self._add_worker()
+        else:
+            self._retire_worker()
+        num_active_workers += decision
+        logging.info(
+            f"DataLoader autoscaling {'adds' if decision > 0 else 'retires'} "
+            f"a worker, active worker number: {num_active_workers}"
+        )
+
+        # adjust prefetch depth with active worker number, if capacity
+        # decreases, indices will not be put on outputting batches until
+        # outstanding batches decrease to capacity
+        self._outstanding_capacity = self._prefetch_factor * max(
+            num_active_workers, len(self._places)
+        )
+        for _ in range(self._outstanding_capacity - self._batches_outstanding):
+            self._try_put_indices()
+
     def _clear_and_remove_data_queue(self):
         if self._data_queue is not None:
             while True:
@@ -508,7 +742,9 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             self._dtypes = [v.dtype for v in self._feed_list]
         # if only 1 place, do not need to keep order
         self._blocking_queue = core.init_lod_tensor_blocking_queue(
-            core.Variable(), self._outstanding_capacity, len(self._places) > 1
+            core.Variable(),
+            self._max_outstanding_capacity,
+            len(self._places) > 1,
         )
         core._set_max_memory_map_allocation_pool_size(
             self._main_thread_shm_buffer_size
@@ -533,13 +769,25 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._thread.daemon = True
         self._thread.start()
 
-    def _reset(self):
+    def state_dict(self):
+        state_dict = super().state_dict()
+        # NOTE: workers set random seeds by base_seed and worker id, resume
+        # with the same base_seed to make workers start with the same states
+        state_dict['base_seed'] = self._base_seed
+        return state_dict
+
+    def _reset(self, state_dict=None):
         # resume iteration in following steps
         # 1. Resume workers, clear worker caches
         # put _ResumeIteration to all worker as resume iteration flag
         with self._thread_lock:
-            self._resume_worker_cnt = self._num_workers
-            for worker_id in range(self._num_workers):
+            active_worker_ids = [
+                i
+                for i in range(self._num_workers)
+                if not self._worker_retired[i]
+            ]
+            self._resume_worker_cnt = len(active_worker_ids)
+            for worker_id in active_worker_ids:
                 self._indices_queues[worker_id].put(_ResumeIteration())
                 self._batches_outstanding += 1
         # all flag will be check in _thread_loop, simply wait here
@@ -561,18 +809,24 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     data = self._reader.read_next()
 
         # 3. reset all states
+        # batches cached out of order are dropped, their ring slots
+        # should be released for workers to reuse
+        if self._shm_ring_reader is not None:
+            for info in self._task_infos.values():
+                if len(info) == 3 and isinstance(info[1], _SharedMemorySlot):
+                    self._shm_ring_reader.release(info[1])
         self._send_idx = 0
         self._rcvd_idx = 0
         self._batches_outstanding = 0
         self._task_infos = {}
         self._structure_infos = []
 
-        # set all worker status available
-        self._worker_status = [True] * self._num_workers
+        # set all worker status available except retired ones
+        self._worker_status = [not r for r in self._worker_retired]
 
         # 4. reset _sampler_iter and put prefetch indices to start next epoch
         # init workers and indices queues and put 2 indices in each indices queue
-        self._sampler_iter = iter(self._index_sampler)
+        self._init_sampler_iter(state_dict)
         for _ in range(self._outstanding_capacity):
             self._try_put_indices()
 
@@ -603,6 +857,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                         q.cancel_join_thread()
                         q.close()
             finally:
+                if self._shm_ring_reader is not None:
+                    self._shm_ring_reader.close()
                 core._erase_process_pids(id(self))
                 self._shutdown = True
 
@@ -628,6 +884,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     try:
                         # pack as DenseTensorArray
                         array = core.DenseTensorArray()
+                        if isinstance(batch, _SharedMemorySlot):
+                            batch = self._shm_ring_reader.read(batch)
                         if self._use_shared_memory:
                             for tensor in batch:
                                 array.append(tensor)
@@ -835,6 +1093,9 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._thread_done_event.set()
                     self._blocking_queue.close()
 
+            if self._autoscaler is not None:
+                queue_depth = self._blocking_queue.size()
+                read_start = time.time()
             if in_dynamic_mode():
                 data = core.eager.read_next_tensor_list(
                     self._reader.read_next_list()[0]
@@ -858,6 +1119,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                 else:
                     data = self._reader.read_next()
             self._on_output_batch()
+            if self._autoscaler is not None:
+                self._autoscale_workers(time.time() - read_start, queue_depth)
             benchmark().after_reader()
             return data
         except StopIteration:
@@ -872,4 +1135,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
     def _on_output_batch(self):
         for _ in range(len(self._places)):
             self._batches_outstanding -= 1
-            self._try_put_indices()
+            self._num_yielded += 1
+            # NOTE: _outstanding_capacity may be decreased by worker
+            # autoscaling, only put indices when below capacity
+            if self._batches_outstanding < self._outstanding_capacity:
+                self._try_put_indices()
@@ -168,13 +168,25 @@ class SequenceSampler(Sampler[int]):
 
     def __init__(self, data_source: Sized) -> None:
         self.data_source = data_source
+        self._num_skip = 0
 
     def __iter__(self) -> Iterator[int]:
-        return iter(range(len(self.data_source)))
+        start, self._num_skip = self._num_skip, 0
+        return iter(range(start, len(self.data_source)))
 
     def __len__(self) -> int:
         return len(self.data_source)
 
+    def load_state_dict(self, state_dict: dict[str, Any]) -> None:
+        """
+        Skip the first :code:`state_dict['num_yielded']` indices in next
+        iteration, indices are computed directly without iterating.
+
+        Args:
+            state_dict(dict): state with key :code:`num_yielded`.
+        """
+        self._num_skip = state_dict['num_yielded']
+
 
 class RandomSampler(Sampler[int]):
     """
@@ -241,6 +253,12 @@ class RandomSampler(Sampler[int]):
         self._num_samples = num_samples
         self.generator = generator
 
+        # numpy random state at the beginning of the latest iteration and
+        # number of indices yielded in it, see state_dict
+        self._iter_rng_state = None
+        self._num_yielded = 0
+        self._resume = False
+
         if not isinstance(self.replacement, bool):
             raise TypeError(
                 "expect boolean value for replacement, but got "
@@ -267,28 +285,98 @@ class RandomSampler(Sampler[int]):
 
     def __iter__(self) -> Iterator[int]:
         n = len(self.data_source)
+        if self._resume:
+            num_skip = self._num_yielded
+            if self._iter_rng_state is not None:
+                np.random.set_state(self._iter_rng_state)
+            self._resume = False
+        else:
+            num_skip = 0
+            self._iter_rng_state = (
+                None if self.generator else np.random.get_state()
+            )
+        self._num_yielded = num_skip
+
         if self.generator:
             for i in range(self.num_samples):
                 try:
                     index = next(self.generator)
                 except StopIteration:
                     return
+                if i < num_skip:
+                    continue
+                self._num_yielded += 1
                 yield index
         else:
             if self.replacement:
-                for index in np.random.choice(
+                indices = np.random.choice(
                     np.arange(n), self.num_samples, replace=True
-                ).tolist():
-                    yield index
+                )
             else:
-                for index in np.random.choice(
+                indices = np.random.choice(
                     np.arange(n), self.num_samples, replace=False
-                ).tolist():
-                    yield index
+                )
+            for index in indices[num_skip:].tolist():
+                self._num_yielded += 1
+                yield index
 
     def __len__(self) -> int:
         return self.num_samples
 
+    def state_dict(self) -> dict[str, Any]:
+        """
+        Get the state of the latest iteration, which contains the numpy
+        random state at the beginning of the iteration and the number of
+        indices yielded in it. If no iteration started yet, the current
+        numpy random state will be returned.
+
+        Notes:
+            Random state is only recorded for sampling with the global numpy
+            random generator, if :attr:`generator` is set, resuming will skip
+            indices drawn from :attr:`generator`.
+
+        Returns:
+            dict: state with keys :code:`rng_state` and :code:`num_yielded`.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> from paddle.io import Dataset, RandomSampler
+
+                >>> class RandomDataset(Dataset): # type: ignore[type-arg]
+                ...     def __len__(self):
+                ...         return 10
+                ...
+                >>> sampler = RandomSampler(data_source=RandomDataset())
+                >>> sampler_iter = iter(sampler)
+                >>> consumed = [next(sampler_iter) for _ in range(4)]
+                >>> state = sampler.state_dict()
+
+                >>> resumed = RandomSampler(data_source=RandomDataset())
+                >>> resumed.load_state_dict(state)
+                >>> assert list(resumed) == list(sampler_iter)
+        """
+        if self._iter_rng_state is None and self.generator is None:
+            return {'rng_state': np.random.get_state(), 'num_yielded': 0}
+        return {
+            'rng_state': self._iter_rng_state,
+            'num_yielded': self._num_yielded,
+        }
+
+    def load_state_dict(self, state_dict: dict[str, Any]) -> None:
+        """
+        Load the state returned by :code:`state_dict`, next iteration will
+        regenerate the same indices as the recorded iteration and skip the
+        indices already yielded.
+
+        Args:
+            state_dict(dict): state returned by :code:`state_dict`.
+        """
+        self._iter_rng_state = state_dict['rng_state']
+        self._num_yielded = state_dict['num_yielded']
+        self._resume = True
+
 
 def _weighted_sample(weights, num_samples, replacement=True):
     if isinstance(weights, core.DenseTensor):
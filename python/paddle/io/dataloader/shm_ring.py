@@ -0,0 +1,208 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from ...framework import core
+from ..multiprocess_utils import MP_STATUS_CHECK_INTERVAL
+
+# NOTE: each field in a ring slot starts at a cache line aligned offset
+_SHM_RING_ALIGNMENT = 64
+
+
+def _use_shm_ring():
+    return os.environ.get('FLAGS_dataloader_use_shm_ring', False) in [
+        1,
+        '1',
+        True,
+        'True',
+        'true',
+    ]
+
+
+def _aligned_nbytes(nbytes):
+    return (
+        (nbytes + _SHM_RING_ALIGNMENT - 1)
+        // _SHM_RING_ALIGNMENT
+        * _SHM_RING_ALIGNMENT
+    )
+
+
+class _SharedMemorySlot:
+    """
+    Message put to the workers' result queue in place of the batch
+    tensors when shared memory ring transport is enabled, it only
+    records where the flattened batch arrays locate in the ring of
+    worker :attr:`worker_id`.
+    """
+
+    __slots__ = ('worker_id', 'name', 'slot', 'fields')
+
+    def __init__(self, worker_id, name, slot, fields):
+        self.worker_id = worker_id
+        self.name = name
+        self.slot = slot
+        # list of (offset, shape, dtype) for each flattened array
+        self.fields = fields
+
+    def __getstate__(self):
+        return (self.worker_id, self.name, self.slot, self.fields)
+
+    def __setstate__(self, state):
+        self.worker_id, self.name, self.slot, self.fields = state
+
+
+class _SharedMemoryRing:
+    """
+    Fixed-slot shared memory ring owned by a DataLoader worker.
+
+    The slot size is decided by the flattened arrays of the first batch,
+    batches collated later are written into the next free slot directly
+    and only a :code:`_SharedMemorySlot` is sent to the main process.
+    :attr:`free_slots` is a semaphore shared with the main process, which
+    releases a slot after copying the batch out of it. As main process
+    consumes batches of one worker in sending order, slots are always
+    released in the same order as they are written.
+
+    Args:
+        worker_id(int): id of the worker which owns the ring.
+        arrays(list(numpy.ndarray)): flattened arrays of the first batch.
+        num_slots(int): slot number of the ring.
+        free_slots(multiprocessing.Semaphore): free slot counter shared
+            with the main process, initialized as :attr:`num_slots`.
+    """
+
+    def __init__(self, worker_id, arrays, num_slots, free_slots):
+        self._worker_id = worker_id
+        self._num_slots = num_slots
+        self._free_slots = free_slots
+        self._slot_size = max(
+            sum(_aligned_nbytes(arr.nbytes) for arr in arrays),
+            _SHM_RING_ALIGNMENT,
+        )
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=self._slot_size * num_slots
+        )
+        self._cursor = 0
+
+    @staticmethod
+    def accept(arrays):
+        # only plain numpy arrays can be written into ring slots, batch
+        # with other fields(paddle.Tensor, object array, etc.) is sent
+        # in the ordinary way
+        return len(arrays) > 0 and all(
+            isinstance(arr, np.ndarray) and not arr.dtype.hasobject
+            for arr in arrays
+        )
+
+    def put(self, arrays):
+        """
+        Write arrays into the next free slot, return the slot message, or
+        None if arrays cannot fit in a slot or there is no free slot, in
+        this case, batch should be sent in the ordinary way.
+        """
+        nbytes = sum(_aligned_nbytes(arr.nbytes) for arr in arrays)
+        if nbytes > self._slot_size:
+            return None
+        if not self._free_slots.acquire(block=False):
+            return None
+
+        offset = self._cursor * self._slot_size
+        fields = []
+        for arr in arrays:
+            view = np.ndarray(
+                arr.shape, dtype=arr.dtype, buffer=self._shm.buf, offset=offset
+            )
+            np.copyto(view, arr, casting='no')
+            fields.append((offset, arr.shape, arr.dtype.str))
+            offset += _aligned_nbytes(arr.nbytes)
+        del view
+
+        slot = _SharedMemorySlot(
+            self._worker_id, self._shm.name, self._cursor, fields
+        )
+        self._cursor = (self._cursor + 1) % self._num_slots
+        return slot
+
+    def close(self, done_event, parent_watch_dog):
+        # NOTE: slots may be still waiting to be read by main process when
+        # worker exits(e.g. IterableDataset drained in current worker but
+        # not in others), wait all slots released before unlinking, unless
+        # main process is shutting down
+        acquired = 0
+        while acquired < self._num_slots:
+            if self._free_slots.acquire(timeout=MP_STATUS_CHECK_INTERVAL):
+                acquired += 1
+            elif done_event.is_set() or not parent_watch_dog.is_alive():
+                break
+        self._shm.close()
+        self._shm.unlink()
+
+
+class _SharedMemoryRingReader:
+    """
+    Main process side of shared memory ring transport, copy batches out
+    of workers' ring slots as DenseTensor and release the slots.
+
+    Args:
+        free_slots(list(multiprocessing.Semaphore)): free slot counters
+            of each worker.
+    """
+
+    def __init__(self, free_slots):
+        self._free_slots = free_slots
+        self._segments = {}
+
+    def _attach(self, name):
+        shm = self._segments.get(name, None)
+        if shm is None:
+            shm = shared_memory.SharedMemory(name=name)
+            # NOTE: ring is owned and unlinked by worker, attaching it should
+            # not make resource tracker of main process unlink it again
+            try:
+                resource_tracker.unregister(shm._name, 'shared_memory')
+            except Exception:
+                pass
+            self._segments[name] = shm
+        return shm
+
+    def read(self, slot):
+        try:
+            shm = self._attach(slot.name)
+            tensors = []
+            for offset, shape, dtype in slot.fields:
+                arr = np.ndarray(
+                    shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset
+                )
+                tensor = core.DenseTensor()
+                tensor.set(arr, core.CPUPlace())
+                tensors.append(tensor)
+                del arr
+            return tensors
+        finally:
+            self.release(slot)
+
+    def release(self, slot):
+        self._free_slots[slot.worker_id].release()
+
+    def close(self):
+        for shm in self._segments.values():
+            try:
+                shm.close()
+            except Exception:
+                pass
+        self._segments = {}
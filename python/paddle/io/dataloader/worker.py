@@ -31,6 +31,7 @@ from ..multiprocess_utils import (
 )
 from .fetcher import _IterableDatasetFetcher, _MapDatasetFetcher
 from .flat import _flatten_batch
+from .shm_ring import _SharedMemoryRing
 
 if TYPE_CHECKING:
     from paddle.io import Dataset
@@ -45,6 +46,10 @@ class _ResumeIteration:
     pass
 
 
+class _RetireWorker:
+    pass
+
+
 class _DatasetKind:
     MAP = 0
     ITER = 1
@@ -88,7 +93,9 @@ def get_worker_info() -> WorkerInfo:
     (see :code:`paddle.io.IterableDataset`), worker information contains
     following fields:
 
-    :attr:`num_workers`: total worker process number, see `paddle.io.DataLoader`
+    :attr:`num_workers`: total worker process number, see `paddle.io.DataLoader`,
+    if worker autoscaling is enabled, it is the worker number when this worker
+    is started (see :code:`paddle.incubate.autotune.set_config`)
 
     :attr:`id`: the worker process id, count from 0 to :attr:`num_workers - 1`
 
@@ -293,7 +300,11 @@ def _worker_loop(
     use_shared_memory,
     base_seed,
     shm_cache_size=0,
+    shm_ring_slots=0,
+    shm_ring_free_slots=None,
 ):
+    shm_ring = None
+    parent_watch_dog = ParentWatchDog()
     try:
         # NOTE: [ mmap files clear ] When the child process exits unexpectedly,
         # some shared memory objects may have been applied for but have not yet
@@ -338,7 +349,6 @@ def _worker_loop(
             init_exception = _WorkerException(worker_id)
 
         iterator_drained = False
-        parent_watch_dog = ParentWatchDog()
 
         while parent_watch_dog.is_alive():
             try:
@@ -354,6 +364,11 @@ def _worker_loop(
                 )
                 continue
 
+            # retired by main process at runtime, indices put before this
+            # flag have been processed, simply exit
+            if isinstance(data, _RetireWorker):
+                break
+
             # None as poison piil, so worker event should be set
             if data is None:
                 assert (
@@ -391,6 +406,22 @@ def _worker_loop(
                 if isinstance(batch, _WorkerException):
                     out_queue.put((idx, batch, None))
                 batch, structure = _flatten_batch(batch)
+                # NOTE: [ shared memory ring ] write flattened arrays into a
+                # pre-allocated ring slot and only send the slot message,
+                # fallback to sending DenseTensors if batch cannot fit in
+                # or all slots are still used by main process
+                if shm_ring_slots > 0 and _SharedMemoryRing.accept(batch):
+                    if shm_ring is None:
+                        shm_ring = _SharedMemoryRing(
+                            worker_id,
+                            batch,
+                            shm_ring_slots,
+                            shm_ring_free_slots,
+                        )
+                    slot = shm_ring.put(batch)
+                    if slot is not None:
+                        out_queue.put((idx, slot, structure))
+                        continue
                 if use_shared_memory:
 
                     def numpy2lodtensor(arr):
@@ -415,6 +446,8 @@ def _worker_loop(
     except:
         raise
     finally:
+        if shm_ring is not None:
+            shm_ring.close(done_event, parent_watch_dog)
         if use_shared_memory:
             _cleanup_mmap()
     if done_event.is_set():
@@ -19,6 +19,7 @@ import multiprocessing
 import sys
 import time
 import warnings
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -89,6 +90,10 @@ USE_PINNED_MEMORY = None
 # AutoTune Flags
 USE_AUTOTUNE = False
 TUNING_STEPS = 500
+# Worker autoscaling Flags
+USE_AUTOSCALE = False
+AUTOSCALE_MIN_WORKERS = 1
+AUTOSCALE_MAX_WORKERS = None
 
 
 def set_autotune_config(use_autotune, tuning_steps=500):
@@ -98,6 +103,15 @@ def set_autotune_config(use_autotune, tuning_steps=500):
     TUNING_STEPS = tuning_steps
 
 
+def set_autoscale_config(use_autoscale, min_workers=1, max_workers=None):
+    global USE_AUTOSCALE
+    USE_AUTOSCALE = use_autoscale
+    global AUTOSCALE_MIN_WORKERS
+    AUTOSCALE_MIN_WORKERS = min_workers
+    global AUTOSCALE_MAX_WORKERS
+    AUTOSCALE_MAX_WORKERS = max_workers
+
+
 def use_pinned_memory(*args):
     global USE_PINNED_MEMORY
     if len(args) == 0:
@@ -336,7 +350,9 @@ class DataLoader:
             for :attr:`batch_sampler`, see :attr:`batch_size`. Default False
         collate_fn(Callable|None, optional): function to generate mini-batch data by merging
             the sample list, None for only stack each fields of sample in axis
-            0(same as :attr::`np.stack(..., axis=0)`). Default None
+            0(same as :attr::`np.stack(..., axis=0)`). For samples with fixed
+            structure, :code:`paddle.io.dataloader.collate.SchemaCollateFn`
+            can be used to collate faster into preallocated buffers. Default None
         num_workers(int, optional): the number of subprocess to load data, 0 for no
             subprocess used and loading data in main process. Default 0
         use_buffer_reader (bool, optional): whether to use buffered reader.
@@ -351,7 +367,10 @@ class DataLoader:
             as True only when the shared memory space on your machine(e.g.
             space of '/dev/shm' on Linux operating system) is large enough.
             Shared memory will only be enabled in multi-process mode(num_workers
-            > 0). Default True.
+            > 0). If environment variable :code:`FLAGS_dataloader_use_shm_ring`
+            is set as 1, each worker will write batches of numpy arrays into a
+            pre-allocated shared memory ring and only send slot indices to the
+            main process. Default True.
         timeout(int, optional): the timeout value for getting data form output queue
             of subprocesses. Default 0.
         worker_init_fn(Callable|None, optional): init function which will be called with
@@ -558,8 +577,32 @@ class DataLoader:
 
         self._persistent_workers = persistent_workers
         self._iterator = None
+        # weak reference of the latest iterator in non-persistent mode, for
+        # state_dict, which should not prevent iterator from releasing workers
+        self._iterator_ref = None
+        self._state_dict_to_load = None
         self.num_workers = AuToTune(self).__call__()
 
+        # NOTE: AuToTune picks num_workers once before training, worker
+        # autoscaling keeps adding or retiring workers at runtime in
+        # [min_workers, max_workers] by the time waiting for data, which is
+        # only supported for map-style dataset, for IterableDataset splits
+        # data by worker number
+        self._worker_autoscale = None
+        if (
+            USE_AUTOSCALE
+            and self.num_workers > 0
+            and self.dataset_kind == _DatasetKind.MAP
+        ):
+            max_workers = AUTOSCALE_MAX_WORKERS or max(
+                multiprocessing.cpu_count() // 2, self.num_workers
+            )
+            min_workers = max(min(AUTOSCALE_MIN_WORKERS, max_workers), 1)
+            self.num_workers = min(
+                max(self.num_workers, min_workers), max_workers
+            )
+            self._worker_autoscale = (min_workers, max_workers)
+
     def __len__(self) -> int:
         if self.dataset_kind == _DatasetKind.ITER:
             raise ValueError("length of IterableDataset not supported")
@@ -571,15 +614,94 @@ class DataLoader:
 
     def __iter__(self) -> _DataLoaderIterBase:
         if self.num_workers == 0:
-            return _DataLoaderIterSingleProcess(self)
+            iterator = _DataLoaderIterSingleProcess(self)
         elif self._persistent_workers:
             if self._iterator is None:
                 self._iterator = _DataLoaderIterMultiProcess(self)
             else:
-                self._iterator._reset()
+                state_dict, self._state_dict_to_load = (
+                    self._state_dict_to_load,
+                    None,
+                )
+                self._iterator._reset(state_dict)
             return self._iterator
         else:
-            return _DataLoaderIterMultiProcess(self)
+            iterator = _DataLoaderIterMultiProcess(self)
+        self._iterator_ref = weakref.ref(iterator)
+        return iterator
 
     def __call__(self) -> _DataLoaderIterBase:
         return self.__iter__()
+
+    def state_dict(self) -> dict[str, Any]:
+        """
+        Get the state of the latest iteration of DataLoader, which contains
+        the number of mini-batches output in the iteration, the state of
+        :attr:`batch_sampler` and the random seed of workers. Mini-batches
+        prefetched by DataLoader but not output yet are not counted. If no
+        iteration started yet, the state of next iteration will be returned.
+
+        Notes:
+            :code:`state_dict` is not supported for IterableDataset.
+
+        Returns:
+            dict: state of DataLoader, which can be loaded by
+            :code:`load_state_dict` to resume iteration.
+
+        Examples:
+
+            .. code-block:: python
+
+                >>> import numpy as np
+                >>> from paddle.io import Dataset, DataLoader
+
+                >>> class RandomDataset(Dataset): # type: ignore[type-arg]
+                ...     def __getitem__(self, idx):
+                ...         return np.array([idx]).astype('int64')
+                ...
+                ...     def __len__(self):
+                ...         return 10
+                ...
+                >>> loader = DataLoader(RandomDataset(), batch_size=2, shuffle=True)
+                >>> loader_iter = iter(loader)
+                >>> consumed = [next(loader_iter) for _ in range(2)]
+                >>> state = loader.state_dict()
+
+                >>> # resume in a new job, the remaining 3 batches are output
+                >>> resumed = DataLoader(RandomDataset(), batch_size=2, shuffle=True)
+                >>> resumed.load_state_dict(state)
+                >>> print(len(list(resumed)))
+                3
+        """
+        if self._persistent_workers:
+            iterator = self._iterator
+        else:
+            iterator = self._iterator_ref() if self._iterator_ref else None
+        if iterator is not None:
+            return iterator.state_dict()
+
+        if self.dataset_kind == _DatasetKind.ITER:
+            raise ValueError("state_dict of IterableDataset not supported")
+        state_dict = {'num_yielded': 0}
+        if self.auto_collate_batch and hasattr(
+            self.batch_sampler, 'state_dict'
+        ):
+            state_dict['batch_sampler'] = self.batch_sampler.state_dict()
+        return state_dict
+
+    def load_state_dict(self, state_dict: dict[str, Any]) -> None:
+        """
+        Load the state returned by :code:`state_dict`, next iteration of
+        DataLoader will resume from the mini-batch following the recorded
+        ones, sample indices of the skipped mini-batches are computed by
+        :attr:`batch_sampler` directly and samples are not read.
+
+        Args:
+            state_dict(dict): state returned by :code:`state_dict`.
+
+        Examples:
+            Please see :code:`paddle.io.DataLoader.state_dict`.
+        """
+        if self.dataset_kind == _DatasetKind.ITER:
+            raise ValueError("load_state_dict of IterableDataset not supported")
+        self._state_dict_to_load = state_dict
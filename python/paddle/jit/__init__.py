@@ -23,6 +23,7 @@ from .api import (
 )
 from .dy2static.logging_utils import set_code_level, set_verbosity
 from .dy2static.program_translator import enable_to_static
+from .dy2static.shape_bucket import ShapeBucket
 from .translated_layer import TranslatedLayer
 
 __all__ = [
@@ -35,4 +36,5 @@ __all__ = [
     'set_verbosity',
     'not_to_static',
     'enable_to_static',
+    'ShapeBucket',
 ]
@@ -92,6 +92,8 @@ if TYPE_CHECKING:
     from paddle._typing import NestedStructure
     from paddle.static import InputSpec
 
+    from .dy2static.shape_bucket import ShapeBucket
+
     class _SaveOptions(TypedDict):
         output_spec: NotRequired[Sequence[Tensor | int]]
         with_hook: NotRequired[bool]
@@ -180,6 +182,7 @@ def _check_and_set_backend(backend, build_strategy):
 class _ToStaticOptions(TypedDict):
     property: NotRequired[bool]
     full_graph: NotRequired[bool]
+    shape_buckets: NotRequired[Sequence[ShapeBucket]]
 
 
 class _ToStaticDecorator(Protocol):
@@ -251,7 +254,9 @@ def to_static(
             None. When backend is `CINN`, CINN compiler will be used to speed up
             training and inference.
         kwargs: Support keys including `property`, set `property` to True if the function
-            is python property.
+            is python property. And `shape_buckets`, a list of :code:`paddle.jit.ShapeBucket`,
+            the inputs are padded to the bucket sizes along the specified dimensions, so
+            inputs of different lengths reuse the same converted program.
 
     Returns:
         Tensor(s): containing the numerical result.
@@ -280,6 +285,7 @@ def to_static(
     """
     property = kwargs.get("property", False)
     full_graph = kwargs.get("full_graph", None)
+    shape_buckets = kwargs.get("shape_buckets", None)
 
     def decorated(python_func):
         """
@@ -314,6 +320,7 @@ def to_static(
                 build_strategy=build_strategy,
                 property=property,
                 backend=backend,
+                shape_buckets=shape_buckets,
             ),
         )
 
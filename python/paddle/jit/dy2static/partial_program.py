@@ -303,6 +303,28 @@ class PartialProgramLayer:
         cached_scopes.append(scope)
         return scope
 
+    def _cached_scopes(self):
+        return [
+            scope
+            for scope_cache in (self._pir_scope_cache, self._legacy_scope_cache)
+            for scopes in scope_cache.values()
+            for scope in scopes
+        ]
+
+    def _release_scopes(self):
+        """
+        Release the cached scopes and the interpreter cores built on them,
+        they will be created again in the next call. Returns False and
+        releases nothing if any scope is still used by a pending backward.
+        """
+        if not all(scope._can_reused for scope in self._cached_scopes()):
+            return False
+        for scope_cache in (self._pir_scope_cache, self._legacy_scope_cache):
+            for program_id in scope_cache:
+                core.clear_executor_cache_of_program(program_id)
+            scope_cache.clear()
+        return True
+
     # whole
     @switch_to_static_graph
     def _create_program(self, is_infer_mode=False):
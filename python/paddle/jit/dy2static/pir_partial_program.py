@@ -672,6 +672,24 @@ class PartialProgramLayer:
         cached_scopes.append(scope)
         return scope
 
+    def _cached_scopes(self):
+        return [
+            scope for scopes in self._scope_cache.values() for scope in scopes
+        ]
+
+    def _release_scopes(self):
+        """
+        Release the cached scopes and the interpreter cores built on them,
+        they will be created again in the next call. Returns False and
+        releases nothing if any scope is still used by a pending backward.
+        """
+        if not all(scope._can_reused for scope in self._cached_scopes()):
+            return False
+        for program_id in self._scope_cache:
+            core.clear_executor_cache_of_program(program_id)
+        self._scope_cache.clear()
+        return True
+
     # whole
     @switch_to_static_graph
     def _create_program(self, is_infer_mode=False):
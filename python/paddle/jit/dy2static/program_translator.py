@@ -18,6 +18,7 @@ import collections
 import inspect
 import os
 import threading
+import time
 import warnings
 import weakref
 from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
@@ -39,6 +40,7 @@ from paddle.nn.layer import layers
 from paddle.pir import Value
 from paddle.pir.core import _convert_into_value, static_op_arg_cast_guard
 from paddle.utils import flatten, gast
+from paddle.utils.environments import IntegerEnvironmentVariable
 
 from . import error, logging_utils
 from .function_spec import (
@@ -57,6 +59,7 @@ from .pir_partial_program import (
     PartialProgramLayer as PirPartialProgramLayer,
     PartialProgramLayerHook as PirPartialProgramLayerHook,
 )
+from .shape_bucket import ShapeBucket, pad_to_buckets
 from .transformers import DygraphToStaticAst
 from .utils import (
     ALREADY_D2S,
@@ -86,6 +89,15 @@ __all__ = []
 # Once exceeding the threshold, we will raise warning to users to make sure the conversion is as expected.
 MAX_TRACED_PROGRAM_COUNT = 10
 
+# Default limits of the ProgramCache of each traced function, 0 means unlimited.
+# Once exceeding, the least recently used programs will be evicted.
+ENV_PROGRAM_CACHE_CAPACITY = IntegerEnvironmentVariable(
+    "DY2ST_PROGRAM_CACHE_CAPACITY", 0
+)
+ENV_PROGRAM_CACHE_MAX_BYTES = IntegerEnvironmentVariable(
+    "DY2ST_PROGRAM_CACHE_MAX_BYTES", 0
+)
+
 CONVERSION_OPTIONS = "__jst_not_to_static"
 
 
@@ -413,6 +425,15 @@ class StaticFunction(Generic[_InputT, _RetT]):
         self._cuda_graph_capture_mode = ""
         self._cuda_graph_pool_id = 0
         self._property = kwargs.get("property", False)
+        self._shape_buckets = kwargs.get("shape_buckets", None)
+        if self._shape_buckets is not None and not (
+            isinstance(self._shape_buckets, (list, tuple))
+            and all(isinstance(b, ShapeBucket) for b in self._shape_buckets)
+        ):
+            raise TypeError(
+                f"shape_buckets of to_static should be a list of ShapeBucket, but received {self._shape_buckets}."
+            )
+        self._signature = None
         self._get_debug_name()
 
     def _get_debug_name(self) -> str:
@@ -532,8 +553,24 @@ class StaticFunction(Generic[_InputT, _RetT]):
                 "following API: paddle.disable_static()."
             )
 
+        if self._shape_buckets:
+            return self._call_with_shape_buckets(*args, **kwargs)
         return self._perform_call(*args, **kwargs)
 
+    def _call_with_shape_buckets(
+        self, *args: _InputT.args, **kwargs: _InputT.kwargs
+    ) -> _RetT:
+        """
+        Pads the inputs to the shape buckets, so inputs in the same bucket
+        reuse the same program, and slices the outputs back.
+        """
+        if self._signature is None:
+            self._signature = inspect.signature(self.dygraph_function)
+        args, kwargs, restore_outputs = pad_to_buckets(
+            self._shape_buckets, self._signature, args, kwargs
+        )
+        return restore_outputs(self._perform_call(*args, **kwargs))
+
     def _is_train_mode(self) -> bool:
         if self.class_instance is not None:
             if not hasattr(self.class_instance, 'training'):
@@ -580,6 +617,9 @@ class StaticFunction(Generic[_InputT, _RetT]):
     def get_traced_count(self):
         raise NotImplementedError("Not implemented yet.")
 
+    def get_cache_info(self):
+        raise NotImplementedError("Not implemented yet.")
+
     @property
     def code(self) -> str:
         raise NotImplementedError("Not implemented yet.")
@@ -758,9 +798,16 @@ class SymbolicStaticFunction(StaticFunction):
             )
         super().__init__(function, input_spec, **kwargs)
         self.last_call_input_spec = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        self._build_time = 0.0
 
     def _perform_call(self, *args, **kwargs):
         from ..sot import symbolic_translate
+        from ..sot.opcode_translator.executor.executor_cache import (
+            OpcodeExecutorCache,
+        )
 
         args, kwargs = self._function_spec.unified_args_and_kwargs(args, kwargs)
         cuda_pinned_tensors_move_to_excepted_place(args)
@@ -781,7 +828,52 @@ class SymbolicStaticFunction(StaticFunction):
         )
         if self.class_instance is not None:
             args = (self.class_instance, *args)
-        return traced_fun(*args, **kwargs)
+
+        executor_cache = OpcodeExecutorCache()
+        translate_count = executor_cache.translate_count
+        translate_time = executor_cache.translate_time
+        evict_count = executor_cache.evict_count
+        try:
+            return traced_fun(*args, **kwargs)
+        finally:
+            # NOTE: the executor cache may be cleared during the call
+            if executor_cache.translate_count > translate_count:
+                self._cache_misses += 1
+                self._build_time += max(
+                    executor_cache.translate_time - translate_time, 0.0
+                )
+                self._cache_evictions += max(
+                    executor_cache.evict_count - evict_count, 0
+                )
+            else:
+                self._cache_hits += 1
+
+    def get_cache_info(self) -> dict[str, Any]:
+        """
+        Returns the statistics of the SOT translations of the decorated
+        function, the same keys as :code:`ProgramCache.cache_info`. A call is
+        a miss if it translates any code, including the functions called by
+        it, and :code:`build_time` is the seconds spent in translating. The
+        cache is bounded by :code:`capacity` translations of each code, i.e.
+        env `SOT_MAX_CACHE_SIZE`, and is not bounded by bytes.
+        """
+        from ..sot.opcode_translator.executor.executor_cache import (
+            OpcodeExecutorCache,
+        )
+        from ..sot.utils import ENV_SOT_MAX_CACHE_SIZE
+
+        guard_tree = OpcodeExecutorCache().cache.get(
+            getattr(self._dygraph_function, "__code__", None)
+        )
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "evictions": self._cache_evictions,
+            "build_time": self._build_time,
+            "size": 0 if guard_tree is None else len(guard_tree),
+            "capacity": ENV_SOT_MAX_CACHE_SIZE.get(),
+            "max_bytes": 0,
+        }
 
     @property
     def code(self):
@@ -950,6 +1042,13 @@ class ASTStaticFunction(StaticFunction[_InputT, _RetT]):
         """
         return len(self._program_cache)
 
+    def get_cache_info(self) -> dict[str, Any]:
+        """
+        Returns the statistics of the program cache for the decorated function,
+        see :code:`ProgramCache.cache_info` for details.
+        """
+        return self._program_cache.cache_info()
+
     @property
     def code(self) -> str:
         """
@@ -1591,17 +1690,57 @@ class PirAutoRecomputeHooker(PirPartialProgramLayerHook):
         return whole_program, forward_end_idx, src_vars
 
 
+def _scope_nbytes(scope):
+    nbytes = 0
+    for name in scope.local_var_names():
+        var = scope.find_var(name)
+        try:
+            tensor = var.get_tensor()
+        except Exception:
+            # not a DenseTensor, e.g. TensorArray or step scopes
+            continue
+        if tensor._is_initialized():
+            nbytes += tensor._numel() * core.size_of_dtype(tensor._dtype())
+    return nbytes
+
+
 class ProgramCache:
     """
     Wrapper class for the program functions defined by dygraph function.
+
+    Programs are kept in least recently used order. When a new program is
+    built and the number of programs exceeds :attr:`capacity`, or the memory
+    held by scopes of the partial programs exceeds :attr:`max_bytes`, the
+    least recently used programs are evicted, and the scopes and interpreter
+    cores cached for them are released. Programs whose scopes are still
+    used by a pending backward are never evicted.
+
+    Args:
+        capacity(int|None): max number of cached programs, 0 means unlimited.
+            Default is None, which reads env `DY2ST_PROGRAM_CACHE_CAPACITY`.
+        max_bytes(int|None): max bytes of the scopes of cached programs, 0
+            means unlimited. Default is None, which reads env
+            `DY2ST_PROGRAM_CACHE_MAX_BYTES`.
     """
 
-    def __init__(self):
+    def __init__(self, capacity=None, max_bytes=None):
         # {hash_id : (concrete_program, partial_layer)}
         self._caches = collections.OrderedDict()
         # trace mostly recent used program
         self._recent_key = None
         self._recent_cache_key = None
+        self.capacity = (
+            ENV_PROGRAM_CACHE_CAPACITY.get() if capacity is None else capacity
+        )
+        self.max_bytes = (
+            ENV_PROGRAM_CACHE_MAX_BYTES.get()
+            if max_bytes is None
+            else max_bytes
+        )
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._build_time = 0.0
 
     def _build_once(self, cache_key):
         # TODO(Aurelius84): Need a gloabl FLAGS to enable/disable to_prim
@@ -1669,8 +1808,15 @@ class ProgramCache:
         item_id = hash(item)
         self._recent_cache_key = item
         self._recent_key = item_id
-        if item_id not in self._caches:
+        if item_id in self._caches:
+            self._hits += 1
+            self._caches.move_to_end(item_id)
+        else:
+            self._misses += 1
+            start = time.perf_counter()
             self._caches[item_id] = self._build_once(item)
+            self._build_time += time.perf_counter() - start
+            self._evict()
             # Note: raise warnings if number of traced program is more than `max_tracing_count`
             current_tracing_count = len(self._caches)
             if current_tracing_count > MAX_TRACED_PROGRAM_COUNT:
@@ -1681,6 +1827,55 @@ class ProgramCache:
 
         return self._caches[item_id]
 
+    def _evict(self):
+        if not self.capacity and not self.max_bytes:
+            return
+        nbytes = {}
+        if self.max_bytes:
+            for key, (_, partial_program) in self._caches.items():
+                nbytes[key] = sum(
+                    _scope_nbytes(scope)
+                    for scope in partial_program._cached_scopes()
+                )
+        total_bytes = sum(nbytes.values())
+        for key in list(self._caches.keys()):
+            exceed_capacity = (
+                self.capacity and len(self._caches) > self.capacity
+            )
+            exceed_bytes = self.max_bytes and total_bytes > self.max_bytes
+            if not (exceed_capacity or exceed_bytes):
+                break
+            if key == self._recent_key:
+                continue
+            _, partial_program = self._caches[key]
+            if not partial_program._release_scopes():
+                continue
+            del self._caches[key]
+            total_bytes -= nbytes.get(key, 0)
+            self._evictions += 1
+            logging_utils.log(
+                2,
+                f"Evict the least recently used program from ProgramCache, {len(self._caches)} programs and {total_bytes} bytes are cached.",
+            )
+
+    def cache_info(self):
+        """
+        Returns the statistics of the cache, including the number of
+        :code:`hits`, :code:`misses` and :code:`evictions`, the total seconds
+        spent in building programs :code:`build_time`, the number of cached
+        programs :code:`size`, and the limits :code:`capacity` and
+        :code:`max_bytes`.
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "build_time": self._build_time,
+            "size": len(self._caches),
+            "capacity": self.capacity,
+            "max_bytes": self.max_bytes,
+        }
+
     def get_program_without_cache(self, cache_key):
         return self._build_once(cache_key=cache_key)
 
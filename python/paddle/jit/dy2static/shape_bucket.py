@@ -0,0 +1,179 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING, Any
+
+import paddle
+from paddle.utils import flatten, pack_sequence_as
+
+if TYPE_CHECKING:
+    import inspect
+    from collections.abc import Sequence
+
+__all__ = []
+
+
+class ShapeBucket:
+    """
+    Describes a dynamic dimension shared by some inputs of a function decorated
+    by ``paddle.jit.to_static``. The inputs are padded along the dimension to
+    the nearest bucket size before calling, so inputs of different lengths in
+    the same bucket reuse one converted program, and the specified outputs are
+    sliced back to the original length.
+
+    Padding changes the values computed along the dimension, so it only fits
+    functions whose results of the original positions are not affected by the
+    padded positions, e.g. element-wise computation, or attention with the
+    padded positions masked out.
+
+    Args:
+        input_axes (dict[str, int]): The argument names and the axes of the
+            bucketed dimension, all of them must have the same length.
+        buckets (str|Sequence[int], optional): ``'pow2'`` to pad the length to
+            the next power of two, or the candidate bucket sizes, a length
+            larger than all the sizes is not padded. Default is ``'pow2'``.
+        output_axes (int|dict[int, int]|None, optional): The axes of the outputs
+            to slice back to the original length. An int slices all the Tensor
+            outputs along the axis, a dict maps the index of a Tensor in the
+            flattened outputs to the axis. Default is None, which slices none
+            of the outputs.
+        pad_value (float, optional): The value to pad with. Default is 0.
+
+    Examples:
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('`paddle.jit.to_static` can not run in xdoctest')
+            >>> import paddle
+            >>> from paddle.jit import ShapeBucket
+
+            >>> bucket = ShapeBucket({'x': 1}, buckets=[8, 16], output_axes=1)
+            >>> @paddle.jit.to_static(shape_buckets=[bucket])
+            ... def func(x):
+            ...     return x * 2
+            ...
+            >>> # both calls use the program converted for length 8
+            >>> print(func(paddle.ones([2, 5])).shape)
+            [2, 5]
+            >>> print(func(paddle.ones([2, 7])).shape)
+            [2, 7]
+    """
+
+    def __init__(
+        self,
+        input_axes: dict[str, int],
+        buckets: str | Sequence[int] = 'pow2',
+        output_axes: int | dict[int, int] | None = None,
+        pad_value: float = 0,
+    ) -> None:
+        if not isinstance(input_axes, dict) or not input_axes:
+            raise TypeError(
+                f"input_axes of ShapeBucket should be a non-empty dict, but received {input_axes}."
+            )
+        if isinstance(buckets, str):
+            if buckets != 'pow2':
+                raise ValueError(
+                    f"buckets of ShapeBucket should be 'pow2' or a sequence of int, but received '{buckets}'."
+                )
+        else:
+            buckets = sorted(buckets)
+            if not buckets or any(
+                not isinstance(size, int) or size <= 0 for size in buckets
+            ):
+                raise ValueError(
+                    f"buckets of ShapeBucket should be positive ints, but received {buckets}."
+                )
+        self.input_axes = input_axes
+        self.buckets = buckets
+        self.output_axes = output_axes
+        self.pad_value = pad_value
+
+    def bucket_size(self, length: int) -> int:
+        if self.buckets == 'pow2':
+            return 1 << max(length - 1, 0).bit_length()
+        index = bisect.bisect_left(self.buckets, length)
+        if index == len(self.buckets):
+            return length
+        return self.buckets[index]
+
+    def __repr__(self) -> str:
+        return f"ShapeBucket(input_axes={self.input_axes}, buckets={self.buckets}, output_axes={self.output_axes})"
+
+
+def _pad(tensor, axis, size, pad_value):
+    pad_shape = list(tensor.shape)
+    pad_shape[axis] = size - pad_shape[axis]
+    padding = paddle.full(pad_shape, pad_value, dtype=tensor.dtype)
+    return paddle.concat([tensor, padding], axis=axis)
+
+
+def pad_to_buckets(
+    shape_buckets: Sequence[ShapeBucket],
+    signature: inspect.Signature,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+):
+    """
+    Pads the inputs to the buckets, returns the padded args and kwargs, and a
+    function to slice the outputs back.
+    """
+    bound = signature.bind(*args, **kwargs)
+    arguments = bound.arguments
+    slices = []
+    for bucket in shape_buckets:
+        length = None
+        for name, axis in bucket.input_axes.items():
+            value = arguments.get(name, None)
+            if not isinstance(value, paddle.Tensor):
+                continue
+            if length is None:
+                length = value.shape[axis]
+            elif value.shape[axis] != length:
+                raise ValueError(
+                    f"Inputs of {bucket} should have the same length, but received {length} and {value.shape[axis]} of '{name}'."
+                )
+        if length is None or length < 0:
+            continue
+        size = bucket.bucket_size(length)
+        if size == length:
+            continue
+        for name, axis in bucket.input_axes.items():
+            value = arguments.get(name, None)
+            if isinstance(value, paddle.Tensor):
+                arguments[name] = _pad(value, axis, size, bucket.pad_value)
+        if bucket.output_axes is not None:
+            slices.append((bucket.output_axes, length))
+
+    def restore_outputs(outputs):
+        if not slices:
+            return outputs
+        flat_outputs = flatten(outputs)
+        for output_axes, length in slices:
+            for i, out in enumerate(flat_outputs):
+                if not isinstance(out, paddle.Tensor):
+                    continue
+                if isinstance(output_axes, int):
+                    axis = output_axes
+                elif i in output_axes:
+                    axis = output_axes[i]
+                else:
+                    continue
+                flat_outputs[i] = paddle.slice(
+                    out, axes=[axis], starts=[0], ends=[length]
+                )
+        return pack_sequence_as(outputs, flat_outputs)
+
+    return bound.args, bound.kwargs, restore_outputs
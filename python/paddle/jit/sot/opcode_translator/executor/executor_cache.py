@@ -15,8 +15,9 @@
 from __future__ import annotations
 
 import gc
+import time
 import traceback
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING
 
 from paddle.base.dygraph.base import sot_simulation_mode_guard
 
@@ -24,6 +25,7 @@ from ...profiler import EventGuard, event_register
 from ...psdb import NO_FALLBACK_CODES
 from ...utils import (
     ENV_SOT_ALLOW_DYNAMIC_SHAPE,
+    ENV_SOT_MAX_CACHE_SIZE,
     BreakGraphError,
     FallbackError,
     InnerError,
@@ -33,18 +35,18 @@ from ...utils import (
     log_do,
 )
 from ..custom_code import CustomCode
-from .guard import Guard
+from .guard_tree import GuardTree
 from .opcode_executor import OpcodeExecutor, OpcodeExecutorBase
 
 if TYPE_CHECKING:
     import types
 
-GuardedFunction = Tuple[CustomCode, Guard]
-GuardedFunctions = List[GuardedFunction]
+    from .guard import Guard
 
 dummy_guard: Guard = lambda frame: True
 dummy_guard.expr = "lambda frame: True"
 dummy_guard.inlined_expr = "lambda frame: True"
+dummy_guard.stringified_guards = []
 
 
 class OpcodeExecutorCache(metaclass=Singleton):
@@ -53,18 +55,23 @@ class OpcodeExecutorCache(metaclass=Singleton):
     This cache is used to store previously translated instructions along with their corresponding guard functions.
 
     Attributes:
-        cache (dict): A dictionary that maps code objects to tuples of a cache getter function and a list of guarded functions.
+        cache (dict): A dictionary that maps code objects to the guard trees of their translations, at most `SOT_MAX_CACHE_SIZE` translations are kept for each code object, the least recently hit one is evicted when exceeded. After `SOT_MAX_CACHE_SIZE` evictions, cache misses of the code object fall back to dygraph instead of translating again.
         translate_count (int): The count of how many instructions have been translated. It is used to test whether the cache hits.
+        translate_time (float): The total seconds spent in translating.
+        evict_count (int): The count of how many translations have been evicted.
     """
 
-    MAX_CACHE_SIZE = 20
-    cache: dict[types.CodeType, GuardedFunctions]
+    cache: dict[types.CodeType, GuardTree]
     translate_count: int
+    translate_time: float
+    evict_count: int
     code_symbolic_inputs: dict[types.CodeType, dict[str, None | dict[int, int]]]
 
     def __init__(self):
         self.cache = {}
         self.translate_count = 0
+        self.translate_time = 0.0
+        self.evict_count = 0
         self.code_symbolic_inputs = {}
 
     def get_symbolic_inputs(
@@ -79,6 +86,8 @@ class OpcodeExecutorCache(metaclass=Singleton):
         """
         self.cache.clear()
         self.translate_count = 0
+        self.translate_time = 0.0
+        self.evict_count = 0
         self.code_symbolic_inputs.clear()
 
     def __call__(self, frame: types.FrameType, **kwargs) -> CustomCode:
@@ -87,66 +96,67 @@ class OpcodeExecutorCache(metaclass=Singleton):
             log(2, f"[Cache]: Firstly call {code}\n")
             new_custom_code, guard_fn = self.translate(frame, **kwargs)
             assert guard_fn is not None
-            self.cache[code] = [(new_custom_code, guard_fn)]
+            self.cache[code] = GuardTree()
+            self.cache[code].add(new_custom_code, guard_fn)
             return new_custom_code
-        guarded_fns = self.cache[code]
-        return self.lookup(frame, guarded_fns, **kwargs)
+        guard_tree = self.cache[code]
+        return self.lookup(frame, guard_tree, **kwargs)
 
     @event_register("lookup")
     def lookup(
-        self, frame: types.FrameType, guarded_fns: GuardedFunctions, **kwargs
+        self, frame: types.FrameType, guard_tree: GuardTree, **kwargs
     ) -> CustomCode:
         """
-        Looks up the cache for a matching code object and returns a custom code object if a matching guard function is found, otherwise None.
+        Looks up the cache for a matching code object and returns a custom code object if a matching guard function is found, otherwise translates the frame and adds the result to the cache.
 
         Args:
             frame (types.FrameType): The frame whose code object needs to be looked up in the cache.
-            guarded_fns (GuardedFunctions): The list of guarded functions associated with the code object.
+            guard_tree (GuardTree): The guard tree of the translations associated with the code object.
 
         Returns:
-            CustomCode: The custom code object if a matching guard function is found, otherwise None.
+            CustomCode: The custom code object of the matched or newly translated code.
         """
+        with EventGuard("try guard"):
+            entry = guard_tree.lookup(frame)
+        if entry is not None:
+            log(
+                2,
+                f"[Cache]: Cache hit, Guard is \n{getattr(entry.guard_fn, 'expr', 'None')}\n",
+            )
+            return entry.custom_code
 
-        if len(guarded_fns) >= self.MAX_CACHE_SIZE:
-            log(2, "[Cache]: Exceed max cache size, skip it\n")
-            return CustomCode(None, False)
-
-        for custom_code, guard_fn in guarded_fns:
-            try:
-                with EventGuard("try guard"):
-                    guard_result = guard_fn(frame)
-                if guard_result:
-                    log(
-                        2,
-                        f"[Cache]: Cache hit, Guard is \n{getattr(guard_fn, 'expr', 'None')}\n",
-                    )
-                    return custom_code
-                else:
-                    log_do(
-                        4,
-                        self.analyse_guard_global_object(guard_fn),
-                    )
-                    log(
-                        2,
-                        f"[Cache]: Cache miss, Guard is \n{getattr(guard_fn, 'expr', 'None')}\n",
-                    )
-                    log_do(
-                        2,
-                        self.analyse_guard_error(guard_fn, frame),
-                    )
-            except Exception as e:
-                log(2, f"[Cache]: Guard function error: {e}\n")
-                log(
-                    2,
-                    f"[Cache]: Guard string is: {getattr(guard_fn, 'expr', 'None')}\n",
-                )
-
-                continue
+        for entry in guard_tree:
+            guard_fn = entry.guard_fn
+            log_do(
+                4,
+                self.analyse_guard_global_object(guard_fn),
+            )
+            log(
+                2,
+                f"[Cache]: Cache miss, Guard is \n{getattr(guard_fn, 'expr', 'None')}\n",
+            )
+            log_do(
+                2,
+                self.analyse_guard_error(guard_fn, frame),
+            )
 
         log(2, "[Cache]: all guards missed\n")
+        max_cache_size = max(ENV_SOT_MAX_CACHE_SIZE.get(), 1)
+        # NOTE: the guards of some code keep failing, e.g. on changing python
+        # scalars, give up translating it rather than evicting forever
+        if guard_tree.num_evicted >= max_cache_size:
+            log(2, "[Cache]: Exceed max cache evictions, skip it\n")
+            return CustomCode(None, False)
         new_custom_code, guard_fn = self.translate(frame, **kwargs)
         if guard_fn is not None:
-            guarded_fns.append((new_custom_code, guard_fn))
+            while len(guard_tree) >= max_cache_size:
+                evicted = guard_tree.evict()
+                self.evict_count += 1
+                log(
+                    2,
+                    f"[Cache]: Exceed max cache size, evict the least recently hit guard \n{getattr(evicted.guard_fn, 'expr', 'None')}\n",
+                )
+            guard_tree.add(new_custom_code, guard_fn)
         return new_custom_code
 
     def before_translate_hook(self, frame: types.FrameType):
@@ -167,7 +177,11 @@ class OpcodeExecutorCache(metaclass=Singleton):
         """
         self.before_translate_hook(frame)
         self.translate_count += 1
-        custom_new_code, guard_fn = start_translate(frame, **kwargs)
+        start = time.perf_counter()
+        try:
+            custom_new_code, guard_fn = start_translate(frame, **kwargs)
+        finally:
+            self.translate_time += time.perf_counter() - start
         return custom_new_code, guard_fn
 
     def analyse_guard_global_object(self, guard_fn):
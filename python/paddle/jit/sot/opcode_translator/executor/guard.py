@@ -135,6 +135,7 @@ def make_guard(stringified_guards: list[StringifiedExpression]) -> Guard:
             guard = lambda frame: True
             guard.expr = "lambda frame: True"
             guard.original_guard = guard
+            guard.stringified_guards = []
             return guard
 
         free_vars = union_free_vars(
@@ -152,6 +153,9 @@ def make_guard(stringified_guards: list[StringifiedExpression]) -> Guard:
         log(3, f"[Guard]: {inlined_guard_expr}\n")
         guard.inlined_expr = inlined_guard_expr
         guard.expr = guard_expr
+        # NOTE: the conditions are kept for GuardTree to share them between
+        # guards of the same code
+        guard.stringified_guards = list(stringified_guards)
 
         assert callable(guard), "guard must be callable."
 
@@ -0,0 +1,222 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Hashable, Tuple, Union
+
+from ...utils import current_symbol_registry, log, switch_symbol_registry
+from .guard import Guard, StringifiedExpression, union_free_vars
+
+if TYPE_CHECKING:
+    import types
+
+    from ..custom_code import CustomCode
+
+# An atom is a single condition of a guard, StringifiedExpression for guards
+# made by `make_guard`, or the guard itself if it is an opaque callable.
+GuardAtom = Tuple[Hashable, Union[StringifiedExpression, Guard]]
+
+
+def guard_atoms(guard_fn: Guard) -> list[GuardAtom]:
+    stringified_guards = getattr(guard_fn, "stringified_guards", None)
+    if stringified_guards is None:
+        return [(("opaque", id(guard_fn)), guard_fn)]
+    return [(atom_key(expr), expr) for expr in stringified_guards]
+
+
+def atom_key(expr: StringifiedExpression) -> Hashable:
+    # NOTE: expressions with same text may capture different objects, e.g.
+    # `__123 == ...`, they are the same condition only if all free variables
+    # are the same objects. The objects are kept alive by the tree, so their
+    # ids are not reused.
+    return (
+        expr.inlined_expr,
+        tuple(
+            sorted((name, id(value)) for name, value in expr.free_vars.items())
+        ),
+    )
+
+
+def compile_atoms(atoms: list[GuardAtom]) -> Guard:
+    if len(atoms) == 1 and not isinstance(atoms[0][1], StringifiedExpression):
+        return atoms[0][1]
+    exprs: list[StringifiedExpression] = [expr for _, expr in atoms]
+    with switch_symbol_registry():
+        registry = current_symbol_registry()
+
+        def register(expr: StringifiedExpression):
+            for sub_expr in expr.sub_exprs:
+                register(sub_expr)
+            registry.request_symbol(expr.registered_expr)
+
+        for expr in exprs:
+            register(expr)
+        guard_expr = "lambda frame: " + " and ".join(
+            [expr.gen_expr() for expr in exprs]
+        )
+    return eval(guard_expr, union_free_vars(*(e.free_vars for e in exprs)))
+
+
+class GuardNode:
+    """
+    A node of GuardTree, holds a segment of conditions shared by all the
+    entries in its subtree, the segment is compiled into a single lambda.
+    """
+
+    __slots__ = ("atoms", "check", "parent", "children", "entries")
+
+    def __init__(self, atoms: list[GuardAtom], parent: GuardNode | None):
+        self.atoms = atoms
+        self.check: Guard | None = None
+        self.parent = parent
+        self.children: list[GuardNode] = []
+        self.entries: list[GuardEntry] = []
+
+    def match(self, frame: types.FrameType) -> bool:
+        if not self.atoms:
+            return True
+        if self.check is None:
+            self.check = compile_atoms(self.atoms)
+        try:
+            return bool(self.check(frame))
+        except Exception as e:
+            log(2, f"[Cache]: Guard function error: {e}\n")
+            return False
+
+    def split(self, length: int):
+        # Move the conditions after `length` and the subtree to a new child
+        lower = GuardNode(self.atoms[length:], self)
+        lower.children, lower.entries = self.children, self.entries
+        for child in lower.children:
+            child.parent = lower
+        for entry in lower.entries:
+            entry.node = lower
+        self.atoms = self.atoms[:length]
+        self.check = None
+        self.children, self.entries = [lower], []
+
+
+class GuardEntry:
+    __slots__ = ("custom_code", "guard_fn", "node", "last_hit")
+
+    def __init__(self, custom_code: CustomCode, guard_fn: Guard):
+        self.custom_code = custom_code
+        self.guard_fn = guard_fn
+        self.node: GuardNode | None = None
+        self.last_hit = 0
+
+
+class GuardTree:
+    """
+    The guarded translations of a code object, organized as a prefix tree of
+    their guard conditions.
+
+    Guards of translations from the same code usually share most conditions
+    (types, dtypes, ranks of the inputs) and differ in a few (a dim or a
+    constant), so each shared condition is checked once per lookup rather
+    than once per translation. Siblings are kept in most-recently-hit order,
+    so the hot translation is found first, and the least recently hit one is
+    evicted when the tree is full.
+    """
+
+    def __init__(self):
+        self.root = GuardNode([], None)
+        self.entries: list[GuardEntry] = []
+        self.tick = 0
+        self.num_evicted = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def add(self, custom_code: CustomCode, guard_fn: Guard) -> GuardEntry:
+        entry = GuardEntry(custom_code, guard_fn)
+        atoms = guard_atoms(guard_fn)
+        node, start = self.root, 0
+        while start < len(atoms):
+            for child in node.children:
+                if child.atoms[0][0] == atoms[start][0]:
+                    length = 1
+                    while (
+                        length < len(child.atoms)
+                        and start + length < len(atoms)
+                        and child.atoms[length][0] == atoms[start + length][0]
+                    ):
+                        length += 1
+                    if length < len(child.atoms):
+                        child.split(length)
+                    node, start = child, start + length
+                    break
+            else:
+                child = GuardNode(atoms[start:], node)
+                node.children.insert(0, child)
+                node, start = child, len(atoms)
+        entry.node = node
+        node.entries.insert(0, entry)
+        self.entries.append(entry)
+        self.touch(entry)
+        return entry
+
+    def touch(self, entry: GuardEntry):
+        self.tick += 1
+        entry.last_hit = self.tick
+        node = entry.node
+        if node.entries[0] is not entry:
+            node.entries.remove(entry)
+            node.entries.insert(0, entry)
+        while node.parent is not None:
+            siblings = node.parent.children
+            if siblings[0] is not node:
+                siblings.remove(node)
+                siblings.insert(0, node)
+            node = node.parent
+
+    def lookup(self, frame: types.FrameType) -> GuardEntry | None:
+        entry = self._lookup(self.root, frame)
+        if entry is not None:
+            self.touch(entry)
+        return entry
+
+    def _lookup(
+        self, node: GuardNode, frame: types.FrameType
+    ) -> GuardEntry | None:
+        if not node.match(frame):
+            return None
+        if node.entries:
+            return node.entries[0]
+        for child in node.children:
+            entry = self._lookup(child, frame)
+            if entry is not None:
+                return entry
+        return None
+
+    def evict(self) -> GuardEntry:
+        """
+        Remove the least recently hit entry and the conditions only used by
+        it, nodes are not merged afterwards to keep each compiled segment
+        made from the guard of one translation.
+        """
+        entry = min(self.entries, key=lambda entry: entry.last_hit)
+        self.entries.remove(entry)
+        node = entry.node
+        node.entries.remove(entry)
+        while node.parent is not None and not (node.entries or node.children):
+            node.parent.children.remove(node)
+            node = node.parent
+        entry.node = None
+        self.num_evicted += 1
+        return entry
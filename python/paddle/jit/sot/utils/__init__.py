@@ -21,12 +21,14 @@ from .envs import (  # noqa: F401
     ENV_SOT_ENABLE_FASTER_GUARD,
     ENV_SOT_EXPORT,
     ENV_SOT_LOG_LEVEL,
+    ENV_SOT_MAX_CACHE_SIZE,
     ENV_SOT_WITH_CONTROL_FLOW,
     ENV_STRICT_MODE,
     allow_dynamic_shape_guard,
     cost_model_guard,
     export_guard,
     faster_guard_guard,
+    max_cache_size_guard,
     min_graph_size_guard,
     sot_step_profiler_guard,
     strict_mode_guard,
@@ -42,6 +42,7 @@ ENV_SOT_ENABLE_FASTER_GUARD = BooleanEnvironmentVariable(
     "SOT_ENABLE_FASTER_GUARD",
     False,
 )
+ENV_SOT_MAX_CACHE_SIZE = IntegerEnvironmentVariable("SOT_MAX_CACHE_SIZE", 20)
 ENV_SOT_EVENT_LEVEL = IntegerEnvironmentVariable("SOT_EVENT_LEVEL", 0)
 ENV_ENABLE_SOT_STEP_PROFILER = BooleanEnvironmentVariable(
     "ENABLE_SOT_STEP_PROFILER", False
@@ -87,6 +88,12 @@ def allow_dynamic_shape_guard(value: bool):
         yield
 
 
+@contextmanager
+def max_cache_size_guard(value: int):
+    with EnvironmentVariableGuard(ENV_SOT_MAX_CACHE_SIZE, value):
+        yield
+
+
 @contextmanager
 def faster_guard_guard(value: bool):
     with EnvironmentVariableGuard(ENV_SOT_ENABLE_FASTER_GUARD, value):
@@ -364,6 +364,10 @@ class Precision(Metric):
     Args:
         name (str, optional): String name of the metric instance.
             Default is `precision`.
+        on_device (bool, optional): Keyword only. Whether to accumulate the
+            states on the device of the inputs if they are Tensors, which
+            avoids copying every mini-batch to host, the states are copied
+            back in :code:`accumulate`. Default is False.
 
     Examples:
         .. code-block:: python
@@ -421,12 +425,19 @@ class Precision(Metric):
     fp: int
 
     def __init__(
-        self, name: str = 'precision', *args: Any, **kwargs: Any
+        self,
+        name: str = 'precision',
+        *args: Any,
+        on_device: bool = False,
+        **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
         self.tp = 0  # true positive
         self.fp = 0  # false positive
         self._name = name
+        self._on_device = on_device
+        # [tp, fp] accumulated on device, merged into tp and fp lazily
+        self._device_stats: Tensor | None = None
 
     def update(
         self,
@@ -444,6 +455,27 @@ class Precision(Metric):
                 the shape should keep the same as preds.
                 The data type is 'int32' or 'int64'.
         """
+        if (
+            self._on_device
+            and isinstance(preds, paddle.Tensor)
+            and isinstance(labels, paddle.Tensor)
+        ):
+            pred_pos = paddle.floor(preds.reshape([-1]) + 0.5) == 1
+            label_pos = labels.reshape([-1]) == 1
+            stats = paddle.stack(
+                [
+                    paddle.logical_and(pred_pos, label_pos).astype('int64'),
+                    paddle.logical_and(
+                        pred_pos, paddle.logical_not(label_pos)
+                    ).astype('int64'),
+                ]
+            ).sum(axis=1)
+            if self._device_stats is None:
+                self._device_stats = stats
+            else:
+                self._device_stats = self._device_stats + stats
+            return
+
         if isinstance(preds, paddle.Tensor):
             preds = np.array(preds)
         elif not _is_numpy_(preds):
@@ -454,17 +486,17 @@ class Precision(Metric):
         elif not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
 
-        sample_num = labels.shape[0]
-        preds = np.floor(preds + 0.5).astype("int32")
+        pred_pos = np.floor(preds + 0.5).astype("int32").reshape(-1) == 1
+        tp = int(np.count_nonzero(pred_pos & (labels.reshape(-1) == 1)))
+        self.tp += tp
+        self.fp += int(np.count_nonzero(pred_pos)) - tp
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+    def _sync_device_stats(self) -> None:
+        if self._device_stats is not None:
+            tp, fp = self._device_stats.numpy().tolist()
+            self.tp += tp
+            self.fp += fp
+            self._device_stats = None
 
     def reset(self) -> None:
         """
@@ -472,6 +504,7 @@ class Precision(Metric):
         """
         self.tp = 0
         self.fp = 0
+        self._device_stats = None
 
     def accumulate(self) -> float:
         """
@@ -480,6 +513,7 @@ class Precision(Metric):
         Returns:
             A scaler float: results of the calculated precision.
         """
+        self._sync_device_stats()
         ap = self.tp + self.fp
         return float(self.tp) / ap if ap != 0 else 0.0
 
@@ -505,6 +539,10 @@ class Recall(Metric):
     Args:
         name (str, optional): String name of the metric instance.
             Default is `recall`.
+        on_device (bool, optional): Keyword only. Whether to accumulate the
+            states on the device of the inputs if they are Tensors, which
+            avoids copying every mini-batch to host, the states are copied
+            back in :code:`accumulate`. Default is False.
 
     Examples:
         .. code-block:: python
@@ -561,11 +599,20 @@ class Recall(Metric):
     tp: int
     fn: int
 
-    def __init__(self, name: str = 'recall', *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        name: str = 'recall',
+        *args: Any,
+        on_device: bool = False,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(*args, **kwargs)
         self.tp = 0  # true positive
         self.fn = 0  # false negative
         self._name = name
+        self._on_device = on_device
+        # [tp, fn] accumulated on device, merged into tp and fn lazily
+        self._device_stats: Tensor | None = None
 
     def update(
         self,
@@ -583,6 +630,29 @@ class Recall(Metric):
                 the shape should keep the same as preds.
                 Shape: [batch_size, 1], Dtype: 'int32' or 'int64'.
         """
+        if (
+            self._on_device
+            and isinstance(preds, paddle.Tensor)
+            and isinstance(labels, paddle.Tensor)
+        ):
+            preds = preds.reshape([-1])
+            # NOTE: same as `np.rint(preds) == 1`, which rounds half to even
+            pred_pos = paddle.logical_and(preds > 0.5, preds < 1.5)
+            label_pos = labels.reshape([-1]) == 1
+            stats = paddle.stack(
+                [
+                    paddle.logical_and(label_pos, pred_pos).astype('int64'),
+                    paddle.logical_and(
+                        label_pos, paddle.logical_not(pred_pos)
+                    ).astype('int64'),
+                ]
+            ).sum(axis=1)
+            if self._device_stats is None:
+                self._device_stats = stats
+            else:
+                self._device_stats = self._device_stats + stats
+            return
+
         if isinstance(preds, paddle.Tensor):
             preds = np.array(preds)
         elif not _is_numpy_(preds):
@@ -593,17 +663,18 @@ class Recall(Metric):
         elif not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
 
-        sample_num = labels.shape[0]
-        preds = np.rint(preds).astype("int32")
+        label_pos = labels.reshape(-1) == 1
+        pred_pos = np.rint(preds).astype("int32").reshape(-1) == 1
+        tp = int(np.count_nonzero(label_pos & pred_pos))
+        self.tp += tp
+        self.fn += int(np.count_nonzero(label_pos)) - tp
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
+    def _sync_device_stats(self) -> None:
+        if self._device_stats is not None:
+            tp, fn = self._device_stats.numpy().tolist()
+            self.tp += tp
+            self.fn += fn
+            self._device_stats = None
 
     def accumulate(self) -> float:
         """
@@ -612,6 +683,7 @@ class Recall(Metric):
         Returns:
             A scaler float: results of the calculated Recall.
         """
+        self._sync_device_stats()
         recall = self.tp + self.fn
         return float(self.tp) / recall if recall != 0 else 0.0
 
@@ -621,6 +693,7 @@ class Recall(Metric):
         """
         self.tp = 0
         self.fn = 0
+        self._device_stats = None
 
     def name(self) -> str:
         """
@@ -633,7 +706,9 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
+    The predictions are counted into histograms of the thresholds batch by
+    batch, and the histograms can be kept on device to avoid copying every
+    mini-batch to host.
 
     The `auc` function creates four local variables, `true_positives`,
     `true_negatives`, `false_positives` and `false_negatives` that are used to
@@ -650,6 +725,11 @@ class Auc(Metric):
             discretizing the roc curve. Default is 4095.
         name (str, optional): String name of the metric instance. Default
             is `auc`.
+        on_device (bool, optional): Keyword only. Whether to accumulate the
+            histograms on the device of the inputs if they are Tensors, the
+            histograms are copied back in :code:`accumulate`. Probabilities
+            are not checked on device, ones out of [0, 1] are counted in the
+            first or last threshold. Default is False.
 
     "NOTE: only implement the ROC curve type via Python now."
 
@@ -715,6 +795,7 @@ class Auc(Metric):
         num_thresholds: int = 4095,
         name: str = 'auc',
         *args: Any,
+        on_device: bool = False,
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
@@ -725,6 +806,10 @@ class Auc(Metric):
         self._stat_pos = np.zeros(_num_pred_buckets)
         self._stat_neg = np.zeros(_num_pred_buckets)
         self._name = name
+        self._on_device = on_device
+        # the negative histogram followed by the positive one on device,
+        # merged into _stat_neg and _stat_pos lazily
+        self._device_stats: Tensor | None = None
 
     def update(
         self,
@@ -737,11 +822,40 @@ class Auc(Metric):
         Args:
             preds (numpy.array): An numpy array in the shape of
                 (batch_size, 2), preds[i][j] denotes the probability of
-                classifying the instance i into the class j.
+                classifying the instance i into the class j. Probabilities
+                out of [0, 1] raise an error, except with :attr:`on_device`
+                where they are counted in the first or last threshold.
             labels (numpy.array): an numpy array in the shape of
                 (batch_size, 1), labels[i] is either o or 1,
                 representing the label of the instance i.
         """
+        _num_pred_buckets = self._num_thresholds + 1
+        if (
+            self._on_device
+            and isinstance(preds, paddle.Tensor)
+            and isinstance(labels, paddle.Tensor)
+        ):
+            # NOTE: checking the bucket indices as the numpy path below needs
+            # a sync with the device, so they are clipped instead, and
+            # probabilities out of [0, 1] are counted in the first or last
+            # bucket rather than raising an error
+            bin_idx = paddle.clip(
+                preds[:, 1] * self._num_thresholds, 0, self._num_thresholds
+            ).astype('int64')
+            label_pos = (labels.reshape([-1]) != 0).astype('int64')
+            index = bin_idx + label_pos * _num_pred_buckets
+            if self._device_stats is None:
+                self._device_stats = paddle.zeros(
+                    [2 * _num_pred_buckets], dtype='float64'
+                )
+            self._device_stats = paddle.index_add(
+                self._device_stats,
+                index,
+                0,
+                paddle.ones_like(index, dtype='float64'),
+            )
+            return
+
         if isinstance(labels, paddle.Tensor):
             labels = np.array(labels)
         elif not _is_numpy_(labels):
@@ -752,14 +866,25 @@ class Auc(Metric):
         elif not _is_numpy_(preds):
             raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
 
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+        bin_idx = (preds[:, 1] * self._num_thresholds).astype("int64")
+        assert bin_idx.size == 0 or (
+            bin_idx.min() >= 0 and bin_idx.max() <= self._num_thresholds
+        ), "The probabilities in 'preds' should be in [0, 1]."
+        label_pos = labels.reshape(-1) != 0
+        self._stat_pos += np.bincount(
+            bin_idx[label_pos], minlength=_num_pred_buckets
+        )
+        self._stat_neg += np.bincount(
+            bin_idx[~label_pos], minlength=_num_pred_buckets
+        )
+
+    def _sync_device_stats(self) -> None:
+        if self._device_stats is not None:
+            stats = self._device_stats.numpy()
+            _num_pred_buckets = self._num_thresholds + 1
+            self._stat_neg += stats[:_num_pred_buckets]
+            self._stat_pos += stats[_num_pred_buckets:]
+            self._device_stats = None
 
     @staticmethod
     def trapezoid_area(x1: float, x2: float, y1: float, y2: float) -> float:
@@ -772,20 +897,21 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(
-                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
+        self._sync_device_stats()
+        # walk the buckets from the highest threshold, each one adds the
+        # trapezoid between the previous and current cumulative counts
+        tot_pos = np.cumsum(self._stat_pos[::-1])
+        tot_neg = np.cumsum(self._stat_neg[::-1])
+        tot_pos_prev = np.concatenate([[0.0], tot_pos[:-1]])
+        tot_neg_prev = np.concatenate([[0.0], tot_neg[:-1]])
+        auc = float(
+            np.sum(
+                self.trapezoid_area(
+                    tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
+                )
             )
-            idx -= 1
+        )
+        tot_pos, tot_neg = float(tot_pos[-1]), float(tot_neg[-1])
 
         return (
             auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
@@ -798,6 +924,7 @@ class Auc(Metric):
         _num_pred_buckets = self._num_thresholds + 1
         self._stat_pos = np.zeros(_num_pred_buckets)
         self._stat_neg = np.zeros(_num_pred_buckets)
+        self._device_stats = None
 
     def name(self) -> str:
         """
@@ -12,16 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import collections
+import itertools
 import re
 from enum import Enum
 
+import numpy as np
+
 from paddle.base.core import TracerEventType, TracerMemEventType
 from paddle.utils.flops import flops
 
 from .statistic_helper import (
-    intersection_ranges,
-    merge_ranges,
-    merge_self_ranges,
+    as_range_array,
+    intersection_range_arrays,
+    merge_range_arrays,
+    merge_self_range_array,
     sum_ranges,
 )
 
@@ -44,6 +48,7 @@ _AllTracerEventType = [
 ]
 
 _CommunicationOpName = ['allreduce', 'broadcast', 'rpc']
+_CommunicationOpPattern = re.compile('|'.join(_CommunicationOpName))
 
 
 class SortedKeys(Enum):
@@ -96,6 +101,10 @@ class HostStatisticNode:
 
     def __init__(self, hostnode):
         self.hostnode = hostnode
+        # NOTE: type and name are looked up for every node in summaries, keep
+        # them on the wrapper instead of forwarding through __getattr__.
+        self.type = hostnode.type
+        self.name = hostnode.name
         self.children_node = []
         self.runtime_node = []
         self.cpu_time = 0
@@ -117,19 +126,34 @@ class HostStatisticNode:
                 )
 
     def cal_statistic(self):
+        # NOTE: Visit the subtree in reversed pre-order so that children are
+        # calculated before their parent, deep trees would exceed the
+        # recursion limit otherwise.
+        nodes = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.children_node)
+        for node in reversed(nodes):
+            node._cal_self_statistic()
+
+    def _cal_self_statistic(self):
+        r"""
+        Calculate metrics of this node, assuming that all its children have
+        been calculated.
+        """
         self.cpu_time = self.hostnode.end_ns - self.hostnode.start_ns
         self.self_cpu_time = self.cpu_time
         self.cal_flops()
         for child in self.children_node:
-            child.cal_flops()
-            child.cal_statistic()
             self.gpu_time += child.gpu_time
             self.general_gpu_time += child.general_gpu_time
             self.self_cpu_time -= child.end_ns - child.start_ns
             self.flops += child.flops
 
         for rt in self.runtime_node:
-            rt.cal_statistic()
+            rt._cal_self_statistic()
             self.self_cpu_time -= rt.end_ns - rt.start_ns
             self.gpu_time += rt.gpu_time
             self.self_gpu_time += rt.gpu_time
@@ -334,6 +358,143 @@ def wrap_tree(nodetrees):
     return node_statistic_tree, newresults
 
 
+def _unique_in_order(values):
+    uniques, first_indices = np.unique(values, return_index=True)
+    return uniques[np.argsort(first_indices)]
+
+
+class EventColumns:
+    r"""
+    Columnar view of the host, runtime and device events in node trees except
+    root nodes, which stores each attribute as a numpy array with one entry
+    per event.
+
+    Events are laid out in the same depth-first order as ``traverse_tree``.
+    Every runtime event follows its host event and every device event follows
+    its runtime event, so the events under a host event are the rows in
+    ``[row, subtree_ends[row])``.
+    """
+
+    HOST = 0
+    RUNTIME = 1
+    DEVICE = 2
+
+    def __init__(self, nodetrees):
+        self.thread_ids = list(nodetrees.keys())  # thread code -> thread id
+        # (start_ns, end_ns, kind, thread code, owner row, device_id,
+        #  stream_id, is_communication) of each event
+        rows = []
+        node_types = []
+        subtree_ends = {}
+        append_row = rows.append
+        append_type = node_types.append
+
+        for thread, rootnode in enumerate(nodetrees.values()):
+            stack = [(child, -1) for child in rootnode.children_node]
+            while stack:
+                hostnode, row = stack.pop()
+                if row >= 0:
+                    subtree_ends[row] = len(rows)
+                    continue
+                row = len(rows)
+                node_type = hostnode.type
+                append_type(node_type)
+                append_row(
+                    (
+                        hostnode.start_ns,
+                        hostnode.end_ns,
+                        self.HOST,
+                        thread,
+                        row,
+                        -1,
+                        -1,
+                        node_type == TracerEventType.Communication
+                        or (
+                            node_type == TracerEventType.Operator
+                            and _CommunicationOpPattern.search(
+                                hostnode.name.lower()
+                            )
+                            is not None
+                        ),
+                    )
+                )
+                stack.append((hostnode, row))
+                for runtimenode in hostnode.runtime_node:
+                    append_type(runtimenode.type)
+                    append_row(
+                        (
+                            runtimenode.start_ns,
+                            runtimenode.end_ns,
+                            self.RUNTIME,
+                            thread,
+                            row,
+                            -1,
+                            -1,
+                            False,
+                        )
+                    )
+                    for devicenode in runtimenode.device_node:
+                        kernel_name = devicenode.name.lower()
+                        append_type(devicenode.type)
+                        append_row(
+                            (
+                                devicenode.start_ns,
+                                devicenode.end_ns,
+                                self.DEVICE,
+                                thread,
+                                row,
+                                devicenode.device_id,
+                                devicenode.stream_id,
+                                'nccl' in kernel_name or 'xccl' in kernel_name,
+                            )
+                        )
+                stack.extend((child, -1) for child in hostnode.children_node)
+
+        # type code -> TracerEventType, in the order they are met
+        self.event_types = list(dict.fromkeys(node_types))
+        type_codes = {t: code for code, t in enumerate(self.event_types)}
+        self.types = np.fromiter(
+            map(type_codes.__getitem__, node_types),
+            dtype=np.int32,
+            count=len(node_types),
+        )
+        columns = np.fromiter(
+            itertools.chain.from_iterable(rows),
+            dtype=np.int64,
+            count=len(rows) * 8,
+        ).reshape([-1, 8])
+        self.ranges = columns[:, :2]
+        self.kinds = columns[:, 2].astype(np.int8)
+        self.threads = columns[:, 3].astype(np.int32)
+        # row of the host event which the event belongs to
+        self.owners = columns[:, 4].copy()
+        self.device_ids = columns[:, 5].copy()
+        self.stream_ids = columns[:, 6].copy()
+        # host events of communication, or device events named with nccl
+        self.is_communication = columns[:, 7].astype(bool)
+        self.subtree_ends = np.arange(1, len(rows) + 1, dtype=np.int64)
+        self.subtree_ends[list(subtree_ends.keys())] = list(
+            subtree_ends.values()
+        )
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def type_mask(self, event_type):
+        if event_type not in self.event_types:
+            return np.zeros(len(self), dtype=bool)
+        return self.types == self.event_types.index(event_type)
+
+    def in_subtrees(self, rows):
+        r"""
+        Return a mask of the events under any of the given host event rows.
+        """
+        counts = np.zeros(len(self) + 1, dtype=np.int64)
+        np.add.at(counts, rows, 1)
+        np.add.at(counts, self.subtree_ends[rows], -1)
+        return np.cumsum(counts[:-1]) > 0
+
+
 class TimeRangeSummary:
     r"""
     Analyse time ranges for each TracerEventType, and summarize the time.
@@ -350,50 +511,41 @@ class TimeRangeSummary:
         )
         self.call_times = collections.defaultdict(int)
 
-    def parse(self, nodetrees):
+    def parse(self, nodetrees, event_columns=None):
         r"""
         Analysis node trees in profiler result, and get time range for different tracer event type.
         """
-        thread2hostnodes = traverse_tree(nodetrees)
-        for threadid, hostnodes in thread2hostnodes.items():
-            CPUTimeRange = collections.defaultdict(list)
-            GPUTimeRange = collections.defaultdict(
-                lambda: collections.defaultdict(
-                    lambda: collections.defaultdict(list)
-                )
-            )  # device_id/type/stream_id
-            for hostnode in hostnodes[1:]:  # skip root node
-                CPUTimeRange[hostnode.type].append(
-                    (hostnode.start_ns, hostnode.end_ns)
-                )
-                self.call_times[hostnode.type] += 1
-                for runtimenode in hostnode.runtime_node:
-                    CPUTimeRange[runtimenode.type].append(
-                        (runtimenode.start_ns, runtimenode.end_ns)
-                    )
-                    self.call_times[runtimenode.type] += 1
-                    for devicenode in runtimenode.device_node:
-                        GPUTimeRange[devicenode.device_id][devicenode.type][
-                            devicenode.stream_id
-                        ].append((devicenode.start_ns, devicenode.end_ns))
-                        self.call_times[devicenode.type] += 1
-
-            for event_type, time_ranges in CPUTimeRange.items():
-                time_ranges = merge_self_ranges(time_ranges, is_sorted=False)
-                self.CPUTimeRange[event_type] = merge_ranges(
-                    self.CPUTimeRange[event_type], time_ranges, is_sorted=True
+        if event_columns is None:
+            event_columns = EventColumns(nodetrees)
+        types = event_columns.types
+        event_types = event_columns.event_types
+        call_counts = np.bincount(types, minlength=len(event_types))
+        for type_code, event_type in enumerate(event_types):
+            self.call_times[event_type] += int(call_counts[type_code])
+
+        # NOTE: Keys are inserted in the order they are met in node trees, to
+        # keep the order of rows with the same time in summary tables.
+        is_device = event_columns.kinds == EventColumns.DEVICE
+        cpu_rows = np.flatnonzero(~is_device)
+        for type_code in _unique_in_order(types[cpu_rows]):
+            event_type = event_types[type_code]
+            self.CPUTimeRange[event_type] = merge_range_arrays(
+                self.CPUTimeRange[event_type],
+                event_columns.ranges[cpu_rows[types[cpu_rows] == type_code]],
+            )
+        gpu_rows = np.flatnonzero(is_device)
+        device_ids = event_columns.device_ids[gpu_rows]
+        for device_id in _unique_in_order(device_ids):
+            device_rows = gpu_rows[device_ids == device_id]
+            device_id = int(device_id)
+            for type_code in _unique_in_order(types[device_rows]):
+                event_type = event_types[type_code]
+                self.GPUTimeRange[device_id][event_type] = merge_range_arrays(
+                    self.GPUTimeRange[device_id][event_type],
+                    event_columns.ranges[
+                        device_rows[types[device_rows] == type_code]
+                    ],
                 )
-            for device_id, device_time_ranges in GPUTimeRange.items():
-                for event_type, event_time_ranges in device_time_ranges.items():
-                    for stream_id, time_ranges in event_time_ranges.items():
-                        time_ranges = merge_self_ranges(
-                            time_ranges, is_sorted=False
-                        )
-                        self.GPUTimeRange[device_id][event_type] = merge_ranges(
-                            self.GPUTimeRange[device_id][event_type],
-                            time_ranges,
-                            is_sorted=True,
-                        )
 
         for event_type, time_ranges in self.CPUTimeRange.items():
             self.CPUTimeRangeSum[event_type] = sum_ranges(time_ranges)
@@ -420,84 +572,76 @@ class DistributedSummary:
     """
 
     def __init__(self):
-        self.cpu_communication_range = []
-        self.gpu_communication_range = []
-        self.communication_range = []
-        self.computation_range = []
-        self.overlap_range = []
+        self.cpu_communication_range = as_range_array([])
+        self.gpu_communication_range = as_range_array([])
+        self.communication_range = as_range_array([])
+        self.computation_range = as_range_array([])
+        self.overlap_range = as_range_array([])
         self.cpu_calls = 0
         self.gpu_calls = 0
 
-    def parse(self, nodetrees):
+    def parse(self, nodetrees, event_columns=None):
         '''
         Collect all communication and computation time ranges.
         '''
-        thread2hostnodes = traverse_tree(nodetrees)
-        for threadid, hostnodes in thread2hostnodes.items():
-            for hostnode in hostnodes[1:]:  # skip root node
-                # case 1: TracerEventType is Communication
-                if hostnode.type == TracerEventType.Communication:
-                    self.cpu_communication_range.append(
-                        (hostnode.start_ns, hostnode.end_ns)
-                    )
-                    device_nodes = get_device_nodes(hostnode)
-                    for device_node in device_nodes:
-                        if device_node.type == TracerEventType.Kernel:
-                            self.gpu_communication_range.append(
-                                (device_node.start_ns, device_node.end_ns)
-                            )
-
-                # case 2: TracerEventType is Operator but is communication op
-                elif hostnode.type == TracerEventType.Operator and any(
-                    name in hostnode.name.lower()
-                    for name in _CommunicationOpName
-                ):
-                    self.cpu_communication_range.append(
-                        (hostnode.start_ns, hostnode.end_ns)
-                    )
-                    device_nodes = get_device_nodes(hostnode)
-                    for device_node in device_nodes:
-                        if device_node.type == TracerEventType.Kernel:
-                            self.gpu_communication_range.append(
-                                (device_node.start_ns, device_node.end_ns)
-                            )
+        if event_columns is None:
+            event_columns = EventColumns(nodetrees)
+        kinds = event_columns.kinds
+        is_communication = event_columns.is_communication
+        # case 1 and case 2: TracerEventType is Communication, or is Operator
+        # but is communication op, collect all kernels under it
+        communication_rows = np.flatnonzero(
+            (kinds == EventColumns.HOST) & is_communication
+        )
+        is_kernel = (kinds == EventColumns.DEVICE) & event_columns.type_mask(
+            TracerEventType.Kernel
+        )
+        owned_by_communication = is_communication[event_columns.owners]
+        # case 3: Others, filter kernels named with nccl
+        is_other_kernel = is_kernel & ~owned_by_communication
+        cpu_communication_range = event_columns.ranges[communication_rows]
+        gpu_communication_range = event_columns.ranges[
+            is_kernel & event_columns.in_subtrees(communication_rows)
+            | is_other_kernel & is_communication
+        ]
+        computation_range = event_columns.ranges[
+            is_other_kernel & ~is_communication
+        ]
 
-                # case 3: Others, filter kernels named with nccl
-                else:
-                    for runtimenode in hostnode.runtime_node:
-                        for devicenode in runtimenode.device_node:
-                            if devicenode.type == TracerEventType.Kernel:
-                                kernel_name = devicenode.name.lower()
-                                if (
-                                    'nccl' in kernel_name
-                                    or 'xccl' in kernel_name
-                                ):
-                                    self.gpu_communication_range.append(
-                                        (devicenode.start_ns, devicenode.end_ns)
-                                    )
-                                else:
-                                    self.computation_range.append(
-                                        (devicenode.start_ns, devicenode.end_ns)
-                                    )
-        self.cpu_calls = len(set(self.cpu_communication_range))
-        self.gpu_calls = len(set(self.gpu_communication_range))
-        self.cpu_communication_range = merge_self_ranges(
-            self.cpu_communication_range, is_sorted=False
+        cpu_communication_range = np.concatenate(
+            [
+                as_range_array(self.cpu_communication_range),
+                cpu_communication_range,
+            ]
+        )
+        gpu_communication_range = np.concatenate(
+            [
+                as_range_array(self.gpu_communication_range),
+                gpu_communication_range,
+            ]
+        )
+        self.cpu_calls = len(np.unique(cpu_communication_range, axis=0))
+        self.gpu_calls = len(np.unique(gpu_communication_range, axis=0))
+        cpu_communication_range = merge_self_range_array(
+            cpu_communication_range
         )
-        self.gpu_communication_range = merge_self_ranges(
-            self.gpu_communication_range, is_sorted=False
+        gpu_communication_range = merge_self_range_array(
+            gpu_communication_range
         )
-        self.communication_range = merge_ranges(
-            self.cpu_communication_range,
-            self.gpu_communication_range,
-            is_sorted=True,
+        communication_range = merge_range_arrays(
+            cpu_communication_range, gpu_communication_range, is_sorted=True
         )
-        self.computation_range = merge_self_ranges(
-            self.computation_range, is_sorted=False
+        computation_range = merge_range_arrays(
+            self.computation_range, computation_range
         )
-        self.overlap_range = intersection_ranges(
-            self.communication_range, self.computation_range, is_sorted=True
+        overlap_range = intersection_range_arrays(
+            communication_range, computation_range, is_sorted=True
         )
+        self.cpu_communication_range = cpu_communication_range
+        self.gpu_communication_range = gpu_communication_range
+        self.communication_range = communication_range
+        self.computation_range = computation_range
+        self.overlap_range = overlap_range
 
 
 class EventSummary:
@@ -865,9 +1009,10 @@ class StatisticData:
         self.event_summary = EventSummary()
         self.distributed_summary = DistributedSummary()
         self.memory_summary = MemorySummary()
-        self.time_range_summary.parse(node_trees)
+        event_columns = EventColumns(node_trees)
+        self.time_range_summary.parse(node_trees, event_columns)
         self.event_summary.parse(node_trees)
-        self.distributed_summary.parse(node_trees)
+        self.distributed_summary.parse(node_trees, event_columns)
         self.memory_summary.parse(node_trees)
 
 
@@ -1024,7 +1169,7 @@ def _build_table(
         ) in statistic_data.time_range_summary.CPUTimeRangeSum.items():
             if event_type != TracerEventType.Communication:
                 cpu_type_time[event_type] = value
-        if statistic_data.distributed_summary.cpu_communication_range:
+        if len(statistic_data.distributed_summary.cpu_communication_range):
             cpu_type_time[TracerEventType.Communication] = sum_ranges(
                 statistic_data.distributed_summary.cpu_communication_range
             )
@@ -1061,12 +1206,12 @@ def _build_table(
             device_time_ranges,
         ) in statistic_data.time_range_summary.GPUTimeRange.items():
             for event_type, time_range in device_time_ranges.items():
-                gpu_time_range[event_type] = merge_ranges(
+                gpu_time_range[event_type] = merge_range_arrays(
                     gpu_time_range[event_type], time_range, is_sorted=True
                 )
         for event_type, time_range in gpu_time_range.items():
             gpu_type_time[event_type] = sum_ranges(time_range)
-        if statistic_data.distributed_summary.gpu_communication_range:
+        if len(statistic_data.distributed_summary.gpu_communication_range):
             gpu_type_time[TracerEventType.Communication] = sum_ranges(
                 statistic_data.distributed_summary.gpu_communication_range
             )
@@ -1228,7 +1373,7 @@ def _build_table(
 
     if views is None or SummaryView.DistributedView in views:
         # ----- Print Distribution Summary Report ----- #
-        if statistic_data.distributed_summary.communication_range:
+        if len(statistic_data.distributed_summary.communication_range):
             headers = [
                 'Name',
                 'Total Time',
@@ -13,216 +13,137 @@
 # limitations under the License.
 
 
+import numpy as np
+
+
+def as_range_array(ranges):
+    r"""
+    Convert time ranges into an int64 array of shape [N, 2], which holds the
+    start in the first column and the end in the second column.
+    """
+    if isinstance(ranges, np.ndarray) and ranges.dtype == np.int64:
+        return ranges.reshape([-1, 2])
+    if len(ranges) == 0:
+        return np.empty([0, 2], dtype=np.int64)
+    return np.asarray(ranges, dtype=np.int64).reshape([-1, 2])
+
+
+def to_range_list(ranges):
+    r"""
+    Convert a range array back into a list of (start, end) tuples.
+    """
+    return list(map(tuple, as_range_array(ranges).tolist()))
+
+
 def sum_ranges(ranges):
-    result = 0
-    for time_range in ranges:
-        result += time_range[1] - time_range[0]
-    return result
+    ranges = as_range_array(ranges)
+    return int((ranges[:, 1] - ranges[:, 0]).sum())
+
+
+def merge_self_range_array(ranges, is_sorted=False):
+    r"""
+    Merge overlapped or adjacent ranges in an array, the result is sorted and
+    does not overlap.
+    """
+    ranges = as_range_array(ranges)
+    if len(ranges) == 0:
+        return ranges
+    if not is_sorted:
+        ranges = ranges[np.lexsort((ranges[:, 1], ranges[:, 0]))]
+    max_ends = np.maximum.accumulate(ranges[:, 1])
+    # NOTE: A range begins a new merged range when it starts after every
+    # range before it has ended.
+    is_head = np.empty(len(ranges), dtype=bool)
+    is_head[0] = True
+    is_head[1:] = ranges[1:, 0] > max_ends[:-1]
+    heads = np.flatnonzero(is_head)
+    tails = np.append(heads[1:], len(ranges)) - 1
+    return np.stack([ranges[heads, 0], max_ends[tails]], axis=1)
+
+
+def merge_range_arrays(range_array1, range_array2, is_sorted=False):
+    r"""
+    Union of two range arrays.
+    """
+    range_array1 = as_range_array(range_array1)
+    range_array2 = as_range_array(range_array2)
+    if len(range_array1) == 0:
+        return merge_self_range_array(range_array2, is_sorted)
+    if len(range_array2) == 0:
+        return merge_self_range_array(range_array1, is_sorted)
+    return merge_self_range_array(
+        np.concatenate([range_array1, range_array2]), is_sorted=False
+    )
+
+
+def intersection_range_arrays(range_array1, range_array2, is_sorted=False):
+    r"""
+    Intersection of two range arrays.
+    """
+    if not is_sorted:
+        range_array1 = merge_self_range_array(range_array1)
+        range_array2 = merge_self_range_array(range_array2)
+    range_array1 = as_range_array(range_array1)
+    range_array2 = as_range_array(range_array2)
+    if len(range_array1) == 0 or len(range_array2) == 0:
+        return np.empty([0, 2], dtype=np.int64)
+    # NOTE: Both arrays are sorted and do not overlap, so the ranges of
+    # range_array2 overlapping range_array1[i] are range_array2[lo[i]:hi[i]].
+    lo = np.searchsorted(range_array2[:, 1], range_array1[:, 0], side='right')
+    hi = np.searchsorted(range_array2[:, 0], range_array1[:, 1], side='left')
+    counts = np.maximum(hi - lo, 0)
+    idx1 = np.repeat(np.arange(len(range_array1)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    idx2 = np.repeat(lo, counts) + offsets
+    return np.stack(
+        [
+            np.maximum(range_array1[idx1, 0], range_array2[idx2, 0]),
+            np.minimum(range_array1[idx1, 1], range_array2[idx2, 1]),
+        ],
+        axis=1,
+    )
+
+
+def subtract_range_arrays(range_array1, range_array2, is_sorted=False):
+    r"""
+    Ranges of range_array1 which are not covered by range_array2.
+    """
+    if not is_sorted:
+        range_array1 = merge_self_range_array(range_array1)
+        range_array2 = merge_self_range_array(range_array2)
+    range_array1 = as_range_array(range_array1)
+    range_array2 = as_range_array(range_array2)
+    if len(range_array1) == 0 or len(range_array2) == 0:
+        return range_array1
+    # NOTE: Intersect with the gaps of range_array2 within range_array1.
+    gaps = np.empty([len(range_array2) + 1, 2], dtype=np.int64)
+    gaps[0, 0] = min(range_array1[0, 0], range_array2[0, 0])
+    gaps[1:, 0] = range_array2[:, 1]
+    gaps[:-1, 1] = range_array2[:, 0]
+    gaps[-1, 1] = max(range_array1[-1, 1], range_array2[-1, 1])
+    result = intersection_range_arrays(range_array1, gaps, is_sorted=True)
+    return result[result[:, 0] < result[:, 1]]
 
 
 def merge_self_ranges(src_ranges, is_sorted=False):
-    merged_ranges = []
-    if len(src_ranges) > 0:
-        if not is_sorted:
-            src_ranges.sort(key=lambda x: x[0])
-        cur_indx = 0
-        merged_ranges.append((src_ranges[cur_indx][0], src_ranges[cur_indx][1]))
-        for cur_indx in range(1, len(src_ranges)):
-            if src_ranges[cur_indx][1] > merged_ranges[-1][1]:
-                if src_ranges[cur_indx][0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (
-                        merged_ranges[-1][0],
-                        src_ranges[cur_indx][1],
-                    )
-                else:
-                    merged_ranges.append(
-                        (src_ranges[cur_indx][0], src_ranges[cur_indx][1])
-                    )
-    return merged_ranges
+    return to_range_list(merge_self_range_array(src_ranges, is_sorted))
 
 
 def merge_ranges(range_list1, range_list2, is_sorted=False):
-    merged_ranges = []
-    if not is_sorted:
-        range_list1 = merge_self_ranges(range_list1)
-        range_list2 = merge_self_ranges(range_list2)
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    if len1 == 0 and len2 == 0:
-        return merged_ranges
-    elif len1 == 0:
-        return range_list2
-    elif len2 == 0:
-        return range_list1
-    else:
-        indx1 = 0
-        indx2 = 0
-        range1 = range_list1[indx1]
-        range2 = range_list2[indx2]
-        if range1[0] < range2[0]:
-            merged_ranges.append(range1)
-            indx1 += 1
-        else:
-            merged_ranges.append(range2)
-            indx2 += 1
-        while indx1 < len1 and indx2 < len2:
-            range1 = range_list1[indx1]
-            range2 = range_list2[indx2]
-            if range1[0] < range2[0]:
-                if range1[1] > merged_ranges[-1][1]:
-                    if range1[0] <= merged_ranges[-1][1]:
-                        merged_ranges[-1] = (merged_ranges[-1][0], range1[1])
-                    else:
-                        merged_ranges.append((range1[0], range1[1]))
-                    indx1 += 1
-                else:
-                    indx1 += 1
-            else:
-                if range2[1] > merged_ranges[-1][1]:
-                    if range2[0] <= merged_ranges[-1][1]:
-                        merged_ranges[-1] = (merged_ranges[-1][0], range2[1])
-                    else:
-                        merged_ranges.append((range2[0], range2[1]))
-                    indx2 += 1
-                else:
-                    indx2 += 1
-
-        while indx1 < len1:
-            range1 = range_list1[indx1]
-            if range1[1] > merged_ranges[-1][1]:
-                if range1[0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (merged_ranges[-1][0], range1[1])
-                else:
-                    merged_ranges.append((range1[0], range1[1]))
-                indx1 += 1
-            else:
-                indx1 += 1
-        while indx2 < len2:
-            range2 = range_list2[indx2]
-            if range2[1] > merged_ranges[-1][1]:
-                if range2[0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (merged_ranges[-1][0], range2[1])
-                else:
-                    merged_ranges.append((range2[0], range2[1]))
-                indx2 += 1
-            else:
-                indx2 += 1
-    return merged_ranges
+    return to_range_list(
+        merge_range_arrays(range_list1, range_list2, is_sorted)
+    )
 
 
 def intersection_ranges(range_list1, range_list2, is_sorted=False):
-    result_range = []
-    if len(range_list1) == 0 or len(range_list2) == 0:
-        return result_range
-    if not is_sorted:
-        range_list1 = merge_self_ranges(range_list1)
-        range_list2 = merge_self_ranges(range_list2)
-
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    indx1 = 0
-    indx2 = 0
-    range1 = range_list1[indx1]
-    range2 = range_list2[indx2]
-    while indx1 < len1 and indx2 < len2:
-        if range2[1] <= range1[0]:
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] <= range1[0] and range2[1] < range1[1]:
-            assert range2[1] > range1[0]
-            result_range.append((range1[0], range2[1]))
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] <= range1[0]:
-            assert range2[1] >= range1[1]
-            result_range.append(range1)
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-
-        elif range2[1] < range1[1]:
-            assert range2[0] > range1[0]
-            result_range.append(range2)
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] < range1[1]:
-            assert range2[1] >= range1[1]
-            result_range.append((range2[0], range1[1]))
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-
-        else:
-            assert range2[0] >= range1[1]
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-    return result_range
+    return to_range_list(
+        intersection_range_arrays(range_list1, range_list2, is_sorted)
+    )
 
 
 def subtract_ranges(range_list1, range_list2, is_sorted=False):
-    result_range = []
-    if not is_sorted:
-        range_list1 = merge_self_ranges(range_list1)
-        range_list2 = merge_self_ranges(range_list2)
-    if len(range_list1) == 0:
-        return result_range
-    if len(range_list2) == 0:
-        return range_list1
-
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    indx1 = 0
-    indx2 = 0
-    range1 = range_list1[indx1]
-    range2 = range_list2[indx2]
-
-    while indx1 < len(range_list1):
-        if indx2 == len(range_list2):
-            result_range.append(range1)
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-        elif range2[1] <= range1[0]:
-            indx2 += 1
-            if indx2 != len2:
-                range2 = range_list2[indx2]
-        elif range2[0] <= range1[0] and range2[1] < range1[1]:
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 != len2:
-                range2 = range_list2[indx2]
-        elif range2[0] <= range1[0]:
-            assert range2[1] >= range1[1]
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 != len1:
-                range1 = range_list1[indx1]
-        elif range2[0] < range1[1]:
-            assert range2[0] > range1[0]
-            result_range.append((range1[0], range2[0]))
-            range1 = (range2[0], range1[1])
-        else:
-            assert range2[0] >= range1[1]
-            result_range.append(range1)
-            indx1 += 1
-            if indx1 != len1:
-                range1 = range_list1[indx1]
-    return result_range
+    return to_range_list(
+        subtract_range_arrays(range_list1, range_list2, is_sorted)
+    )
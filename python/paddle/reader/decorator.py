@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import heapq
 import itertools
 import logging
 import multiprocessing
@@ -22,7 +23,7 @@ import sys
 import warnings
 from itertools import zip_longest
 from queue import Queue
-from threading import Thread
+from threading import Condition, Event, Semaphore, Thread
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -473,12 +474,39 @@ class XmapEndSignal:
     pass
 
 
+class _ReorderBuffer:
+    """
+    Puts the samples mapped out of order into out_queue in order. Samples
+    ahead of the next one wait in a heap, the heap holds at most capacity
+    samples, the mappers of later samples wait until it has room.
+    """
+
+    def __init__(self, out_queue, capacity):
+        self._out_queue = out_queue
+        self._capacity = max(capacity, 1)
+        self._heap = []
+        self._next = 0
+        self._cond = Condition()
+
+    def put(self, order, sample):
+        with self._cond:
+            while order >= self._next + self._capacity:
+                self._cond.wait()
+            heapq.heappush(self._heap, (order, sample))
+            while self._heap and self._heap[0][0] == self._next:
+                self._out_queue.put(heapq.heappop(self._heap)[1])
+                self._next += 1
+            self._cond.notify_all()
+
+
 def xmap_readers(
     mapper: Callable[[_T], _U],
     reader: _Reader[_T],
     process_num: int,
     buffer_size: int,
     order: bool = False,
+    use_process_pool: bool = False,
+    chunk_size: int = 1,
 ) -> _Reader[_U]:
     """
     Use multi-threads to map samples from reader by a mapper defined by user.
@@ -490,6 +518,12 @@ def xmap_readers(
         buffer_size (int): size of the queue to read data in.
         order (bool): whether to keep the data order from original reader.
             Default False.
+        use_process_pool (bool): whether to map the data in a pool of
+            process_num processes instead of threads, which scales with
+            CPU-bound mappers. The mapper and the data should be picklable.
+            Default False.
+        chunk_size (int): number of samples submitted to a process of the
+            pool at a time, only used if use_process_pool is True. Default 1.
 
     Returns:
         callable: a decorated reader with data mapping.
@@ -523,15 +557,12 @@ def xmap_readers(
 
     # define a worker to handle samples from in_queue by mapper
     # and put mapped samples into out_queue by order
-    def order_handle_worker(in_queue, out_queue, mapper, out_order):
+    def order_handle_worker(in_queue, out_queue, mapper, reorder_buffer):
         ins = in_queue.get()
         while not isinstance(ins, XmapEndSignal):
             order, sample = ins
             r = mapper(sample)
-            while order != out_order[0]:
-                pass
-            out_queue.put(r)
-            out_order[0] += 1
+            reorder_buffer.put(order, r)
             ins = in_queue.get()
         in_queue.put(end)
         out_queue.put(end)
@@ -539,7 +570,6 @@ def xmap_readers(
     def xreader():
         in_queue = Queue(buffer_size)
         out_queue = Queue(buffer_size)
-        out_order = [0]
         # start a read worker in a thread
         target = order_read_worker if order else read_worker
         t = Thread(target=target, args=(reader, in_queue))
@@ -548,7 +578,12 @@ def xmap_readers(
         # start several handle_workers
         target = order_handle_worker if order else handle_worker
         args = (
-            (in_queue, out_queue, mapper, out_order)
+            (
+                in_queue,
+                out_queue,
+                mapper,
+                _ReorderBuffer(out_queue, buffer_size),
+            )
             if order
             else (in_queue, out_queue, mapper)
         )
@@ -572,7 +607,31 @@ def xmap_readers(
             else:
                 yield sample
 
-    return xreader
+    def pool_xreader():
+        # NOTE: the pool reads all the samples of its input ahead, limit the
+        # samples in flight, a chunk is only submitted when it is full
+        window = Semaphore(max(buffer_size, chunk_size))
+        stopped = Event()
+
+        def samples():
+            for sample in reader():
+                while not window.acquire(timeout=0.1):
+                    if stopped.is_set():
+                        return
+                yield sample
+
+        pool = multiprocessing.Pool(process_num)
+        try:
+            imap = pool.imap if order else pool.imap_unordered
+            for sample in imap(mapper, samples(), chunk_size):
+                window.release()
+                yield sample
+        finally:
+            stopped.set()
+            pool.terminate()
+            pool.join()
+
+    return pool_xreader if use_process_pool else xreader
 
 
 def multiprocess_reader(
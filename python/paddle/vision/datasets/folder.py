@@ -19,8 +19,6 @@ from typing import TYPE_CHECKING, Any, Callable, List, Literal, Tuple
 from typing_extensions import TypeAlias
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-
     from paddle._typing.dtype_like import _DTypeLiteral
     from paddle.vision.transforms.transforms import _Transform
 
@@ -38,8 +36,12 @@ if TYPE_CHECKING:
         '.webp',
     ]
 
+import json
 import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 from PIL import Image
 
 import paddle
@@ -66,8 +68,221 @@ def has_valid_extension(filename: str, extensions: Sequence[str]) -> bool:
     return filename.lower().endswith(extensions)
 
 
+# NOTE: bump it when the layout of the index file changes
+INDEX_FORMAT_VERSION = 1
+
+
+def _mtime(dir):
+    try:
+        return os.stat(dir).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _scan_dir(dir, is_valid_file):
+    files, subdirs = [], []
+    # NOTE: take the mtime before listing, so that the directory modified
+    # during listing is found outdated next time
+    mtime = _mtime(dir)
+    try:
+        it = os.scandir(dir)
+    except OSError:
+        # unreadable directories are skipped as os.walk does
+        return files, subdirs, mtime
+    with it:
+        for entry in it:
+            try:
+                # follows symbolic links as os.walk(followlinks=True)
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                subdirs.append(entry.path)
+            elif is_valid_file(entry.path):
+                files.append(entry.name)
+    files.sort()
+    return files, subdirs, mtime
+
+
+def _walk_dirs(tops, is_valid_file):
+    """
+    Finds the valid files under each of tops, the directories are scanned
+    level by level by a thread pool, which overlaps the latency of listing
+    directories on network file systems.
+
+    Returns:
+        list: (files, dirs, mtimes) for each top, where files are in the same
+            order as walking with `sorted(os.walk(top, followlinks=True))`,
+            dirs are the scanned directories and mtimes are their mtimes.
+    """
+    results = [[] for _ in tops]
+    level = list(enumerate(tops))
+    with ThreadPoolExecutor() as pool:
+        while level:
+            scanned = pool.map(lambda t: _scan_dir(t[1], is_valid_file), level)
+            next_level = []
+            for (i, dir), (files, subdirs, mtime) in zip(level, scanned):
+                results[i].append((dir, files, mtime))
+                next_level.extend((i, subdir) for subdir in subdirs)
+            level = next_level
+
+    walked = []
+    for scanned_dirs in results:
+        scanned_dirs.sort(key=lambda item: item[0])
+        files = [
+            os.path.join(dir, fname)
+            for dir, fnames, _ in scanned_dirs
+            for fname in fnames
+        ]
+        dirs = [dir for dir, _, _ in scanned_dirs]
+        mtimes = [mtime for _, _, mtime in scanned_dirs]
+        walked.append((files, dirs, mtimes))
+    return walked
+
+
+def _pack_strs(strs):
+    encoded = [os.fsencode(s) for s in strs]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+def _unpack_str(buffer, offsets, index):
+    return os.fsdecode(buffer[offsets[index] : offsets[index + 1]].tobytes())
+
+
+class _PackedSamples(Sequence):
+    """
+    Read-only sequence of samples backed by numpy arrays: the paths relative
+    to root are concatenated into one byte buffer with their offsets. Unlike
+    a list of Python strings, the arrays are not touched by reference
+    counting when accessed, so the DataLoader worker processes forked from
+    the main process share the pages instead of copying them.
+    """
+
+    def __init__(self, root, buffer, offsets, labels=None):
+        self.root = root
+        self.buffer = buffer
+        self.offsets = offsets
+        self.labels = labels
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("sample index out of range")
+        path = os.path.join(
+            self.root, _unpack_str(self.buffer, self.offsets, index)
+        )
+        if self.labels is None:
+            return path
+        return path, int(self.labels[index])
+
+
+def _index_key(root, extensions, class_to_idx):
+    return json.dumps(
+        {
+            "version": INDEX_FORMAT_VERSION,
+            "root": os.path.abspath(root),
+            "extensions": None if extensions is None else list(extensions),
+            "class_to_idx": class_to_idx,
+        },
+        sort_keys=True,
+    )
+
+
+def _load_index(index_file, key):
+    """
+    Loads the (buffer, offsets, labels) of the samples from index_file, None
+    if the file is missing, made for another key, or any of the indexed
+    directories has been modified since.
+    """
+    if not os.path.exists(index_file):
+        return None
+    try:
+        with np.load(index_file) as index:
+            index = dict(index)
+        if str(index["key"]) != key:
+            return None
+        dirs_buffer, dirs_offsets = index["dirs_buffer"], index["dirs_offsets"]
+        dirs_mtimes = index["mtimes"]
+        buffer, offsets, labels = (
+            index["buffer"],
+            index["offsets"],
+            index["labels"],
+        )
+    # NOTE: KeyError if the file is not made by _save_index or by an older
+    # version of it, which is stale as well
+    except (OSError, ValueError, KeyError):
+        return None
+    dirs = [
+        _unpack_str(dirs_buffer, dirs_offsets, i)
+        for i in range(len(dirs_offsets) - 1)
+    ]
+    with ThreadPoolExecutor() as pool:
+        mtimes = list(pool.map(_mtime, dirs))
+    if not np.array_equal(mtimes, dirs_mtimes):
+        return None
+    return buffer, offsets, labels
+
+
+def _save_index(index_file, key, buffer, offsets, labels, dirs, mtimes):
+    dirs_buffer, dirs_offsets = _pack_strs(dirs)
+    # NOTE: write to a process private file and rename it, so that the
+    # processes sharing the index file never read a partial file
+    tmp_file = f"{index_file}.{os.getpid()}.tmp"
+    with open(tmp_file, 'wb') as f:
+        np.savez(
+            f,
+            key=np.array(key),
+            buffer=buffer,
+            offsets=offsets,
+            labels=labels,
+            dirs_buffer=dirs_buffer,
+            dirs_offsets=dirs_offsets,
+            mtimes=np.array(mtimes, dtype=np.int64),
+        )
+    os.replace(tmp_file, index_file)
+
+
+def _make_index(dir, tops, labels_of_tops, is_valid_file, index_file, key):
+    """
+    Indexes the valid files under tops, which are directories in dir, with
+    the index_file as a cache if it is given.
+
+    Returns:
+        tuple: (buffer, offsets, labels) of the samples, where paths are
+            relative to dir.
+    """
+    if index_file is not None:
+        index = _load_index(index_file, key)
+        if index is not None:
+            return index
+
+    # dir is also watched for the added or removed tops
+    dirs, mtimes = ([], []) if dir in tops else ([dir], [_mtime(dir)])
+    paths, labels = [], []
+    for (files, top_dirs, top_mtimes), label in zip(
+        _walk_dirs(tops, is_valid_file), labels_of_tops
+    ):
+        paths.extend(os.path.relpath(f, dir) for f in files)
+        labels.extend([label] * len(files))
+        dirs.extend(top_dirs)
+        mtimes.extend(top_mtimes)
+    buffer, offsets = _pack_strs(paths)
+    labels = np.array(labels, dtype=np.int64)
+
+    if index_file is not None:
+        _save_index(index_file, key, buffer, offsets, labels, dirs, mtimes)
+    return buffer, offsets, labels
+
+
 def make_dataset(dir, class_to_idx, extensions, is_valid_file=None):
-    images = []
     dir = os.path.expanduser(dir)
 
     if extensions is not None:
@@ -75,20 +290,53 @@ def make_dataset(dir, class_to_idx, extensions, is_valid_file=None):
         def is_valid_file(x):
             return has_valid_extension(x, extensions)
 
-    for target in sorted(class_to_idx.keys()):
-        d = os.path.join(dir, target)
-        if not os.path.isdir(d):
-            continue
-        for root, _, fnames in sorted(os.walk(d, followlinks=True)):
-            for fname in sorted(fnames):
-                path = os.path.join(root, fname)
-                if is_valid_file(path):
-                    item = (path, class_to_idx[target])
-                    images.append(item)
+    targets = [
+        target
+        for target in sorted(class_to_idx.keys())
+        if os.path.isdir(os.path.join(dir, target))
+    ]
+    walked = _walk_dirs(
+        [os.path.join(dir, target) for target in targets], is_valid_file
+    )
+    images = []
+    for target, (files, _, _) in zip(targets, walked):
+        images.extend((path, class_to_idx[target]) for path in files)
 
     return images
 
 
+def make_packed_dataset(
+    dir, class_to_idx, extensions, is_valid_file=None, index_file=None
+):
+    """
+    Same as `make_dataset`, but returns the samples packed in numpy arrays,
+    and reuses the index saved in index_file if none of the directories has
+    been modified since.
+    """
+    dir = os.path.expanduser(dir)
+
+    if extensions is not None:
+
+        def is_valid_file(x):
+            return has_valid_extension(x, extensions)
+
+    targets = [
+        target
+        for target in sorted(class_to_idx.keys())
+        if os.path.isdir(os.path.join(dir, target))
+    ]
+    key = _index_key(dir, extensions, class_to_idx)
+    buffer, offsets, labels = _make_index(
+        dir,
+        [os.path.join(dir, target) for target in targets],
+        [class_to_idx[target] for target in targets],
+        is_valid_file,
+        index_file,
+        key,
+    )
+    return _PackedSamples(dir, buffer, offsets, labels)
+
+
 class DatasetFolder(Dataset[Tuple["_ImageDataType", int]]):
     """A generic data loader where the samples are arranged in this way:
 
@@ -114,6 +362,12 @@ class DatasetFolder(Dataset[Tuple["_ImageDataType", int]]):
         is_valid_file (Callable|None, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        index_file (str|None, optional): The path of a file to save the index of
+            the samples, the index is loaded from it instead of walking the
+            directories again if none of them has been modified since. If set,
+            :attr:`samples` and :attr:`targets` are packed in numpy arrays, which
+            are shared by the DataLoader worker processes without being copied.
+            Default: None.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of DatasetFolder.
@@ -121,8 +375,8 @@ class DatasetFolder(Dataset[Tuple["_ImageDataType", int]]):
     Attributes:
         classes (list[str]): List of the class names.
         class_to_idx (dict[str, int]): Dict with items (class_name, class_index).
-        samples (list[tuple[str, int]]): List of (sample_path, class_index) tuples.
-        targets (list[int]): The class_index value for each image in the dataset.
+        samples (Sequence[tuple[str, int]]): List of (sample_path, class_index) tuples.
+        targets (Sequence[int]): The class_index value for each image in the dataset.
 
     Example:
 
@@ -234,8 +488,8 @@ class DatasetFolder(Dataset[Tuple["_ImageDataType", int]]):
     transform: _Transform[Any, Any] | None
     classes: list[str]
     class_to_idx: dict[str, int]
-    samples: list[tuple[str, int]]
-    targets: list[str]
+    samples: Sequence[tuple[str, int]]
+    targets: Sequence[int]
     dtype: _DTypeLiteral
 
     def __init__(
@@ -245,15 +499,23 @@ class DatasetFolder(Dataset[Tuple["_ImageDataType", int]]):
         extensions: Sequence[_AllowedExtensions] | None = None,
         transform: _Transform[Any, Any] | None = None,
         is_valid_file: _ImageDataType | None = None,
+        index_file: str | None = None,
     ) -> None:
         self.root = root
         self.transform = transform
         if extensions is None:
             extensions = IMG_EXTENSIONS
         classes, class_to_idx = self._find_classes(self.root)
-        samples = make_dataset(
-            self.root, class_to_idx, extensions, is_valid_file
-        )
+        if index_file is None:
+            samples = make_dataset(
+                self.root, class_to_idx, extensions, is_valid_file
+            )
+            targets = [s[1] for s in samples]
+        else:
+            samples = make_packed_dataset(
+                self.root, class_to_idx, extensions, is_valid_file, index_file
+            )
+            targets = samples.labels
         if len(samples) == 0:
             raise (
                 RuntimeError(
@@ -268,7 +530,7 @@ class DatasetFolder(Dataset[Tuple["_ImageDataType", int]]):
         self.classes = classes
         self.class_to_idx = class_to_idx
         self.samples = samples
-        self.targets = [s[1] for s in samples]
+        self.targets = targets
 
         self.dtype = paddle.get_default_dtype()
 
@@ -362,12 +624,17 @@ class ImageFolder(Dataset[List["_ImageDataType"]]):
         is_valid_file (Callable|None, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        index_file (str|None, optional): The path of a file to save the index of
+            the samples, the index is loaded from it instead of walking the
+            directories again if none of them has been modified since. If set,
+            :attr:`samples` are packed in numpy arrays, which are shared by the
+            DataLoader worker processes without being copied. Default: None.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of ImageFolder.
 
     Attributes:
-        samples (list[str]): List of sample path.
+        samples (Sequence[str]): List of sample path.
 
     Example:
 
@@ -466,7 +733,7 @@ class ImageFolder(Dataset[List["_ImageDataType"]]):
 
     loader: Callable[..., _ImageDataType] | None
     extensions: Sequence[_AllowedExtensions] | None
-    samples: list[str]
+    samples: Sequence[str]
     transform: _Transform[Any, Any] | None
 
     def __init__(
@@ -476,12 +743,12 @@ class ImageFolder(Dataset[List["_ImageDataType"]]):
         extensions: Sequence[_AllowedExtensions] | None = None,
         transform: _Transform[Any, Any] | None = None,
         is_valid_file: _ImageDataType | None = None,
+        index_file: str | None = None,
     ) -> None:
         self.root = root
         if extensions is None:
             extensions = IMG_EXTENSIONS
 
-        samples = []
         path = os.path.expanduser(root)
 
         if extensions is not None:
@@ -489,11 +756,14 @@ class ImageFolder(Dataset[List["_ImageDataType"]]):
             def is_valid_file(x):
                 return has_valid_extension(x, extensions)
 
-        for root, _, fnames in sorted(os.walk(path, followlinks=True)):
-            for fname in sorted(fnames):
-                f = os.path.join(root, fname)
-                if is_valid_file(f):
-                    samples.append(f)
+        if index_file is None:
+            ((samples, _, _),) = _walk_dirs([path], is_valid_file)
+        else:
+            key = _index_key(path, extensions, None)
+            buffer, offsets, _ = _make_index(
+                path, [path], [-1], is_valid_file, index_file, key
+            )
+            samples = _PackedSamples(path, buffer, offsets)
 
         if len(samples) == 0:
             raise (
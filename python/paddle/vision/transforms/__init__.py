@@ -32,6 +32,9 @@ from .functional import (
 )
 from .transforms import (
     BaseTransform,
+    BatchColorJitter,
+    BatchRandomErasing,
+    BatchRandomResizedCrop,
     BrightnessTransform,
     CenterCrop,
     ColorJitter,
@@ -78,6 +81,9 @@ __all__ = [
     'Grayscale',
     'ToTensor',
     'RandomErasing',
+    'BatchRandomResizedCrop',
+    'BatchColorJitter',
+    'BatchRandomErasing',
     'to_tensor',
     'hflip',
     'vflip',
@@ -954,3 +954,202 @@ def adjust_hue(img, hue_factor):
         raise ValueError("channels of input should be either 1 or 3.")
 
     return img_adjusted
+
+
+def _assert_batch_image_tensor(img):
+    if not isinstance(img, paddle.Tensor) or img.ndim != 4:
+        raise RuntimeError(
+            f'not support [type={type(img)}] paddle image batch, it should be a Tensor with shape (N, C, H, W)'
+        )
+
+
+def _batch_factors(factors, img):
+    dtype = img.dtype if paddle.is_floating_point(img) else paddle.float32
+    return paddle.to_tensor(
+        np.asarray(factors).reshape([-1, 1, 1, 1]), dtype=dtype, place=img.place
+    )
+
+
+def _blend_images_batch(img1, img2, ratio):
+    dtype = img1.dtype
+    if paddle.is_floating_point(img1):
+        max_value = 1.0
+    else:
+        max_value = 255.0
+        img1 = img1.astype(paddle.float32)
+        img2 = img2.astype(paddle.float32)
+    return (img2 + ratio * (img1 - img2)).clip(0, max_value).astype(dtype)
+
+
+def resized_crop_batch(img, boxes, size, interpolation='bilinear'):
+    """Crops each image of a batch by its own box, and resizes the crops to
+    the same size by a single grid sampling. Unlike resizing the crops one by
+    one, the pixels next to a box are blended into its edges when the crop is
+    enlarged.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        boxes (np.ndarray): Crop boxes with shape (N, 4), each of them is
+            (top, left, height, width).
+        size (list|tuple): Output size (height, width).
+        interpolation (str, optional): Interpolation method, 'nearest' or
+            'bilinear'. Default: 'bilinear'.
+
+    Returns:
+        paddle.Tensor: Cropped and resized images with shape
+            (N, C, size[0], size[1]).
+
+    """
+    _assert_batch_image_tensor(img)
+    n, c, height, width = img.shape
+    top, left, h, w = np.asarray(boxes, dtype=np.float64).reshape([-1, 4]).T
+
+    # maps the normalized coordinates of the output, in the same way as
+    # resizing with align_corners=False
+    theta = np.zeros([n, 2, 3])
+    theta[:, 0, 0] = w / width
+    theta[:, 0, 2] = (2 * left + w) / width - 1
+    theta[:, 1, 1] = h / height
+    theta[:, 1, 2] = (2 * top + h) / height - 1
+
+    dtype = img.dtype
+    if not paddle.is_floating_point(img):
+        img = img.astype(paddle.float32)
+    theta = paddle.to_tensor(theta, dtype=img.dtype, place=img.place)
+    grid = F.affine_grid(theta, [n, c, size[0], size[1]], align_corners=False)
+    out = F.grid_sample(
+        img,
+        grid,
+        mode=interpolation,
+        padding_mode='border',
+        align_corners=False,
+    )
+    if out.dtype != dtype:
+        out = out.round().astype(dtype)
+    return out
+
+
+def erase_batch(img, boxes, value):
+    """Erases a region of each image of a batch by its own box.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        boxes (np.ndarray): Erased regions with shape (N, 4), each of them is
+            (top, left, height, width), images with empty regions are kept.
+        value (paddle.Tensor): Value broadcastable to img, used to replace
+            the pixels in erased regions.
+
+    Returns:
+        paddle.Tensor: Erased images.
+
+    """
+    _assert_batch_image_tensor(img)
+    _, _, height, width = img.shape
+    top, left, h, w = (
+        paddle.to_tensor(x.reshape([-1, 1, 1, 1]), place=img.place)
+        for x in np.asarray(boxes, dtype=np.int64).reshape([-1, 4]).T
+    )
+    rows = paddle.arange(height, dtype='int64').reshape([1, 1, -1, 1])
+    cols = paddle.arange(width, dtype='int64').reshape([1, 1, 1, -1])
+    mask = (rows >= top) & (rows < top + h) & (cols >= left) & (cols < left + w)
+    return paddle.where(
+        mask.expand(img.shape),
+        value.astype(img.dtype).expand(img.shape),
+        img,
+    )
+
+
+def adjust_brightness_batch(img, brightness_factors):
+    """Adjusts brightness of each image of a batch by its own factor.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        brightness_factors (np.ndarray): Non negative factors with shape (N,).
+
+    Returns:
+        paddle.Tensor: Brightness adjusted images.
+
+    """
+    _assert_batch_image_tensor(img)
+    ratio = _batch_factors(brightness_factors, img)
+    return _blend_images_batch(img, paddle.zeros_like(img), ratio)
+
+
+def adjust_contrast_batch(img, contrast_factors):
+    """Adjusts contrast of each image of a batch by its own factor.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        contrast_factors (np.ndarray): Non negative factors with shape (N,).
+
+    Returns:
+        paddle.Tensor: Contrast adjusted images.
+
+    """
+    _assert_batch_image_tensor(img)
+    channels = _get_image_num_channels(img, 'CHW')
+    dtype = img.dtype if paddle.is_floating_point(img) else paddle.float32
+    if channels == 1:
+        gray = img
+    elif channels == 3:
+        gray = to_grayscale(img)
+    else:
+        raise ValueError("channels of input should be either 1 or 3.")
+    extreme_target = paddle.mean(
+        gray.astype(dtype), axis=(-3, -2, -1), keepdim=True
+    )
+    ratio = _batch_factors(contrast_factors, img)
+    return _blend_images_batch(img, extreme_target, ratio)
+
+
+def adjust_saturation_batch(img, saturation_factors):
+    """Adjusts color saturation of each image of a batch by its own factor.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        saturation_factors (np.ndarray): Non negative factors with shape (N,).
+
+    Returns:
+        paddle.Tensor: Saturation adjusted images.
+
+    """
+    _assert_batch_image_tensor(img)
+    channels = _get_image_num_channels(img, 'CHW')
+    if channels == 1:
+        return img
+    elif channels != 3:
+        raise ValueError("channels of input should be either 1 or 3.")
+    ratio = _batch_factors(saturation_factors, img)
+    return _blend_images_batch(img, to_grayscale(img), ratio)
+
+
+def adjust_hue_batch(img, hue_factors):
+    """Adjusts hue of each image of a batch by its own factor.
+
+    Args:
+        img (paddle.Tensor): Images with shape (N, C, H, W).
+        hue_factors (np.ndarray): Factors in [-0.5, 0.5] with shape (N,).
+
+    Returns:
+        paddle.Tensor: Hue adjusted images.
+
+    """
+    _assert_batch_image_tensor(img)
+    channels = _get_image_num_channels(img, 'CHW')
+    if channels == 1:
+        return img
+    elif channels != 3:
+        raise ValueError("channels of input should be either 1 or 3.")
+
+    dtype = img.dtype
+    if dtype == paddle.uint8:
+        img = img.astype(paddle.float32) / 255.0
+
+    h, s, v = _rgb_to_hsv(img).unbind(axis=-3)
+    h = h + _batch_factors(hue_factors, img).squeeze(1)
+    h = h - h.floor()
+    img_adjusted = _hsv_to_rgb(paddle.stack([h, s, v], axis=-3))
+
+    if dtype == paddle.uint8:
+        img_adjusted = (img_adjusted * 255.0).astype(dtype)
+    return img_adjusted
@@ -33,7 +33,7 @@ from typing_extensions import TypeAlias
 
 import paddle
 
-from . import functional as F
+from . import functional as F, functional_tensor as F_t
 
 if TYPE_CHECKING:
     import numpy.typing as npt
@@ -2337,3 +2337,327 @@ class RandomErasing(BaseTransform[_InputT, _RetT]):
                 lambda: self._static_apply_image(img),
                 lambda: img,
             )
+
+
+class BatchRandomResizedCrop(BaseTransform["Tensor", "Tensor"]):
+    """Crop each image of a batch to random size and aspect ratio, and resize
+    the crops to the given size. It works in the same way as
+    ``RandomResizedCrop``, but takes a batch of images as a Tensor with shape
+    (N, C, H, W), and crops and resizes all of them by a single grid sampling,
+    which is usually applied to the batches collated by ``DataLoader``, on
+    device.
+
+    Args:
+        size (int|list|tuple): Target size of output image, with (height, width) shape.
+        scale (list|tuple, optional): Scale range of the cropped image before resizing, relatively to the origin
+            image. Default: (0.08, 1.0).
+        ratio (list|tuple, optional): Range of aspect ratio of the origin aspect ratio cropped. Default: (0.75, 1.33)
+        interpolation (str, optional): Interpolation method, 'nearest' or 'bilinear'. Default: 'bilinear'.
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(Paddle.Tensor): The input images with shape (N x C x H x W).
+        - output(Paddle.Tensor): The cropped images with shape (N x C x size[0] x size[1]).
+
+    Returns:
+        A callable object of BatchRandomResizedCrop.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import paddle
+            >>> from paddle.vision.transforms import BatchRandomResizedCrop
+
+            >>> transform = BatchRandomResizedCrop(224)
+            >>> fake_imgs = paddle.rand([8, 3, 300, 320])
+            >>> fake_imgs = transform(fake_imgs)
+            >>> print(fake_imgs.shape)
+            [8, 3, 224, 224]
+
+    """
+
+    size: Size2
+    scale: Sequence[float]
+    ratio: Sequence[float]
+    interpolation: Literal['nearest', 'bilinear']
+
+    def __init__(
+        self,
+        size: Size2,
+        scale: Sequence[float] = (0.08, 1.0),
+        ratio: Sequence[float] = (3.0 / 4, 4.0 / 3),
+        interpolation: Literal['nearest', 'bilinear'] = 'bilinear',
+        keys: _TransformInputKeys | None = None,
+    ) -> None:
+        super().__init__(keys)
+        if isinstance(size, int):
+            self.size = (size, size)
+        else:
+            self.size = size
+        assert scale[0] <= scale[1], "scale should be of kind (min, max)"
+        assert ratio[0] <= ratio[1], "ratio should be of kind (min, max)"
+        self.scale = scale
+        self.ratio = ratio
+        self.interpolation = interpolation
+
+    def _get_batch_params(self, num, height, width, attempts=10):
+        area = height * width
+        target_area = np.random.uniform(*self.scale, size=(num, attempts))
+        target_area *= area
+        log_ratio = tuple(math.log(x) for x in self.ratio)
+        aspect_ratio = np.exp(
+            np.random.uniform(*log_ratio, size=(num, attempts))
+        )
+
+        w = np.round(np.sqrt(target_area * aspect_ratio)).astype(np.int64)
+        h = np.round(np.sqrt(target_area / aspect_ratio)).astype(np.int64)
+        valid = (0 < w) & (w <= width) & (0 < h) & (h <= height)
+        # take the first valid attempt of each image
+        attempt = valid.argmax(axis=1)
+        found = valid.any(axis=1)
+        w = w[np.arange(num), attempt]
+        h = h[np.arange(num), attempt]
+
+        # Fallback to central crop
+        in_ratio = float(width) / float(height)
+        if in_ratio < min(self.ratio):
+            fallback_w = width
+            fallback_h = int(round(fallback_w / min(self.ratio)))
+        elif in_ratio > max(self.ratio):
+            fallback_h = height
+            fallback_w = int(round(fallback_h * max(self.ratio)))
+        else:
+            # return whole image
+            fallback_w = width
+            fallback_h = height
+        w = np.where(found, w, fallback_w)
+        h = np.where(found, h, fallback_h)
+        i = np.where(
+            found,
+            np.floor(np.random.random(num) * (height - h + 1)),
+            (height - h) // 2,
+        )
+        j = np.where(
+            found,
+            np.floor(np.random.random(num) * (width - w + 1)),
+            (width - w) // 2,
+        )
+        return np.stack([i, j, h, w], axis=1)
+
+    def _apply_image(self, img):
+        F_t._assert_batch_image_tensor(img)
+        boxes = self._get_batch_params(img.shape[0], *img.shape[2:])
+        return F_t.resized_crop_batch(img, boxes, self.size, self.interpolation)
+
+
+class BatchColorJitter(BaseTransform["Tensor", "Tensor"]):
+    """Randomly change the brightness, contrast, saturation and hue of each
+    image of a batch. It works in the same way as ``ColorJitter``, but takes
+    a batch of images as a Tensor with shape (N, C, H, W), and adjusts all of
+    them by a few vectorized operations. Each image is adjusted by its own
+    random factors, while the order of the adjustments is shuffled once for
+    the whole batch.
+
+    Args:
+        brightness (float, optional): How much to jitter brightness.
+            Chosen uniformly from [max(0, 1 - brightness), 1 + brightness]. Should be non negative numbers. Default: 0.
+        contrast (float, optional): How much to jitter contrast.
+            Chosen uniformly from [max(0, 1 - contrast), 1 + contrast]. Should be non negative numbers. Default: 0.
+        saturation (float, optional): How much to jitter saturation.
+            Chosen uniformly from [max(0, 1 - saturation), 1 + saturation]. Should be non negative numbers. Default: 0.
+        hue (float, optional): How much to jitter hue.
+            Chosen uniformly from [-hue, hue]. Should have 0<= hue <= 0.5. Default: 0.
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(Paddle.Tensor): The input images with shape (N x C x H x W).
+        - output(Paddle.Tensor): The color jittered images.
+
+    Returns:
+        A callable object of BatchColorJitter.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import paddle
+            >>> from paddle.vision.transforms import BatchColorJitter
+
+            >>> transform = BatchColorJitter(0.4, 0.4, 0.4, 0.4)
+            >>> fake_imgs = paddle.rand([8, 3, 224, 224])
+            >>> fake_imgs = transform(fake_imgs)
+            >>> print(fake_imgs.shape)
+            [8, 3, 224, 224]
+
+    """
+
+    brightness: float
+    contrast: float
+    saturation: float
+    hue: float
+
+    def __init__(
+        self,
+        brightness: float = 0,
+        contrast: float = 0,
+        saturation: float = 0,
+        hue: float = 0,
+        keys: _TransformInputKeys | None = None,
+    ) -> None:
+        super().__init__(keys)
+        self.brightness = brightness
+        self.contrast = contrast
+        self.saturation = saturation
+        self.hue = hue
+
+    def _apply_image(self, img):
+        F_t._assert_batch_image_tensor(img)
+        adjustments = [
+            (
+                F_t.adjust_brightness_batch,
+                _check_input(self.brightness, 'brightness'),
+            ),
+            (
+                F_t.adjust_contrast_batch,
+                _check_input(self.contrast, 'contrast'),
+            ),
+            (
+                F_t.adjust_saturation_batch,
+                _check_input(self.saturation, 'saturation'),
+            ),
+            (
+                F_t.adjust_hue_batch,
+                _check_input(
+                    self.hue,
+                    'hue',
+                    center=0,
+                    bound=(-0.5, 0.5),
+                    clip_first_on_zero=False,
+                ),
+            ),
+        ]
+        random.shuffle(adjustments)
+        for adjust, value in adjustments:
+            if value is not None:
+                factors = np.random.uniform(value[0], value[1], img.shape[0])
+                img = adjust(img, factors)
+        return img
+
+
+class BatchRandomErasing(BaseTransform["Tensor", "Tensor"]):
+    """Erase the pixels in a rectangle region selected randomly of each image
+    of a batch. It works in the same way as ``RandomErasing``, but takes a
+    batch of images as a Tensor with shape (N, C, H, W), and erases all of
+    them by a single masked selection. Each image is erased with the
+    probability by its own random region.
+
+    Args:
+        prob (float, optional): Probability of each image being erased. Default: 0.5.
+        scale (sequence, optional): The proportional range of the erased area to the input image.
+                                    Default: (0.02, 0.33).
+        ratio (sequence, optional): Aspect ratio range of the erased area. Default: (0.3, 3.3).
+        value (int|float|sequence|str, optional): The value each pixel in erased area will be replaced with.
+                               If value is a single number, all pixels will be erased with this value.
+                               If value is a sequence with length 3, the R, G, B channels will be erased
+                               respectively. If value is set to "random", each pixel will be erased with
+                               random values. Default: 0.
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(Paddle.Tensor): The input images with shape (N x C x H x W).
+        - output(Paddle.Tensor): The random erased images.
+
+    Returns:
+        A callable object of BatchRandomErasing.
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> import paddle
+            >>> from paddle.vision.transforms import BatchRandomErasing
+
+            >>> transform = BatchRandomErasing(prob=0.8)
+            >>> fake_imgs = paddle.randn([8, 3, 32, 32])
+            >>> fake_imgs = transform(fake_imgs)
+            >>> print(fake_imgs.shape)
+            [8, 3, 32, 32]
+
+    """
+
+    prob: float
+    scale: Sequence[float]
+    ratio: Sequence[float]
+    value: int | float | Sequence[float] | str
+
+    def __init__(
+        self,
+        prob: float = 0.5,
+        scale: Sequence[float] = (0.02, 0.33),
+        ratio: Sequence[float] = (0.3, 3.3),
+        value: float | Sequence[float] | str = 0,
+        keys: _TransformInputKeys | None = None,
+    ) -> None:
+        super().__init__(keys)
+        assert isinstance(
+            scale, (tuple, list)
+        ), "scale should be a tuple or list"
+        assert (
+            scale[0] >= 0 and scale[1] <= 1 and scale[0] <= scale[1]
+        ), "scale should be of kind (min, max) and in range [0, 1]"
+        assert isinstance(
+            ratio, (tuple, list)
+        ), "ratio should be a tuple or list"
+        assert (
+            ratio[0] >= 0 and ratio[0] <= ratio[1]
+        ), "ratio should be of kind (min, max)"
+        assert (
+            prob >= 0 and prob <= 1
+        ), "The probability should be in range [0, 1]"
+        assert isinstance(
+            value, (numbers.Number, str, tuple, list)
+        ), "value should be a number, tuple, list or str"
+        if isinstance(value, str) and value != "random":
+            raise ValueError("value must be 'random' when type is str")
+        if isinstance(value, (tuple, list)) and len(value) not in (1, 3):
+            raise ValueError(
+                "Value should be a single number or a sequence with length equals to image's channel."
+            )
+
+        self.prob = prob
+        self.scale = scale
+        self.ratio = ratio
+        self.value = value
+
+    def _get_batch_params(self, num, height, width, attempts=10):
+        img_area = height * width
+        erase_area = np.random.uniform(*self.scale, size=(num, attempts))
+        erase_area *= img_area
+        log_ratio = np.log(self.ratio)
+        aspect_ratio = np.exp(
+            np.random.uniform(*log_ratio, size=(num, attempts))
+        )
+        erase_h = np.round(np.sqrt(erase_area * aspect_ratio)).astype(np.int64)
+        erase_w = np.round(np.sqrt(erase_area / aspect_ratio)).astype(np.int64)
+        valid = (erase_h < height) & (erase_w < width)
+        # take the first valid attempt of each image, images without valid
+        # attempts or not chosen by the probability are kept
+        attempt = valid.argmax(axis=1)
+        erased = valid.any(axis=1) & (np.random.random(num) < self.prob)
+        erase_h = np.where(erased, erase_h[np.arange(num), attempt], 0)
+        erase_w = np.where(erased, erase_w[np.arange(num), attempt], 0)
+        top = np.floor(np.random.random(num) * (height - erase_h + 1))
+        left = np.floor(np.random.random(num) * (width - erase_w + 1))
+        return np.stack([top, left, erase_h, erase_w], axis=1)
+
+    def _apply_image(self, img):
+        F_t._assert_batch_image_tensor(img)
+        boxes = self._get_batch_params(img.shape[0], *img.shape[2:])
+        if isinstance(self.value, str):
+            value = paddle.normal(shape=img.shape).astype(img.dtype)
+        else:
+            value = paddle.to_tensor(self.value, dtype=img.dtype).reshape(
+                [1, -1, 1, 1]
+            )
+        return F_t.erase_batch(img, boxes, value)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os
+import shutil
 import tempfile
 import unittest
 
@@ -22,10 +23,13 @@ import numpy as np
 import paddle
 import paddle.distributed as dist
 from paddle.distributed.checkpoint.load_state_dict import get_checkpoint_files
+from paddle.distributed.checkpoint.metadata import LocalTensorIndex
+from paddle.distributed.checkpoint.save_state_dict import compact_checkpoint
 from paddle.distributed.checkpoint.utils import (
     flatten_state_dict,
     unflatten_state_dict,
 )
+from paddle.framework.chunked_io import _is_chunked_file
 
 os.environ['FLAGS_enable_pir_api'] = '0'
 
@@ -182,6 +186,105 @@ class TestDistCheckpointUtils(test_base.CommunicationTestDistBase):
 
         ckpt_dir_tmp.cleanup()
 
+    def check_read_storage_chunks(self, use_chunked_format):
+        ckpt_dir_tmp = tempfile.TemporaryDirectory()
+        ckpt_dir = ckpt_dir_tmp.name
+        state_dict = {
+            "w1": paddle.arange(32, dtype="float32").reshape([4, 8]),
+            "w2": paddle.to_tensor(3.0),
+        }
+        dist.save_state_dict(
+            state_dict, ckpt_dir, use_chunked_format=use_chunked_format
+        )
+        _, local_load_files = get_checkpoint_files(ckpt_dir, use_cache=False)
+        self.assertEqual(local_load_files, ["0_0.distcp"])
+        self.assertEqual(
+            _is_chunked_file(os.path.join(ckpt_dir, "0_0.distcp")),
+            use_chunked_format,
+        )
+
+        load_state_dict = dist.checkpoint.load_state_dict
+        source_state_dict = {
+            "0_0.distcp": load_state_dict.StorageFile(
+                os.path.join(ckpt_dir, "0_0.distcp")
+            )
+        }
+        w1_index = LocalTensorIndex("w1", (0, 0))
+        w2_index = LocalTensorIndex("w2", ())
+        load_infos = {
+            w1_index: (0, "0_0.distcp"),
+            w2_index: (0, "0_0.distcp"),
+        }
+        read_items = [
+            load_state_dict.ReadItem(
+                w1_index, 0, "float32", (0, 0), (1, 2), (2, 4)
+            ),
+            load_state_dict.ReadItem(w2_index, 0, "float32", (), (), ()),
+            load_state_dict.ReadItem(
+                w1_index, 0, "float32", (0, 0), (0, 0), (4, 8)
+            ),
+        ]
+        chunks = list(
+            load_state_dict.read_storage_chunks(
+                source_state_dict, read_items, load_infos
+            )
+        )
+        np.testing.assert_equal(chunks[0], state_dict["w1"].numpy()[1:3, 2:6])
+        np.testing.assert_equal(chunks[1], state_dict["w2"].numpy())
+        np.testing.assert_equal(chunks[2], state_dict["w1"].numpy())
+        for chunk in chunks:
+            self.assertTrue(chunk.flags.c_contiguous)
+            self.assertNotIsInstance(chunk, np.memmap)
+
+        ckpt_dir_tmp.cleanup()
+
+    def test_read_storage_chunks(self):
+        # the pickle format is saved by default
+        self.check_read_storage_chunks(False)
+        self.check_read_storage_chunks(True)
+
+    def test_incremental_save(self):
+        ckpt_dir_tmp = tempfile.TemporaryDirectory()
+        base_dir = os.path.join(ckpt_dir_tmp.name, "step_0")
+        ckpt_dir = os.path.join(ckpt_dir_tmp.name, "step_1")
+        state_dict = {
+            "frozen": paddle.arange(16, dtype="float32").reshape([4, 4]),
+            "lora": paddle.ones([4, 2]),
+        }
+        dist.save_state_dict(state_dict, base_dir, incremental=True)
+        state_dict["lora"] = state_dict["lora"] * 2
+        dist.save_state_dict(state_dict, ckpt_dir, base_path=base_dir)
+
+        # only the changed tensor is saved again
+        local_state_dict = paddle.load(os.path.join(ckpt_dir, "0_0.distcp"))
+        self.assertEqual(list(local_state_dict.keys()), ["lora"])
+        metadata = paddle.load(os.path.join(ckpt_dir, "0.metadata"))
+        self.assertEqual(
+            metadata.storage_metadata[LocalTensorIndex("frozen", (0, 0))],
+            os.path.join("..", "step_0", "0_0.distcp"),
+        )
+        self.assertEqual(len(metadata.content_hash), 2)
+
+        def check_load():
+            load_state_dict = {
+                "frozen": paddle.zeros([4, 4]),
+                "lora": paddle.zeros([4, 2]),
+            }
+            dist.load_state_dict(load_state_dict, ckpt_dir)
+            for k, v in state_dict.items():
+                np.testing.assert_equal(v.numpy(), load_state_dict[k].numpy())
+
+        check_load()
+
+        compact_checkpoint(ckpt_dir)
+        metadata = paddle.load(os.path.join(ckpt_dir, "0.metadata"))
+        for file_name in metadata.storage_metadata.values():
+            self.assertEqual(os.path.dirname(file_name), "")
+        shutil.rmtree(base_dir)
+        check_load()
+
+        ckpt_dir_tmp.cleanup()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,17 +13,59 @@
 # limitations under the License.
 
 import legacy_test.test_collective_api_base as test_base
+import numpy as np
 
 import paddle
 from paddle import base
+from paddle.distributed.communication import all_gather
+from paddle.distributed.communication.serialization_utils import pack_object
+
+
+def make_object(rank, size):
+    return {
+        "rank": rank,
+        "data": np.arange(size, dtype="float32") + rank,
+        "empty": np.zeros([0, 3], dtype="int64"),
+        "scalar": np.array(rank + 0.5),
+    }
 
 
 class TestCollectiveAllgatherObjectAPI(test_base.TestCollectiveAPIRunnerBase):
     def __init__(self):
         self.global_ring_id = 0
 
+    def check_gather(self, rank, sizes, use_p2p):
+        nranks = paddle.distributed.get_world_size()
+        packed_sizes = [
+            pack_object(make_object(i, sizes[i])).size for i in range(nranks)
+        ]
+        assert (
+            all_gather._use_p2p_object_gather(None, packed_sizes) == use_p2p
+        ), f"sizes {packed_sizes} should use p2p: {use_p2p}"
+
+        object_list = []
+        paddle.distributed.all_gather_object(
+            object_list, make_object(rank, sizes[rank])
+        )
+        assert len(object_list) == nranks
+        for i, obj in enumerate(object_list):
+            expected = make_object(i, sizes[i])
+            assert obj["rank"] == i
+            for key in ["data", "empty", "scalar"]:
+                assert obj[key].shape == expected[key].shape
+                np.testing.assert_array_equal(obj[key], expected[key])
+
     def get_model(self, main_prog, startup_program, rank, indata=None):
         with base.program_guard(main_prog, startup_program):
+            # NOTE: objects of similar sizes are padded and gathered by
+            # all_gather, imbalanced ones are gathered by p2p ops with nccl,
+            # padding never doubles the bytes of 2 ranks, so lower the ratio
+            use_p2p = paddle.distributed.get_backend() == "NCCL"
+            all_gather._OBJECT_PADDING_RATIO = 1.2
+            self.check_gather(rank, [1000, 1200], False)
+            self.check_gather(rank, [0, 1 << 18], use_p2p)
+            self.check_gather(rank, [1 << 18, 10], use_p2p)
+
             object_list = []
             paddle.distributed.all_gather_object(object_list, indata)
             return object_list
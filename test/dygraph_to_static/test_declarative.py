@@ -20,6 +20,7 @@ import numpy as np
 from dygraph_to_static_utils import (
     Dy2StTestBase,
     test_ast_only,
+    test_sot_only,
 )
 
 import paddle
@@ -334,6 +335,82 @@ class TestDifferentInputSpecCacheProgram(Dy2StTestBase):
             foo_3.concrete_program  # noqa: B018
 
 
+class TestProgramCacheEviction(Dy2StTestBase):
+    @test_ast_only
+    def test_evict_least_recently_used(self):
+        x = paddle.ones([4])
+        y = paddle.ones([4])
+        foo = paddle.jit.to_static(foo_func)
+        foo.program_cache.capacity = 2
+
+        foo(x, y, 1)
+        foo(x, y, 2)
+        # c=1 becomes the most recently used program
+        out = foo(x, y, 1)
+        np.testing.assert_allclose(out.numpy(), np.full([4], 2.0))
+        self.assertEqual(foo.get_traced_count(), 2)
+
+        # c=2 is evicted
+        foo(x, y, 3)
+        self.assertEqual(foo.get_traced_count(), 2)
+        info = foo.get_cache_info()
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 3)
+        self.assertEqual(info['evictions'], 1)
+        self.assertGreater(info['build_time'], 0)
+
+        foo(x, y, 1)
+        self.assertEqual(foo.get_cache_info()['hits'], 2)
+        out = foo(x, y, 2)
+        np.testing.assert_allclose(out.numpy(), np.full([4], 2.0))
+        self.assertEqual(foo.get_cache_info()['misses'], 4)
+        self.assertEqual(foo.get_traced_count(), 2)
+
+    @test_ast_only
+    def test_evict_by_bytes(self):
+        x = paddle.ones([4])
+        y = paddle.ones([4])
+        foo = paddle.jit.to_static(foo_func)
+        foo.program_cache.max_bytes = 32
+
+        foo(x, y, 1)
+        _, (_, partial_program) = foo.program_cache.last()
+        # hold 64 bytes in the scope of the program
+        scope = partial_program._cached_scopes()[0]
+        scope.var('held').get_tensor().set(
+            np.ones([16], 'float32'), paddle.CPUPlace()
+        )
+        foo(x, y, 2)
+        self.assertEqual(foo.get_traced_count(), 1)
+        self.assertEqual(foo.get_cache_info()['evictions'], 1)
+        self.assertEqual(partial_program._cached_scopes(), [])
+
+    @test_sot_only
+    def test_sot_cache_info(self):
+        x = paddle.ones([4])
+        y = paddle.ones([4])
+
+        # a new code object which is not translated by other tests
+        def bar_func(a, b):
+            return a + b
+
+        foo = paddle.jit.to_static(bar_func)
+        info = foo.get_cache_info()
+        self.assertEqual(info['hits'], 0)
+        self.assertEqual(info['misses'], 0)
+        self.assertEqual(info['size'], 0)
+
+        foo(x, y)
+        foo(x, y)
+        info = foo.get_cache_info()
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 1)
+        self.assertEqual(info['evictions'], 0)
+        self.assertGreater(info['build_time'], 0)
+        self.assertEqual(info['size'], 1)
+        self.assertEqual(info['max_bytes'], 0)
+
+
 class TestInputDefaultName(Dy2StTestBase):
     def setUp(self):
         paddle.disable_static()
@@ -0,0 +1,79 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+from dygraph_to_static_utils import (
+    Dy2StTestBase,
+    test_ast_only,
+)
+
+import paddle
+from paddle.jit import ShapeBucket
+
+
+def masked_scale(x, mask, scale=2.0):
+    return x * mask * scale, paddle.sum(x * mask, axis=1)
+
+
+class TestShapeBucket(Dy2StTestBase):
+    def run_func(self, func, length):
+        x = paddle.randn([2, length])
+        mask = paddle.ones([2, length])
+        out, total = func(x, mask)
+        self.assertEqual(out.shape, [2, length])
+        np.testing.assert_allclose(out.numpy(), x.numpy() * 2.0, rtol=1e-6)
+        np.testing.assert_allclose(
+            total.numpy(), x.numpy().sum(axis=1), rtol=1e-5, atol=1e-6
+        )
+
+    def test_pow2(self):
+        bucket = ShapeBucket({'x': 1, 'mask': 1}, output_axes={0: 1})
+        func = paddle.jit.to_static(masked_scale, shape_buckets=[bucket])
+        for length in [3, 4, 5, 7, 8]:
+            self.run_func(func, length)
+
+    @test_ast_only
+    def test_reuse_program(self):
+        bucket = ShapeBucket(
+            {'x': 1, 'mask': 1}, buckets=[4, 8], output_axes={0: 1}
+        )
+        func = paddle.jit.to_static(masked_scale, shape_buckets=[bucket])
+        for length in [1, 2, 3, 4]:
+            self.run_func(func, length)
+        self.assertEqual(func.get_traced_count(), 1)
+        for length in [5, 8]:
+            self.run_func(func, length)
+        self.assertEqual(func.get_traced_count(), 2)
+        # larger than all buckets, not padded
+        self.run_func(func, 9)
+        self.assertEqual(func.get_traced_count(), 3)
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            ShapeBucket({'x': 1}, buckets='pow3')
+        with self.assertRaises(ValueError):
+            ShapeBucket({'x': 1}, buckets=[0, 4])
+        with self.assertRaises(TypeError):
+            paddle.jit.to_static(masked_scale, shape_buckets=[{'x': 1}])
+
+        bucket = ShapeBucket({'x': 1, 'mask': 1})
+        func = paddle.jit.to_static(masked_scale, shape_buckets=[bucket])
+        with self.assertRaises(ValueError):
+            func(paddle.randn([2, 3]), paddle.ones([2, 4]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import unittest
+
+from paddle.distributed.auto_tuner.search import ModelBasedSearch
+
+
+def throughput(cfg):
+    # a synthetic metric which is log-quadratic in the parallel degrees, the
+    # best one is mp_degree=4 and micro_batch_size=2
+    log_mp = math.log2(cfg["mp_degree"])
+    return 100.0 * 2 ** (-((log_mp - 2) ** 2)) * cfg["micro_batch_size"] ** 0.5
+
+
+class TestModelBasedSearch(unittest.TestCase):
+    def setUp(self):
+        self.tuner_cfg = {
+            "num_gpus": 8,
+            "search_algo": {
+                "name": "model_based",
+                "warmup_trials": 3,
+                "exploration": 0.0,
+                "l2_reg": 1e-3,
+                "min_improvement": 0.01,
+            },
+            "metric_cfg": {"OptimizationDirection": "Maximize"},
+            "model_cfg": {
+                "global_batch_size": 16,
+                "num_layers": 4,
+                "hidden_size": 1024,
+                "num_attention_heads": 16,
+                "vocab_size": 32000,
+                "seq_length": 1024,
+            },
+            "per_card_memory": 1e-12,
+            "candidates": {
+                "dp_degree": [1, 2, 4, 8],
+                "mp_degree": [1, 2, 4, 8],
+                "pp_degree": [1],
+                "vpp_degree": [1],
+                "sharding_degree": [1],
+                "sharding_stage": [1],
+                "micro_batch_size": [1, 2],
+                "use_recompute": [False],
+                "recompute_granularity": ["full"],
+            },
+        }
+
+    def new_search(self):
+        search = ModelBasedSearch(self.tuner_cfg)
+        # NOTE: check the ranking only, history pruning has its own tests
+        search.prune = lambda *args: False
+        return search
+
+    def run_search(self, search, metric):
+        history_cfgs, picks = [], []
+        while True:
+            cfg = search.search_once(history_cfgs)
+            if cfg is None:
+                return picks, history_cfgs
+            picks.append(cfg)
+            history_cfgs.append(dict(cfg, time=metric(cfg), job_id=len(picks)))
+
+    def test_memory_estimate_not_drop(self):
+        search = self.new_search()
+        self.assertEqual(len(search.all_tasks), 8)
+
+    def test_warmup_order(self):
+        search = self.new_search()
+        all_tasks = list(search.all_tasks)
+        self.assertEqual(search.warmup_idxs, [0, 4, 7])
+        # no metric is reported yet, the warmup candidates go first
+        picks = [search.search_once([]) for _ in range(4)]
+        self.assertEqual(
+            picks, [all_tasks[i] for i in [0, 4, 7]] + [all_tasks[1]]
+        )
+
+    def test_refit_and_stop(self):
+        search = self.new_search()
+        all_tasks = list(search.all_tasks)
+        best = max(all_tasks, key=throughput)
+        picks, history_cfgs = self.run_search(search, throughput)
+
+        self.assertEqual(picks[:3], [all_tasks[i] for i in [0, 4, 7]])
+        self.assertNotIn(best, picks[:3])
+        # the refitted model finds the best candidate, and stops since no
+        # candidate left is predicted to be better
+        self.assertEqual(picks[-1], best)
+        self.assertLess(len(picks), len(all_tasks))
+        self.assertGreater(len(search.remaining), 0)
+        self.assertIsNone(search.search_once(history_cfgs))
+
+    def test_stop_after_warmup(self):
+        search = self.new_search()
+        all_tasks = list(search.all_tasks)
+
+        # the best candidate is measured in warmup
+        def metric(cfg):
+            return 100.0 * cfg["mp_degree"] * cfg["micro_batch_size"]
+
+        picks, _ = self.run_search(search, metric)
+        self.assertEqual(picks, [all_tasks[i] for i in [0, 4, 7]])
+
+    def test_memory_estimate_order(self):
+        class MemSearch(ModelBasedSearch):
+            def _estimate_mem(self, cfg):
+                return 10.0 * cfg["micro_batch_size"]
+
+        self.tuner_cfg["per_card_memory"] = 15
+        search = MemSearch(self.tuner_cfg)
+        search.prune = lambda *args: False
+        all_tasks = list(search.all_tasks)
+        self.assertEqual(len(all_tasks), 8)
+
+        # the warmup candidates over the memory go behind the others
+        picks = [search.search_once([]) for _ in range(len(all_tasks))]
+        self.assertEqual(
+            [cfg["micro_batch_size"] for cfg in picks], [1] * 4 + [2] * 4
+        )
+        self.assertNotEqual(picks[:3], [all_tasks[i] for i in [0, 4, 7]])
+
+        # the best candidate within the memory is picked before any over it
+        search = MemSearch(self.tuner_cfg)
+        search.prune = lambda *args: False
+        picks, _ = self.run_search(search, throughput)
+        mbs = [cfg["micro_batch_size"] for cfg in picks]
+        self.assertEqual(mbs, sorted(mbs))
+        best = max(
+            (cfg for cfg in all_tasks if cfg["micro_batch_size"] == 1),
+            key=throughput,
+        )
+        self.assertIn(best, picks)
+
+    def test_minimize(self):
+        self.tuner_cfg["metric_cfg"]["OptimizationDirection"] = "Minimize"
+        search = self.new_search()
+        all_tasks = list(search.all_tasks)
+        picks, _ = self.run_search(search, lambda cfg: 1.0 / throughput(cfg))
+        self.assertIn(max(all_tasks, key=throughput), picks)
+        self.assertLess(len(picks), len(all_tasks))
+
+
+if __name__ == '__main__':
+    unittest.main()
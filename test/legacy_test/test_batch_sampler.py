@@ -20,6 +20,7 @@ import numpy as np
 from paddle.io import (
     BatchSampler,
     Dataset,
+    DistributedBatchSampler,
     RandomSampler,
     Sampler,
     SequenceSampler,
@@ -360,5 +361,137 @@ class TestWeightedRandomSampler(unittest.TestCase):
             self.assertTrue(True)
 
 
+class TestSamplerStateDict(unittest.TestCase):
+    def check_resume(self, create_sampler, num_consumed):
+        sampler = create_sampler()
+        sampler_iter = iter(sampler)
+        for _ in range(num_consumed):
+            next(sampler_iter)
+        state = sampler.state_dict()
+        self.assertEqual(state['num_yielded'], num_consumed)
+
+        resumed = create_sampler()
+        resumed.load_state_dict(state)
+        self.assertEqual(list(resumed), list(sampler_iter))
+
+    def test_random_sampler(self):
+        dataset = RandomDataset(100, 10)
+        self.check_resume(lambda: RandomSampler(dataset), 37)
+        self.check_resume(
+            lambda: RandomSampler(dataset, replacement=True, num_samples=50),
+            20,
+        )
+
+    def test_batch_sampler(self):
+        dataset = RandomDataset(100, 10)
+        for shuffle in [False, True]:
+            for drop_last in [False, True]:
+                self.check_resume(
+                    lambda: BatchSampler(
+                        dataset,
+                        batch_size=8,
+                        shuffle=shuffle,
+                        drop_last=drop_last,
+                    ),
+                    5,
+                )
+
+    def test_batch_sampler_with_iterable_sampler(self):
+        self.check_resume(
+            lambda: BatchSampler(sampler=list(range(50)), batch_size=6), 3
+        )
+
+    def test_distributed_batch_sampler(self):
+        dataset = RandomDataset(100, 10)
+        for shuffle in [False, True]:
+            for rank in range(3):
+
+                def create_sampler():
+                    sampler = DistributedBatchSampler(
+                        dataset,
+                        batch_size=4,
+                        num_replicas=3,
+                        rank=rank,
+                        shuffle=shuffle,
+                    )
+                    sampler.set_epoch(3)
+                    return sampler
+
+                self.check_resume(create_sampler, 4)
+
+    def test_distributed_batch_sampler_lazy(self):
+        dataset = RandomDataset(100, 10)
+        for shuffle in [False, True]:
+            self.check_resume(
+                lambda: DistributedBatchSampler(
+                    dataset,
+                    batch_size=4,
+                    num_replicas=3,
+                    rank=1,
+                    shuffle=shuffle,
+                    lazy=True,
+                ),
+                4,
+            )
+
+
+class TestDistributedBatchSamplerLazy(unittest.TestCase):
+    def create_samplers(self, num_samples, num_replicas, shuffle, drop_last):
+        dataset = RandomDataset(num_samples, 10)
+        return [
+            [
+                DistributedBatchSampler(
+                    dataset,
+                    batch_size=4,
+                    num_replicas=num_replicas,
+                    rank=rank,
+                    shuffle=shuffle,
+                    drop_last=drop_last,
+                    lazy=lazy,
+                )
+                for rank in range(num_replicas)
+            ]
+            for lazy in [False, True]
+        ]
+
+    def test_same_as_non_lazy(self):
+        for num_samples in [1, 37, 100]:
+            for num_replicas in [1, 3, 8]:
+                for drop_last in [False, True]:
+                    samplers, lazy_samplers = self.create_samplers(
+                        num_samples, num_replicas, False, drop_last
+                    )
+                    for sampler, lazy_sampler in zip(samplers, lazy_samplers):
+                        self.assertEqual(list(sampler), list(lazy_sampler))
+                        self.assertEqual(len(sampler), len(lazy_sampler))
+
+    def test_shuffle(self):
+        num_samples, num_replicas = 37, 3
+        samplers, lazy_samplers = self.create_samplers(
+            num_samples, num_replicas, True, False
+        )
+        indices = []
+        for sampler, lazy_sampler in zip(samplers, lazy_samplers):
+            batches = list(lazy_sampler)
+            self.assertEqual(
+                [len(b) for b in batches], [len(b) for b in sampler]
+            )
+            indices.extend(i for b in batches for i in b)
+        # padded indices are repeated from the beginning as non-lazy mode
+        expected = [i % num_samples for i in range(len(indices))]
+        self.assertEqual(sorted(indices), sorted(expected))
+
+    def test_set_epoch(self):
+        dataset = RandomDataset(100, 10)
+        sampler = DistributedBatchSampler(
+            dataset, batch_size=4, shuffle=True, lazy=True
+        )
+        sampler.set_epoch(5)
+        first = list(sampler)
+        self.assertNotEqual(first, list(sampler))
+        sampler.set_epoch(5)
+        self.assertEqual(first, list(sampler))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,7 @@ import json
 import os
 import sys
 import tempfile
+import time
 import unittest
 import warnings
 
@@ -24,6 +25,7 @@ import numpy as np
 import paddle
 from paddle import nn
 from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader import dataloader_iter
 
 
 class RandomDataset(Dataset):
@@ -110,5 +112,97 @@ class TestAutoTuneAPI(unittest.TestCase):
             self.assertTrue(len(w) == 2)
 
 
+class SlowDataset(Dataset):
+    def __init__(self, num_samples, delay):
+        self.num_samples = num_samples
+        self.delay = delay
+
+    def __getitem__(self, idx):
+        time.sleep(self.delay)
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.num_samples
+
+
+class WorkerInfoDataset(SlowDataset):
+    def __getitem__(self, idx):
+        time.sleep(self.delay)
+        info = paddle.io.get_worker_info()
+        return np.array([idx, info.id, info.num_workers]).astype('int64')
+
+
+class TestWorkerAutoScaler(unittest.TestCase):
+    def test_step(self):
+        scaler = dataloader_iter._WorkerAutoScaler(1, 4, window_steps=2)
+        # waiting for data most of the time
+        self.assertEqual(scaler.step(1.0, 0, 8, 2), 0)
+        self.assertEqual(scaler.step(1.0, 0, 8, 2), 1)
+        # reach max_workers
+        scaler.step(1.0, 0, 8, 4)
+        self.assertEqual(scaler.step(1.0, 0, 8, 4), 0)
+        # blocking queue is full and no waiting
+        scaler.step(0.0, 8, 8, 2)
+        self.assertEqual(scaler.step(0.0, 8, 8, 2), -1)
+        # reach min_workers
+        scaler.step(0.0, 8, 8, 1)
+        self.assertEqual(scaler.step(0.0, 8, 8, 1), 0)
+
+
+class TestDataLoaderAutoScale(unittest.TestCase):
+    def setUp(self):
+        self.window_steps = dataloader_iter.AUTOSCALE_WINDOW_STEPS
+        dataloader_iter.AUTOSCALE_WINDOW_STEPS = 4
+        paddle.incubate.autotune.set_config(
+            config={
+                "dataloader": {
+                    "autoscale": True,
+                    "min_workers": 1,
+                    "max_workers": 3,
+                }
+            }
+        )
+
+    def tearDown(self):
+        dataloader_iter.AUTOSCALE_WINDOW_STEPS = self.window_steps
+        paddle.io.reader.set_autoscale_config(False)
+
+    def run_loader(self, dataset, num_workers, step_delay):
+        loader = DataLoader(dataset, batch_size=2, num_workers=num_workers)
+        loader_iter = iter(loader)
+        indices = []
+        for data in loader_iter:
+            indices.extend(data.numpy().flatten().tolist())
+            time.sleep(step_delay)
+        self.assertEqual(indices, list(range(len(dataset))))
+        return loader_iter
+
+    def test_add_workers(self):
+        if sys.platform == 'darwin' or sys.platform == 'win32':
+            return
+        loader_iter = self.run_loader(SlowDataset(80, 0.02), 1, 0)
+        self.assertGreater(len(loader_iter._workers), 1)
+
+    def test_added_worker_info(self):
+        if sys.platform == 'darwin' or sys.platform == 'win32':
+            return
+        loader = DataLoader(
+            WorkerInfoDataset(80, 0.02), batch_size=2, num_workers=1
+        )
+        loader_iter = iter(loader)
+        samples = np.concatenate([data.numpy() for data in loader_iter])
+        self.assertEqual(samples[:, 0].tolist(), list(range(80)))
+        self.assertGreater(samples[:, 1].max(), 0)
+        # each worker sees a worker number which counts itself
+        self.assertTrue((samples[:, 1] < samples[:, 2]).all())
+        self.assertLessEqual(samples[:, 2].max(), len(loader_iter._workers))
+
+    def test_retire_workers(self):
+        if sys.platform == 'darwin' or sys.platform == 'win32':
+            return
+        loader_iter = self.run_loader(SlowDataset(80, 0), 3, 0.05)
+        self.assertTrue(any(loader_iter._worker_retired))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,140 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.collate import SchemaCollateFn, default_collate_fn
+
+
+def make_sample(idx, seq_len=4):
+    return {
+        'image': np.full([3, 2], idx, dtype='float32'),
+        'ids': np.arange(seq_len, dtype='int64'),
+        'label': idx,
+        'name': f'sample_{idx}',
+        'extra': [np.array([idx], dtype='int32'), 0.5],
+    }
+
+
+class RaggedDataset(Dataset):
+    def __getitem__(self, idx):
+        return make_sample(idx, seq_len=idx % 5 + 1)
+
+    def __len__(self):
+        return 20
+
+
+class TestSchemaCollateFn(unittest.TestCase):
+    def assert_batch_equal(self, out, ref):
+        self.assertEqual(out.keys(), ref.keys())
+        for key in ['image', 'ids', 'label']:
+            np.testing.assert_array_equal(out[key], ref[key])
+            self.assertEqual(out[key].dtype, ref[key].dtype)
+        self.assertEqual(out['name'], ref['name'])
+        np.testing.assert_array_equal(out['extra'][0], ref['extra'][0])
+        np.testing.assert_array_equal(out['extra'][1], ref['extra'][1])
+
+    def test_same_shape(self):
+        collate_fn = SchemaCollateFn()
+        for batch_size in [4, 4, 2]:
+            batch = [make_sample(i) for i in range(batch_size)]
+            self.assert_batch_equal(
+                collate_fn(batch), default_collate_fn(batch)
+            )
+
+    def test_ragged_padding(self):
+        collate_fn = SchemaCollateFn(padding_value=-1)
+        batch = [make_sample(i, seq_len=i + 1) for i in range(3)]
+        out = collate_fn(batch)
+        np.testing.assert_array_equal(
+            out['ids'], [[0, -1, -1], [0, 1, -1], [0, 1, 2]]
+        )
+
+    def test_reuse_buffers(self):
+        batch = [make_sample(i) for i in range(4)]
+        collate_fn = SchemaCollateFn()
+        first = collate_fn(batch)['image']
+        second = collate_fn(batch)['image']
+        self.assertTrue(np.shares_memory(first, second))
+
+        collate_fn = SchemaCollateFn(reuse_buffers=False)
+        first = collate_fn(batch)['image']
+        second = collate_fn(batch)['image']
+        self.assertFalse(np.shares_memory(first, second))
+
+    def test_schema_mismatch(self):
+        collate_fn = SchemaCollateFn()
+        collate_fn([make_sample(i) for i in range(2)])
+        batch = [np.full([2], i) for i in range(2)]
+        np.testing.assert_array_equal(
+            collate_fn(batch), default_collate_fn(batch)
+        )
+
+    def test_extra_fields(self):
+        collate_fn = SchemaCollateFn()
+        collate_fn([make_sample(i) for i in range(2)])
+
+        # extra dict key
+        batch = [make_sample(i) for i in range(3)]
+        for sample in batch:
+            sample['weight'] = np.ones([2], dtype='float32')
+        out = collate_fn(batch)
+        self.assert_batch_equal(out, default_collate_fn(batch))
+        np.testing.assert_array_equal(out['weight'], np.ones([3, 2]))
+
+        # longer list
+        batch = [make_sample(i) for i in range(3)]
+        for sample in batch:
+            sample['extra'].append(7)
+        out = collate_fn(batch)
+        self.assertEqual(len(out['extra']), 3)
+        np.testing.assert_array_equal(out['extra'][2], [7, 7, 7])
+
+        # only a later sample of the batch has a longer list
+        batch = [make_sample(i) for i in range(3)]
+        batch[2]['extra'].append(7)
+        with self.assertRaises(RuntimeError):
+            collate_fn(batch)
+
+        # matching batches still use the schema
+        batch = [make_sample(i) for i in range(4)]
+        first = collate_fn(batch)['image']
+        second = collate_fn(batch)['image']
+        self.assertTrue(np.shares_memory(first, second))
+
+    def test_tensor(self):
+        collate_fn = SchemaCollateFn()
+        batch = [(paddle.full([2], i), i) for i in range(3)]
+        out = collate_fn(batch)
+        np.testing.assert_array_equal(
+            out[0].numpy(), default_collate_fn(batch)[0].numpy()
+        )
+
+    def test_dataloader(self):
+        loader = DataLoader(
+            RaggedDataset(), batch_size=4, collate_fn=SchemaCollateFn()
+        )
+        for i, data in enumerate(loader):
+            indices = range(i * 4, i * 4 + 4)
+            max_len = max(idx % 5 + 1 for idx in indices)
+            self.assertEqual(data['ids'].shape, [4, max_len])
+            self.assertEqual(data['label'].numpy().tolist(), list(indices))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+
+IMAGE_SIZE = 16
+
+
+class SequenceDataset(Dataset):
+    def __init__(self, num_samples):
+        self.num_samples = num_samples
+
+    def __getitem__(self, idx):
+        image = np.full([IMAGE_SIZE], idx, dtype='float32')
+        label = np.array([idx], dtype='int64')
+        return {'image': image, 'label': label, 'name': f'sample_{idx}'}
+
+    def __len__(self):
+        return self.num_samples
+
+
+class RaggedDataset(SequenceDataset):
+    def __getitem__(self, idx):
+        # samples grow along epoch, later batches cannot fit in the ring
+        # slots sized by the first batch and fallback to ordinary transport
+        return np.full([idx + 1], idx, dtype='float32')
+
+
+def ragged_collate(batch):
+    max_len = max(len(s) for s in batch)
+    out = np.zeros([len(batch), max_len], dtype='float32')
+    for i, s in enumerate(batch):
+        out[i, : len(s)] = s
+    return out
+
+
+class TestDataLoaderSharedMemoryRing(unittest.TestCase):
+    def setUp(self):
+        os.environ['FLAGS_dataloader_use_shm_ring'] = '1'
+
+    def tearDown(self):
+        del os.environ['FLAGS_dataloader_use_shm_ring']
+
+    def run_loader(self, persistent_workers):
+        dataset = SequenceDataset(30)
+        loader = DataLoader(
+            dataset,
+            batch_size=4,
+            num_workers=2,
+            persistent_workers=persistent_workers,
+        )
+        for _ in range(2):
+            indices = []
+            for data in loader:
+                image, label = data['image'], data['label']
+                self.assertEqual(image.shape[1], IMAGE_SIZE)
+                np.testing.assert_array_equal(
+                    image.numpy(),
+                    np.repeat(label.numpy(), IMAGE_SIZE, axis=1).astype(
+                        'float32'
+                    ),
+                )
+                self.assertEqual(
+                    data['name'],
+                    [f'sample_{i}' for i in label.numpy().flatten()],
+                )
+                indices.extend(label.numpy().flatten().tolist())
+            self.assertEqual(indices, list(range(30)))
+
+    def test_main(self):
+        with paddle.base.dygraph.guard(paddle.CPUPlace()):
+            for persistent_workers in [False, True]:
+                self.run_loader(persistent_workers)
+
+    def test_ragged_fallback(self):
+        with paddle.base.dygraph.guard(paddle.CPUPlace()):
+            loader = DataLoader(
+                RaggedDataset(24),
+                batch_size=4,
+                num_workers=2,
+                collate_fn=ragged_collate,
+            )
+            for i, data in enumerate(loader):
+                expected = ragged_collate(
+                    [
+                        np.full([idx + 1], idx, dtype='float32')
+                        for idx in range(i * 4, i * 4 + 4)
+                    ]
+                )
+                np.testing.assert_array_equal(data.numpy(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
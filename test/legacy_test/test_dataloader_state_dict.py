@@ -0,0 +1,118 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset, DistributedBatchSampler
+
+SAMPLE_NUM = 60
+BATCH_SIZE = 4
+
+
+class IndexDataset(Dataset):
+    def __init__(self, num_samples):
+        self.num_samples = num_samples
+        self.read_indices = []
+
+    def __getitem__(self, idx):
+        self.read_indices.append(idx)
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.num_samples
+
+
+class TestDataLoaderStateDict(unittest.TestCase):
+    def setUp(self):
+        self.num_workers = 0
+        self.persistent_workers = False
+
+    def create_loader(self, dataset, shuffle, batch_sampler=None):
+        if batch_sampler is not None:
+            return DataLoader(
+                dataset,
+                batch_sampler=batch_sampler,
+                num_workers=self.num_workers,
+                persistent_workers=self.persistent_workers,
+            )
+        return DataLoader(
+            dataset,
+            batch_size=BATCH_SIZE,
+            shuffle=shuffle,
+            num_workers=self.num_workers,
+            persistent_workers=self.persistent_workers,
+        )
+
+    def check_resume(self, shuffle, distributed=False, num_consumed=6):
+        def create_loader(dataset):
+            batch_sampler = None
+            if distributed:
+                batch_sampler = DistributedBatchSampler(
+                    dataset,
+                    batch_size=BATCH_SIZE,
+                    num_replicas=2,
+                    rank=1,
+                    shuffle=shuffle,
+                )
+            return self.create_loader(dataset, shuffle, batch_sampler)
+
+        np.random.seed(2024)
+        loader = create_loader(IndexDataset(SAMPLE_NUM))
+        loader_iter = iter(loader)
+        consumed = [next(loader_iter).numpy() for _ in range(num_consumed)]
+        state = loader.state_dict()
+        self.assertEqual(state['num_yielded'], num_consumed)
+        remaining = [data.numpy() for data in loader_iter]
+
+        dataset = IndexDataset(SAMPLE_NUM)
+        resumed = create_loader(dataset)
+        resumed.load_state_dict(state)
+        resumed_data = [data.numpy() for data in resumed]
+        self.assertEqual(len(resumed_data), len(remaining))
+        for x, y in zip(resumed_data, remaining):
+            np.testing.assert_array_equal(x, y)
+
+        # consumed samples should not be read again
+        consumed = {int(i) for batch in consumed for i in batch.flatten()}
+        if self.num_workers == 0:
+            self.assertFalse(consumed & set(dataset.read_indices))
+
+    def test_main(self):
+        with paddle.base.dygraph.guard(paddle.CPUPlace()):
+            for shuffle in [False, True]:
+                self.check_resume(shuffle)
+                self.check_resume(shuffle, distributed=True, num_consumed=3)
+
+    def test_no_iteration(self):
+        loader = self.create_loader(IndexDataset(SAMPLE_NUM), shuffle=False)
+        self.assertEqual(loader.state_dict()['num_yielded'], 0)
+
+
+class TestDataLoaderStateDictMultiProcess(TestDataLoaderStateDict):
+    def setUp(self):
+        self.num_workers = 2
+        self.persistent_workers = False
+
+
+class TestDataLoaderStateDictPersistentWorkers(TestDataLoaderStateDict):
+    def setUp(self):
+        self.num_workers = 2
+        self.persistent_workers = True
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -85,6 +85,42 @@ class TestFolderDatasets(unittest.TestCase):
         for _ in loader:
             pass
 
+    def test_index_file(self):
+        index_file = os.path.join(self.empty_dir, 'index.npz')
+        expected = DatasetFolder(self.data_dir)
+        for _ in range(2):
+            dataset_folder = DatasetFolder(self.data_dir, index_file=index_file)
+            self.assertTrue(os.path.exists(index_file))
+            self.assertEqual(list(dataset_folder.samples), expected.samples)
+            self.assertEqual(list(dataset_folder.targets), expected.targets)
+            for _ in dataset_folder:
+                pass
+
+        # the index is outdated after adding a sample
+        fake_img = (np.random.random((32, 32, 3)) * 255).astype('uint8')
+        cv2.imwrite(os.path.join(self.data_dir, 'class_1', '2.jpg'), fake_img)
+        dataset_folder = DatasetFolder(self.data_dir, index_file=index_file)
+        self.assertEqual(len(dataset_folder), 5)
+        self.assertEqual(dataset_folder[4][1], 1)
+
+        # a foreign npz file is treated as a stale index and replaced
+        np.savez(index_file, key=np.array('other'))
+        dataset_folder = DatasetFolder(self.data_dir, index_file=index_file)
+        self.assertEqual(len(dataset_folder), 5)
+        np.savez(index_file, data=np.arange(3))
+        dataset_folder = DatasetFolder(self.data_dir, index_file=index_file)
+        self.assertEqual(len(dataset_folder), 5)
+        with np.load(index_file) as index:
+            self.assertIn('key', index)
+
+        index_file = os.path.join(self.empty_dir, 'image_index.npz')
+        expected = ImageFolder(self.data_dir)
+        for _ in range(2):
+            loader = ImageFolder(self.data_dir, index_file=index_file)
+            self.assertEqual(list(loader.samples), expected.samples)
+            for _ in loader:
+                pass
+
     def test_errors(self):
         with self.assertRaises(RuntimeError):
             ImageFolder(self.empty_dir)
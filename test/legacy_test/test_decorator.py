@@ -129,6 +129,10 @@ class TestShuffle(unittest.TestCase):
             self.assertEqual(total, 10)
 
 
+def square(x):
+    return x * x
+
+
 class TestXmap(unittest.TestCase):
     def test_xmap(self):
         def mapper(x):
@@ -152,6 +156,24 @@ class TestXmap(unittest.TestCase):
                         for idx, e in enumerate(result):
                             self.assertEqual(e, mapper(idx))
 
+    def test_xmap_process_pool(self):
+        for order in (True, False):
+            for chunk_size in (1, 3):
+                for size in (1, 4):
+                    reader = paddle.reader.xmap_readers(
+                        square,
+                        reader_creator_10(0),
+                        2,
+                        size,
+                        order,
+                        use_process_pool=True,
+                        chunk_size=chunk_size,
+                    )
+                    result = list(reader())
+                    if not order:
+                        result.sort()
+                    self.assertEqual(result, [square(i) for i in range(10)])
+
 
 class TestMultiProcessReader(unittest.TestCase):
     def setup(self):
@@ -12,12 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
 import unittest
+from types import SimpleNamespace
 
 import paddle
+from paddle.distributed.fleet.utils import tensor_fusion_helper
 from paddle.distributed.fleet.utils.tensor_fusion_helper import (
     HOOK_ACTION,
     FusedCommBuffer,
+    GradBucketPlanner,
+    assign_group_by_size,
 )
 
 
@@ -48,5 +54,110 @@ class TestFusedCommBufferGradChecker(unittest.TestCase):
             pass
 
 
+class TestGradBucketPlanner(unittest.TestCase):
+    def test_plan_from_ready_order(self):
+        params = [paddle.nn.Linear(10, 10).weight for _ in range(4)]
+        group_size = 128 * 1024 * 1024
+        with tempfile.TemporaryDirectory() as plan_dir:
+            planner = GradBucketPlanner(plan_dir)
+            # nothing recorded, keep the parameter order and the bucket size
+            ordered, size = planner.plan(params, group_size)
+            self.assertEqual(ordered, params)
+            self.assertEqual(size, group_size)
+
+            ready_order = [params[2], params[0], params[3], params[1]]
+            for param in ready_order + ready_order:
+                planner.record_ready(param)
+            self.assertEqual(len(os.listdir(plan_dir)), 1)
+
+            planner = GradBucketPlanner(plan_dir)
+            ordered, size = planner.plan(params, group_size)
+            self.assertEqual(ordered, ready_order)
+            self.assertEqual(size, group_size)
+            # the same layout is planned again
+            planner = GradBucketPlanner(plan_dir)
+            self.assertEqual(planner.plan(params, group_size), (ordered, size))
+
+    def test_bucket_size(self):
+        group_size = 128 * 1024 * 1024
+        with tempfile.TemporaryDirectory() as plan_dir:
+            planner = GradBucketPlanner(plan_dir)
+        self.assertEqual(planner._bucket_size(group_size, None), group_size)
+        # 100us latency and 10GB/s bandwidth
+        self.assertEqual(
+            planner._bucket_size(group_size, [1e-4, 1e-10]),
+            int(1e-4 * 0.9 / (1e-10 * 0.1)),
+        )
+        self.assertEqual(
+            planner._bucket_size(group_size, [1.0, 1e-10]), group_size
+        )
+
+    def test_model_by_group(self):
+        params = [paddle.nn.Linear(10, 10).weight for _ in range(4)]
+        group_size = 128 * 1024 * 1024
+        with tempfile.TemporaryDirectory() as plan_dir:
+            planner = GradBucketPlanner(plan_dir)
+            planner.plan(params, group_size)
+            for param in params:
+                planner.record_ready(param)
+
+            planner = GradBucketPlanner(plan_dir)
+            planner._models["0"] = [1e-4, 1e-10]
+            group_a = SimpleNamespace(nranks=1, ranks=[0])
+            group_b = SimpleNamespace(nranks=1, ranks=[1])
+            _, size = planner.plan(params[:2], group_size, group_a)
+            self.assertEqual(size, int(1e-4 * 0.9 / (1e-10 * 0.1)))
+            _, size = planner.plan(params[2:], group_size, group_b)
+            self.assertEqual(size, group_size)
+
+    def test_layout_mismatch(self):
+        params = [paddle.nn.Linear(10, 10).weight for _ in range(4)]
+        group_size = 128 * 1024 * 1024
+        comm_group = SimpleNamespace(nranks=1, ranks=[0])
+        with tempfile.TemporaryDirectory() as plan_dir:
+            planner = GradBucketPlanner(plan_dir)
+            planner.plan(params, group_size, comm_group)
+            for param in params:
+                planner.record_ready(param)
+            planner = GradBucketPlanner(plan_dir)
+            planner.plan(params, group_size, comm_group)
+
+            # a different bucket size changes the saved layout
+            planner = GradBucketPlanner(plan_dir)
+            planner._models["0"] = [1e-4, 1e-10]
+            with self.assertRaises(RuntimeError):
+                planner.plan(params, group_size, comm_group)
+
+            # changed parameters are not planned again
+            planner = GradBucketPlanner(plan_dir)
+            new_param = paddle.nn.Linear(10, 10).weight
+            with self.assertRaises(RuntimeError):
+                planner.plan([*params, new_param], group_size, comm_group)
+
+    def test_plan_with_comm_overlap_only(self):
+        params = [paddle.nn.Linear(10, 10).weight for _ in range(4)]
+        comm_group = SimpleNamespace(nranks=1, ranks=[0])
+        with tempfile.TemporaryDirectory() as plan_dir:
+            planner = GradBucketPlanner(plan_dir)
+            tensor_fusion_helper.__bucket_planner__ = planner
+            try:
+                # buffers without backward hooks keep the parameter order
+                var_groups = assign_group_by_size(params, 1, comm_group)
+                self.assertEqual(
+                    [p for g in var_groups.values() for p in g], params
+                )
+                self.assertEqual(len(planner._planned), 0)
+
+                var_groups = assign_group_by_size(
+                    params, 1, comm_group, comm_overlap=True
+                )
+                self.assertEqual(
+                    [p for g in var_groups.values() for p in g], params
+                )
+                self.assertEqual(len(planner._planned), 4)
+            finally:
+                tensor_fusion_helper.__bucket_planner__ = None
+
+
 if __name__ == "__main__":
     unittest.main()
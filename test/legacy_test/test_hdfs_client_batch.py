@@ -0,0 +1,185 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+import sys
+import tempfile
+import unittest
+
+from paddle.distributed.fleet.utils.fs import (
+    FSFileExistsError,
+    FSFileNotExistsError,
+    HDFSClient,
+)
+
+# A stand-in of `hadoop fs` which works on the local filesystem and logs
+# every invocation, so that the number of hadoop commands can be checked.
+FAKE_HADOOP = '''
+import os
+import shutil
+import sys
+
+args = [a for a in sys.argv[2:] if not a.startswith("-D")]
+cmd, args = args[0][1:], args[1:]
+local_args = [a.split(":", 1)[1] if a.startswith("hdfs:") else a for a in args]
+with open(os.environ["FAKE_HADOOP_LOG"], "a") as f:
+    f.write(cmd + "\\n")
+
+
+def line(path, shown):
+    kind = "d" if os.path.isdir(path) else "-"
+    size = 0 if os.path.isdir(path) else os.path.getsize(path)
+    return f"{kind}rwxr-xr-x - user group {size} 2024-01-01 00:00 {shown}"
+
+
+ret = 0
+if cmd == "ls":
+    only_self = args[0] == "-d"
+    start = 1 if only_self else 0
+    for shown, path in zip(args[start:], local_args[start:]):
+        if not os.path.exists(path):
+            print(f"ls: `{shown}': No such file or directory", file=sys.stderr)
+            ret = 1
+        elif only_self or not os.path.isdir(path):
+            print(line(path, shown))
+        else:
+            children = sorted(os.listdir(path))
+            if children:
+                print(f"Found {len(children)} items")
+            for child in children:
+                print(line(os.path.join(path, child), f"{shown}/{child}"))
+elif cmd == "test":
+    check = os.path.isdir if local_args[0] == "-d" else os.path.exists
+    ret = 0 if check(local_args[1]) else 1
+elif cmd == "mkdir":
+    os.makedirs(local_args[-1], exist_ok=True)
+elif cmd in ("put", "get", "mv"):
+    src, dst = local_args
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if cmd == "mv":
+        shutil.move(src, dst)
+    elif os.path.isdir(src):
+        shutil.copytree(src, dst)
+    else:
+        shutil.copy(src, dst)
+elif cmd == "rm":
+    os.remove(local_args[0])
+elif cmd == "rmr":
+    shutil.rmtree(local_args[0])
+elif cmd == "touchz":
+    open(local_args[0], "a").close()
+sys.exit(ret)
+'''
+
+
+class HDFSClientBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = self.temp_dir.name
+        os.makedirs(os.path.join(root, "hadoop", "bin"))
+        hadoop_bin = os.path.join(root, "hadoop", "bin", "hadoop")
+        with open(hadoop_bin, "w") as f:
+            f.write(f"#!{sys.executable}\n{FAKE_HADOOP}")
+        os.chmod(hadoop_bin, os.stat(hadoop_bin).st_mode | stat.S_IEXEC)
+
+        self.log = os.path.join(root, "hadoop.log")
+        open(self.log, "w").close()
+        os.environ["FAKE_HADOOP_LOG"] = self.log
+        self.fs = HDFSClient(
+            os.path.join(root, "hadoop"), None, time_out=5000, sleep_inter=100
+        )
+        self.fs_root = os.path.join(root, "fs")
+        os.makedirs(self.fs_root)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _path(self, *names):
+        return os.path.join(self.fs_root, *names)
+
+    def _num_cmds(self):
+        with open(self.log) as f:
+            cmds = f.read().split()
+        open(self.log, "w").close()
+        return len(cmds)
+
+    def test_batch_stat(self):
+        self.fs._max_paths_per_cmd = 4
+        for i in range(3):
+            os.makedirs(self._path(f"dir_{i}"))
+            open(self._path(f"dir_{i}", "part_0"), "w").close()
+        open(self._path("file"), "w").close()
+        paths = [self._path(f"dir_{i}") for i in range(3)]
+        paths += [self._path("file"), self._path("not_exists")]
+        paths += ["hdfs:" + self._path("dir_0")]
+        self._num_cmds()
+
+        self.assertEqual(
+            self.fs.is_exist_batch(paths), [True, True, True, True, False, True]
+        )
+        self.assertEqual(self._num_cmds(), 2)
+        self.assertEqual(
+            self.fs.is_dir_batch(paths),
+            [True, True, True, False, False, True],
+        )
+        self.assertEqual(
+            self.fs.ls_dir_batch(paths[:3] + paths[4:5]),
+            [([], ["part_0"])] * 3 + [([], [])],
+        )
+        self.assertEqual(self._num_cmds(), 3)
+        self.assertTrue(self.fs.is_dir(paths[0]))
+        self.assertFalse(self.fs.is_dir(paths[3]))
+        self.assertFalse(self.fs.is_dir(paths[4]))
+        self.assertEqual(self._num_cmds(), 3)
+
+    def test_mv_delete(self):
+        src, dst = self._path("src"), self._path("dst")
+        self.fs.touch(src)
+        self.fs.mkdirs(dst)
+        with self.assertRaises(FSFileExistsError):
+            self.fs.mv(src, dst)
+        self.fs.mv(src, dst, overwrite=True)
+        self.assertEqual(self.fs.is_exist_batch([src, dst]), [False, True])
+        with self.assertRaises(FSFileNotExistsError):
+            self.fs.mv(src, dst)
+        self.fs.delete(dst)
+        self.fs.delete(dst)
+        self.assertFalse(self.fs.is_exist(dst))
+
+    def test_upload_download(self):
+        local_dir = self._path("local")
+        os.makedirs(local_dir)
+        for i in range(8):
+            with open(os.path.join(local_dir, f"part_{i}"), "w") as f:
+                f.write(str(i))
+        remote_dir = self._path("remote")
+        self.fs.mkdirs(remote_dir)
+        self.fs.upload(local_dir, remote_dir, multi_processes=3)
+        self.assertEqual(
+            self.fs.ls_dir(remote_dir),
+            ([], [f"part_{i}" for i in range(8)]),
+        )
+
+        download_dir = self._path("download")
+        os.makedirs(download_dir)
+        self.fs.download(remote_dir, download_dir, multi_processes=3)
+        self.assertEqual(
+            sorted(os.listdir(download_dir)), [f"part_{i}" for i in range(8)]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
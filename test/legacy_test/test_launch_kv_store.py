@@ -0,0 +1,134 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import threading
+import time
+import unittest
+
+from paddle.distributed.launch.utils.kv_client import KVClient
+from paddle.distributed.launch.utils.kv_server import KVServer, KVStore
+
+
+class TestKVStore(unittest.TestCase):
+    def test_prefix_bounds(self):
+        keys = [
+            "/jo",
+            "/job/a",
+            "/job/a~",
+            "/job/b",
+            "/job/b!",
+            "/job/b/0",
+            "/job/bb",
+            "/job/c",
+            "/jobs/b",
+        ]
+        store = KVStore({key: key.encode() for key in keys[::2]})
+        for key in keys[1::2]:
+            store.put(key, key.encode())
+        self.assertEqual(
+            list(store.get_prefix("/job/b")),
+            ["/job/b", "/job/b!", "/job/b/0", "/job/bb"],
+        )
+        self.assertEqual(list(store.get_prefix("/job/b/")), ["/job/b/0"])
+        self.assertEqual(store.get_prefix("/job/bc"), {})
+        self.assertEqual(store.get_prefix("/k"), {})
+        self.assertEqual(list(store.get_prefix("")), sorted(keys))
+
+    def test_prefix_random_keys(self):
+        rng = random.Random(2024)
+        store = KVStore()
+        keys = set()
+        for _ in range(500):
+            key = "/" + "".join(rng.choice("ab/") for _ in range(5))
+            keys.add(key)
+            store.put(key, b"")
+        for prefix in ["/", "/a", "/ab", "/a/", "/b/a", "/bbb"]:
+            self.assertEqual(
+                list(store.get_prefix(prefix)),
+                sorted(k for k in keys if k.startswith(prefix)),
+            )
+
+    def test_wait_by_put(self):
+        store = KVStore()
+        store.put("/peers/0", b"0")
+
+        def put_later():
+            for i in range(1, 4):
+                time.sleep(0.05)
+                store.put(f"/peers/{i}", str(i).encode())
+                # keys of other prefixes do not satisfy the wait
+                store.put(f"/other/{i}", b"")
+
+        thread = threading.Thread(target=put_later)
+        thread.start()
+        start = time.monotonic()
+        items = store.get_prefix("/peers/", wait=4, timeout=10)
+        elapsed = time.monotonic() - start
+        thread.join()
+        self.assertEqual(
+            items, {f"/peers/{i}": str(i).encode() for i in range(4)}
+        )
+        self.assertLess(elapsed, 5)
+
+    def test_wait_timeout(self):
+        store = KVStore({"/peers/0": b"0"})
+        start = time.monotonic()
+        items = store.get_prefix("/peers/", wait=2, timeout=0.2)
+        elapsed = time.monotonic() - start
+        # the items found so far are returned on timeout
+        self.assertEqual(items, {"/peers/0": b"0"})
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 5)
+        # no wait returns at once
+        self.assertEqual(store.get_prefix("/peers/", wait=0, timeout=10), items)
+
+    def test_delete(self):
+        store = KVStore()
+        for key in ["/a/0", "/a/1", "/a/2"]:
+            store.put(key, b"v")
+        store.put("/a/1", b"w")
+        self.assertEqual(store.get_prefix("/a/1"), {"/a/1": b"w"})
+        self.assertTrue(store.delete("/a/1"))
+        self.assertFalse(store.delete("/a/1"))
+        self.assertFalse(store.delete("/a"))
+        self.assertEqual(list(store.get_prefix("/a/")), ["/a/0", "/a/2"])
+        self.assertEqual(store.keys, ["/a/0", "/a/2"])
+        store.put("/a/1", b"v")
+        self.assertEqual(store.keys, ["/a/0", "/a/1", "/a/2"])
+
+
+class TestKVServer(unittest.TestCase):
+    def setUp(self):
+        self.server = KVServer(0)
+        self.server.start()
+        self.client = KVClient(f"127.0.0.1:{self.server.server_address[1]}")
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_long_poll(self):
+        self.assertTrue(self.client.wait_server_ready())
+        self.client.put("/peers/0", "0")
+        timer = threading.Timer(0.1, self.client.put, ("/peers/1", "1"))
+        timer.start()
+        items = self.client.get_prefix("/peers/", wait=2, timeout=10)
+        timer.join()
+        self.assertEqual(items, {"/peers/0": "0", "/peers/1": "1"})
+        self.assertTrue(self.client.delete("/peers/0"))
+        self.assertEqual(self.client.get_prefix("/peers/"), {"/peers/1": "1"})
+
+
+if __name__ == '__main__':
+    unittest.main()
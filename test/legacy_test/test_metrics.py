@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import inspect
 import unittest
 
 import numpy as np
@@ -226,6 +227,23 @@ class TestPrecision(unittest.TestCase):
         self.assertEqual(m.fp, 0.0)
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_on_device(self):
+        x = np.random.random(size=(64, 1)).astype('float32')
+        y = np.random.randint(2, size=(64, 1)).astype('int64')
+
+        expected = paddle.metric.Precision()
+        m = paddle.metric.Precision(on_device=True)
+        for i in range(0, 64, 16):
+            expected.update(x[i : i + 16], y[i : i + 16])
+            m.update(
+                paddle.to_tensor(x[i : i + 16]), paddle.to_tensor(y[i : i + 16])
+            )
+        self.assertAlmostEqual(m.accumulate(), expected.accumulate())
+        self.assertEqual((m.tp, m.fp), (expected.tp, expected.fp))
+
+        m.reset()
+        self.assertEqual(m.accumulate(), 0.0)
+
 
 class TestRecall(unittest.TestCase):
     def test_1d(self):
@@ -249,6 +267,24 @@ class TestRecall(unittest.TestCase):
         self.assertEqual(m.fn, 0.0)
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_on_device(self):
+        x = np.random.random(size=(64, 1)).astype('float32')
+        x[:4] = 0.5
+        y = np.random.randint(2, size=(64, 1)).astype('int64')
+
+        expected = paddle.metric.Recall()
+        m = paddle.metric.Recall(on_device=True)
+        for i in range(0, 64, 16):
+            expected.update(x[i : i + 16], y[i : i + 16])
+            m.update(
+                paddle.to_tensor(x[i : i + 16]), paddle.to_tensor(y[i : i + 16])
+            )
+        self.assertAlmostEqual(m.accumulate(), expected.accumulate())
+        self.assertEqual((m.tp, m.fn), (expected.tp, expected.fn))
+
+        m.reset()
+        self.assertEqual(m.accumulate(), 0.0)
+
 
 class TestAuc(unittest.TestCase):
     def test_auc_numpy(self):
@@ -295,6 +331,65 @@ class TestAuc(unittest.TestCase):
         m.reset()
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_auc_on_device(self):
+        p = np.random.random(size=(256, 1))
+        x = np.concatenate([1 - p, p], axis=1).astype('float32')
+        y = np.random.randint(2, size=(256, 1)).astype('int64')
+
+        expected = paddle.metric.Auc()
+        m = paddle.metric.Auc(on_device=True)
+        for i in range(0, 256, 64):
+            expected.update(x[i : i + 64], y[i : i + 64])
+            m.update(
+                paddle.to_tensor(x[i : i + 64]), paddle.to_tensor(y[i : i + 64])
+            )
+        self.assertAlmostEqual(m.accumulate(), expected.accumulate())
+        np.testing.assert_array_equal(m._stat_pos, expected._stat_pos)
+        np.testing.assert_array_equal(m._stat_neg, expected._stat_neg)
+
+        m.reset()
+        self.assertEqual(m.accumulate(), 0.0)
+
+    def test_auc_out_of_range(self):
+        p = np.array([[-0.2], [0.5], [1.3], [1.0]])
+        x = np.concatenate([1 - p, p], axis=1).astype('float32')
+        y = np.array([[0], [1], [1], [0]]).astype('int64')
+
+        # out of range probabilities are errors on host, e.g. logits
+        with self.assertRaises(AssertionError):
+            paddle.metric.Auc(num_thresholds=10).update(x, y)
+        with self.assertRaises(AssertionError):
+            paddle.metric.Auc(num_thresholds=10).update(
+                paddle.to_tensor(x), paddle.to_tensor(y)
+            )
+
+        # and are clipped to the first or last bucket on device
+        p = np.clip(p, 0, 1)
+        expected = paddle.metric.Auc(num_thresholds=10)
+        expected.update(np.concatenate([1 - p, p], axis=1), y)
+        np.testing.assert_array_equal(
+            expected._stat_pos, [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+        )
+        np.testing.assert_array_equal(
+            expected._stat_neg, [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]
+        )
+        m = paddle.metric.Auc(num_thresholds=10, on_device=True)
+        m.update(paddle.to_tensor(x), paddle.to_tensor(y))
+        self.assertAlmostEqual(m.accumulate(), expected.accumulate())
+        np.testing.assert_array_equal(m._stat_pos, expected._stat_pos)
+        np.testing.assert_array_equal(m._stat_neg, expected._stat_neg)
+
+    def test_keyword_only_on_device(self):
+        for metric in [
+            paddle.metric.Precision,
+            paddle.metric.Recall,
+            paddle.metric.Auc,
+        ]:
+            self.assertEqual(
+                inspect.signature(metric).parameters['on_device'].kind,
+                inspect.Parameter.KEYWORD_ONLY,
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -975,6 +975,128 @@ class TestModelFunction(unittest.TestCase):
             np.testing.assert_almost_equal(losses[0], losses[1], decimal=4)
             np.testing.assert_almost_equal(losses[0], losses[2], decimal=4)
 
+    def test_fit_defer_sync(self):
+        class LogsRecorder(paddle.callbacks.Callback):
+            def __init__(self, read_steps=None):
+                super().__init__()
+                self.read_steps = read_steps
+                self.logs = {}
+                self.num_pending = []
+                self.keys = []
+
+            def on_train_batch_end(self, step, logs=None):
+                # the metric outputs kept on device before reading the logs
+                adapter = self.model._adapter
+                self.num_pending.append(len(adapter._pending_metric_outs))
+                self.keys.append(('loss' in logs, len(logs), logs['step']))
+                if self.read_steps is None or step in self.read_steps:
+                    self.logs[len(self.num_pending)] = dict(logs)
+
+        device = paddle.set_device('cpu')
+        base.enable_dygraph(device)
+        dim = 20
+        data = paddle.io.TensorDataset(
+            [
+                paddle.rand([40, dim]),
+                paddle.randint(0, 10, [40, 1], dtype='int64'),
+            ]
+        )
+        inputs = [InputSpec([None, dim], 'float32', 'x')]
+        labels = [InputSpec([None, 1], 'int64', 'label')]
+
+        def run(defer_sync, read_steps=None):
+            self.set_seed()
+            net = MyModel()
+            optim = paddle.optimizer.SGD(
+                learning_rate=0.001, parameters=net.parameters()
+            )
+            model = Model(net, inputs, labels)
+            model.prepare(
+                optim, loss=CrossEntropyLoss(), metrics=Accuracy(topk=(1, 2))
+            )
+            recorder = LogsRecorder(read_steps)
+            model.fit(
+                data,
+                batch_size=4,
+                epochs=2,
+                log_freq=4,
+                shuffle=False,
+                verbose=0,
+                callbacks=[recorder],
+                defer_sync=defer_sync,
+            )
+            return recorder
+
+        expected = run(False)
+        # logs read every step are synchronized every step
+        recorder = run(True)
+        self.assertEqual(recorder.logs, expected.logs)
+        self.assertEqual(recorder.keys, expected.keys)
+        self.assertEqual(
+            recorder.num_pending, [1, 1, 1, 0, 1, 1, 1, 0, 1, 1] * 2
+        )
+
+        # logs are only synchronized when read or every log_freq steps
+        read_steps = [0, 5, 9]
+        recorder = run(True, read_steps)
+        base.disable_dygraph()
+        self.assertEqual(
+            recorder.logs,
+            {k: v for k, v in expected.logs.items() if v['step'] in read_steps},
+        )
+        self.assertEqual(recorder.keys, expected.keys)
+        self.assertEqual(
+            recorder.num_pending, [1, 1, 2, 0, 1, 2, 1, 0, 1, 2] * 2
+        )
+
+    def test_fit_fresh_logs(self):
+        class KeysRecorder(paddle.callbacks.Callback):
+            def __init__(self):
+                super().__init__()
+                self.keys = []
+
+            def on_train_batch_begin(self, step, logs=None):
+                self.keys.append(set(logs))
+
+        device = paddle.set_device('cpu')
+        base.enable_dygraph(device)
+        dim = 20
+        data = paddle.io.TensorDataset(
+            [
+                paddle.rand([8, dim]),
+                paddle.randint(0, 10, [8, 1], dtype='int64'),
+            ]
+        )
+        inputs = [InputSpec([None, dim], 'float32', 'x')]
+        labels = [InputSpec([None, 1], 'int64', 'label')]
+
+        def run(metrics):
+            net = MyModel()
+            optim = paddle.optimizer.SGD(
+                learning_rate=0.001, parameters=net.parameters()
+            )
+            model = Model(net, inputs, labels)
+            model.prepare(optim, loss=CrossEntropyLoss(), metrics=metrics)
+            recorder = KeysRecorder()
+            model.fit(
+                data,
+                batch_size=4,
+                epochs=2,
+                shuffle=False,
+                verbose=0,
+                callbacks=[recorder],
+            )
+            return recorder.keys
+
+        run(Accuracy(topk=(1, 2)))
+        keys = run(None)
+        base.disable_dygraph()
+        # each epoch starts with empty logs, without the metrics of the
+        # previous Model
+        self.assertEqual(keys[0], set())
+        self.assertEqual(keys[1], {'loss', 'step', 'batch_size'})
+        self.assertEqual(keys[2], set())
+
 
 class TestModelWithLRScheduler(unittest.TestCase):
     def test_fit_by_step(self):
@@ -14,6 +14,8 @@
 
 import unittest
 
+import numpy as np
+
 from paddle.profiler import statistic_helper
 
 
@@ -130,6 +132,26 @@ class TestStatisticHelper(unittest.TestCase):
         dst = statistic_helper.subtract_ranges(src1, src2)
         self.assertEqual(dst, [(10, 11)])
 
+    def test_range_arrays(self):
+        src1 = np.array([[9, 12], [1, 7], [14, 18]])
+        src2 = np.array([[10, 13], [3, 8], [15, 19], [20, 22]])
+        dst = statistic_helper.merge_self_range_array(src1)
+        np.testing.assert_array_equal(dst, [[1, 7], [9, 12], [14, 18]])
+        dst = statistic_helper.merge_range_arrays(src1, src2)
+        np.testing.assert_array_equal(
+            dst, [[1, 8], [9, 13], [14, 19], [20, 22]]
+        )
+        dst = statistic_helper.intersection_range_arrays(src1, src2)
+        np.testing.assert_array_equal(dst, [[3, 7], [10, 12], [15, 18]])
+        dst = statistic_helper.subtract_range_arrays(src2, src1)
+        np.testing.assert_array_equal(
+            dst, [[7, 8], [12, 13], [18, 19], [20, 22]]
+        )
+        self.assertEqual(statistic_helper.sum_ranges(src1), 13)
+        self.assertEqual(
+            statistic_helper.to_range_list(src1), [(9, 12), (1, 7), (14, 18)]
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,206 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.distributed.fleet.utils.offload_helper import (
+    OffloadEngine,
+    PinnedMemoryPool,
+)
+
+
+def make_tensors(shapes, dtype="float32"):
+    tensors = []
+    for i, shape in enumerate(shapes):
+        tensor = paddle.randn(shape).astype(dtype)
+        tensor.stop_gradient = i % 2 == 0
+        tensors.append(tensor)
+    return tensors
+
+
+class TestOffloadEngineSync(unittest.TestCase):
+    def test_sync_fallback(self):
+        paddle.set_device("cpu")
+        engine = OffloadEngine()
+        engine._async = False
+        tensors = make_tensors([[4, 8], [16], [2, 3, 5]])
+        expected = [t.numpy() for t in tensors]
+
+        group = engine.offload(tensors)
+        for host in group.hosts:
+            self.assertTrue(host.place.is_cpu_place())
+        # nothing is tracked without the side stream
+        self.assertEqual(len(engine._inflight), 0)
+        self.assertEqual(len(engine._groups), 0)
+
+        loaded = engine.load(group)
+        self.assertEqual(len(loaded), len(expected))
+        for tensor, value, src in zip(loaded, expected, tensors):
+            np.testing.assert_array_equal(tensor.numpy(), value)
+            self.assertEqual(tensor.stop_gradient, src.stop_gradient)
+
+        host = engine.to_host(tensors[0])
+        np.testing.assert_array_equal(host.numpy(), expected[0])
+        out = engine.to_device(host)
+        np.testing.assert_array_equal(out.numpy(), expected[0])
+
+
+class TestPinnedMemoryPool(unittest.TestCase):
+    def test_lru_eviction(self):
+        # 64 bytes for each buffer
+        pool = PinnedMemoryPool(max_bytes=200)
+        hosts = [paddle.zeros([16], "float32") for _ in range(2)]
+        hosts.append(paddle.zeros([4, 4], "float32"))
+        for host in hosts:
+            self.assertEqual(pool.release(host), [])
+        self.assertEqual(pool._free_bytes, 192)
+        self.assertEqual(len(pool._free[((16,), paddle.float32)]), 2)
+
+        # the least recently released ones are evicted beyond the budget
+        others = [paddle.zeros([8], "float64") for _ in range(2)]
+        evicted = pool.release(others[0])
+        self.assertEqual([id(h) for h in evicted], [id(hosts[0])])
+        self.assertEqual(pool._free_bytes, 192)
+        self.assertEqual(len(pool._free[((16,), paddle.float32)]), 1)
+        evicted = pool.release(others[1])
+        self.assertEqual([id(h) for h in evicted], [id(hosts[1])])
+        self.assertNotIn(((16,), paddle.float32), pool._free)
+
+        # a buffer larger than the budget is not kept
+        large = paddle.zeros([64], "float32")
+        evicted = pool.release(large)
+        self.assertEqual(
+            [id(h) for h in evicted],
+            [id(h) for h in [hosts[2], *others, large]],
+        )
+        self.assertEqual(len(pool._lru), 0)
+        self.assertEqual(pool._free_bytes, 0)
+
+    def test_clear(self):
+        pool = PinnedMemoryPool()
+        pool.release(paddle.zeros([16], "float32"))
+        pool.clear()
+        self.assertEqual(len(pool._free), 0)
+        self.assertEqual(len(pool._lru), 0)
+        self.assertEqual(pool._free_bytes, 0)
+
+
+@unittest.skipIf(
+    not paddle.is_compiled_with_cuda(), "offload runs async only on CUDA"
+)
+class TestOffloadEngineCUDA(unittest.TestCase):
+    def setUp(self):
+        paddle.set_device("gpu")
+        self.shapes = [[64, 128], [1024], [3, 5, 7]]
+
+    def test_offload_load(self):
+        engine = OffloadEngine()
+        for dtype in ["float32", "float16"]:
+            tensors = make_tensors(self.shapes, dtype)
+            expected = [t.numpy() for t in tensors]
+            group = engine.offload(tensors)
+            for host in group.hosts:
+                self.assertTrue(host.place.is_cuda_pinned_place())
+
+            loaded = engine.load(group)
+            for tensor, value, src in zip(loaded, expected, tensors):
+                self.assertTrue(tensor.place.is_gpu_place())
+                self.assertEqual(tensor.dtype, src.dtype)
+                self.assertEqual(tensor.stop_gradient, src.stop_gradient)
+                np.testing.assert_array_equal(tensor.numpy(), value)
+
+    def test_pinned_buffer_reuse(self):
+        engine = OffloadEngine()
+        group = engine.offload(make_tensors(self.shapes))
+        hosts = list(group.hosts)
+        engine.load(group)
+
+        # the next group of the same shapes copies into the same buffers
+        tensors = make_tensors(self.shapes)
+        expected = [t.numpy() for t in tensors]
+        group = engine.offload(tensors)
+        self.assertEqual(
+            sorted(id(h) for h in group.hosts), sorted(id(h) for h in hosts)
+        )
+        for tensor, value in zip(engine.load(group), expected):
+            np.testing.assert_array_equal(tensor.numpy(), value)
+
+        # buffers of other shapes are not reused
+        group = engine.offload(make_tensors([[7, 9]]))
+        self.assertNotIn(id(group.hosts[0]), [id(h) for h in hosts])
+        engine.load(group)
+
+    def test_pinned_budget_and_reset(self):
+        # room for the buffers of one group only
+        nbytes = 4 * (64 * 128 + 1024 + 3 * 5 * 7)
+        engine = OffloadEngine(max_pinned_bytes=nbytes)
+        groups = [engine.offload(make_tensors(self.shapes)) for _ in range(2)]
+        hosts = list(groups[0].hosts)
+        for group in reversed(groups):
+            engine.load(group)
+        # the buffers of the group released last are kept
+        self.assertEqual(engine._pool._free_bytes, nbytes)
+        self.assertEqual(
+            sorted(engine._pool._lru), sorted(id(h) for h in hosts)
+        )
+
+        engine.reset()
+        self.assertEqual(len(engine._inflight), 0)
+        self.assertEqual(len(engine._pool._lru), 0)
+        self.assertEqual(engine._pool._free_bytes, 0)
+        # the engine still works after reset
+        tensors = make_tensors(self.shapes)
+        expected = [t.numpy() for t in tensors]
+        for tensor, value in zip(
+            engine.load(engine.offload(tensors)), expected
+        ):
+            np.testing.assert_array_equal(tensor.numpy(), value)
+
+    def test_prefetch_previous_group(self):
+        engine = OffloadEngine(max_inflight=1)
+        all_tensors = [make_tensors(self.shapes) for _ in range(3)]
+        expected = [[t.numpy() for t in ts] for ts in all_tensors]
+        groups = [engine.offload(ts) for ts in all_tensors]
+        self.assertLessEqual(len(engine._inflight), 1)
+        self.assertTrue(all(g.loaded is None for g in groups))
+
+        # load in reverse order as in backward, each load starts copying the
+        # group offloaded before it
+        for i in reversed(range(3)):
+            loaded = engine.load(groups[i])
+            if i > 0:
+                self.assertIsNotNone(groups[i - 1].loaded)
+                self.assertIsNone(groups[i - 1].hosts)
+            if i > 1:
+                self.assertIsNone(groups[i - 2].loaded)
+            for tensor, value in zip(loaded, expected[i]):
+                np.testing.assert_array_equal(tensor.numpy(), value)
+        self.assertEqual(len(engine._groups), 0)
+
+    def test_to_host_and_device(self):
+        engine = OffloadEngine()
+        tensor = paddle.randn([32, 32])
+        host = engine.to_host(tensor)
+        self.assertTrue(host.place.is_cpu_place())
+        np.testing.assert_array_equal(host.numpy(), tensor.numpy())
+        out = engine.to_device(host)
+        self.assertTrue(out.place.is_gpu_place())
+        np.testing.assert_array_equal(out.numpy(), tensor.numpy())
+
+
+if __name__ == '__main__':
+    unittest.main()
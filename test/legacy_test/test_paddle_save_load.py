@@ -1118,6 +1118,175 @@ class TestAsyncSaveLoad(unittest.TestCase):
             paddle.async_save(layer_state_dict, static_save_path)
 
 
+class TestChunkedSaveLoad(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        paddle.seed(SEED)
+        paddle.framework.random._manual_program_seed(SEED)
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def build_and_train_model(self):
+        layer = LinearNet()
+        loss_fn = nn.CrossEntropyLoss()
+        adam = opt.Adam(learning_rate=0.001, parameters=layer.parameters())
+        train(layer, random_batch_reader(), loss_fn, adam)
+        return layer, adam
+
+    def check_load_state_dict(self, orig_dict, load_dict):
+        self.assertEqual(list(orig_dict.keys()), list(load_dict.keys()))
+        for var_name, value in orig_dict.items():
+            self.assertIsInstance(load_dict[var_name], paddle.Tensor)
+            self.assertEqual(load_dict[var_name].name, value.name)
+            np.testing.assert_array_equal(
+                value.numpy(), load_dict[var_name].numpy()
+            )
+
+    def test_save_load(self):
+        layer, adam = self.build_and_train_model()
+        layer_save_path = os.path.join(
+            self.temp_dir.name, "test_paddle_chunked_save_load.pdparams"
+        )
+        opt_save_path = os.path.join(
+            self.temp_dir.name, "test_paddle_chunked_save_load.pdopt"
+        )
+        paddle.save(
+            layer.state_dict(),
+            layer_save_path,
+            use_chunked_format=True,
+            num_threads=2,
+        )
+        paddle.save(adam.state_dict(), opt_save_path, use_chunked_format=True)
+
+        self.check_load_state_dict(
+            layer.state_dict(), paddle.load(layer_save_path)
+        )
+        self.check_load_state_dict(
+            adam.state_dict(), paddle.load(opt_save_path)
+        )
+
+        load_numpy = paddle.load(layer_save_path, return_numpy=True)
+        for var_name, value in layer.state_dict().items():
+            self.assertIsInstance(load_numpy[var_name], np.ndarray)
+            np.testing.assert_array_equal(value.numpy(), load_numpy[var_name])
+
+    def test_nested_structure(self):
+        obj = {
+            'tensor': paddle.randn([3, 5]),
+            'scalar': paddle.to_tensor(2.0),
+            'empty': paddle.zeros([0, 4]),
+            'ndarray': np.arange(10, dtype='int64'),
+            'nested': [paddle.arange(6).reshape([2, 3]).t(), ('text', 3)],
+            'epoch': 10,
+        }
+        path = os.path.join(self.temp_dir.name, "nested.pdparams")
+        paddle.save(obj, path, use_chunked_format=True)
+        load_obj = paddle.load(path)
+
+        self.assertEqual(load_obj['epoch'], 10)
+        self.assertEqual(load_obj['nested'][1], ('text', 3))
+        self.assertIsInstance(load_obj['ndarray'], np.ndarray)
+        np.testing.assert_array_equal(load_obj['ndarray'], obj['ndarray'])
+        for key in ['tensor', 'scalar', 'empty']:
+            self.assertEqual(load_obj[key].shape, obj[key].shape)
+            np.testing.assert_array_equal(
+                load_obj[key].numpy(), obj[key].numpy()
+            )
+        np.testing.assert_array_equal(
+            load_obj['nested'][0].numpy(), obj['nested'][0].numpy()
+        )
+
+    def test_async_save_load(self):
+        layer, adam = self.build_and_train_model()
+        path = os.path.join(self.temp_dir.name, "async_chunked.pdparams")
+        paddle.async_save(
+            layer.state_dict(),
+            path,
+            sync_other_task=True,
+            use_chunked_format=True,
+        )
+        paddle.clear_async_save_task_queue()
+        self.check_load_state_dict(layer.state_dict(), paddle.load(path))
+
+        with self.assertRaises(TypeError):
+            paddle.async_save((1, 2, 3), path, use_chunked_format=True)
+
+    def test_async_save_snapshot(self):
+        obj = {
+            'cpu': paddle.randn([64, 64]).cpu(),
+            'ndarray': np.random.random([64, 64]),
+        }
+        if paddle.is_compiled_with_cuda():
+            # large enough so that the copy is still running when staged
+            x = paddle.randn([4096, 4096], dtype='float32').cuda()
+            obj['gpu'] = paddle.matmul(x, x)
+            obj['gpu_fp16'] = paddle.cast(obj['gpu'], 'float16')
+        expected = {
+            key: value.numpy() if isinstance(value, paddle.Tensor) else value
+            for key, value in obj.items()
+        }
+        expected['ndarray'] = expected['ndarray'].copy()
+        path = os.path.join(self.temp_dir.name, "async_snapshot.pdparams")
+        paddle.async_save(
+            obj, path, sync_other_task=True, use_chunked_format=True
+        )
+        # in-place updates after async_save do not change the saved data
+        for value in obj.values():
+            if isinstance(value, paddle.Tensor):
+                value.zero_()
+            else:
+                value.fill(0)
+        paddle.clear_async_save_task_queue()
+
+        load_obj = paddle.load(path, return_numpy=True)
+        self.assertEqual(set(load_obj.keys()), set(expected.keys()))
+        for key, value in expected.items():
+            np.testing.assert_array_equal(load_obj[key], value)
+
+    def test_mmap_load(self):
+        layer, _ = self.build_and_train_model()
+        path = os.path.join(self.temp_dir.name, "mmap.pdparams")
+        paddle.save(layer.state_dict(), path, use_chunked_format=True)
+
+        load_state_dict = paddle.load(path, mmap=True)
+        self.check_load_state_dict(layer.state_dict(), load_state_dict)
+        for value in load_state_dict.values():
+            self.assertTrue(value.place.is_cpu_place())
+
+        # modifying the mapped tensors does not change the file
+        for value in load_state_dict.values():
+            value.set_value(paddle.zeros_like(value))
+        self.check_load_state_dict(layer.state_dict(), paddle.load(path))
+
+        new_layer = LinearNet()
+        new_layer.set_state_dict(paddle.load(path, mmap=True))
+        for var_name, value in layer.state_dict().items():
+            np.testing.assert_array_equal(
+                value.numpy(), new_layer.state_dict()[var_name].numpy()
+            )
+
+        load_numpy = paddle.load(path, mmap=True, return_numpy=True)
+        for var_name, value in layer.state_dict().items():
+            self.assertIsInstance(load_numpy[var_name], np.ndarray)
+            np.testing.assert_array_equal(value.numpy(), load_numpy[var_name])
+
+        pickle_path = os.path.join(self.temp_dir.name, "pickle.pdparams")
+        paddle.save(layer.state_dict(), pickle_path)
+        with self.assertRaises(ValueError):
+            paddle.load(pickle_path, mmap=True)
+
+    def test_illegal_config(self):
+        path = os.path.join(self.temp_dir.name, "illegal.pdparams")
+        with self.assertRaises(TypeError):
+            paddle.save({'x': paddle.ones([2])}, path, use_chunked_format=1)
+        with self.assertRaises(ValueError):
+            paddle.save(
+                {'x': paddle.ones([2])}, BytesIO(), use_chunked_format=True
+            )
+
+
 class TestSaveLoadProgram(unittest.TestCase):
     def test_save_load_program_pir(self):
         paddle.enable_static()
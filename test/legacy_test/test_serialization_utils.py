@@ -0,0 +1,97 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from paddle.distributed.communication.serialization_utils import (
+    convert_object_to_tensor,
+    convert_tensor_to_object,
+    pack_object,
+    unpack_object,
+)
+
+
+class TestPackObject(unittest.TestCase):
+    def check_round_trip(self, obj):
+        frame = pack_object(obj)
+        self.assertEqual(frame.dtype, np.uint8)
+        self.assertEqual(frame.ndim, 1)
+        return unpack_object(frame)
+
+    def test_plain_object(self):
+        obj = {
+            "foo": [1, 2.5, "bar", None],
+            "nested": ({"a": True}, (3, [4, 5])),
+            "bytes": b"\x00\x01",
+        }
+        self.assertEqual(self.check_round_trip(obj), obj)
+        self.assertEqual(self.check_round_trip(None), None)
+        self.assertEqual(self.check_round_trip([]), [])
+
+    def test_out_of_band_arrays(self):
+        obj = {
+            "float": np.random.random([64, 32]).astype("float32"),
+            "int": [np.arange(1000, dtype="int64"), "text"],
+            "bool": (np.array([True, False, True]),),
+            "strided": np.arange(100, dtype="float64")[::3],
+        }
+        frame = pack_object(obj)
+        out = unpack_object(frame)
+        self.assertEqual(out.keys(), obj.keys())
+        np.testing.assert_array_equal(out["float"], obj["float"])
+        np.testing.assert_array_equal(out["int"][0], obj["int"][0])
+        self.assertEqual(out["int"][1], "text")
+        np.testing.assert_array_equal(out["bool"][0], obj["bool"][0])
+        np.testing.assert_array_equal(out["strided"], obj["strided"])
+        self.assertEqual(out["float"].dtype, np.float32)
+        # contiguous arrays are unpickled as views of the frame
+        self.assertTrue(np.shares_memory(out["float"], frame))
+        self.assertTrue(np.shares_memory(out["int"][0], frame))
+
+    def test_empty_and_0d_arrays(self):
+        obj = [
+            np.zeros([0], dtype="float32"),
+            np.zeros([0, 4], dtype="int32"),
+            np.array(3.5),
+            np.float64(2.0),
+        ]
+        out = self.check_round_trip(obj)
+        for x, y in zip(out, obj):
+            self.assertEqual(x.shape, y.shape)
+            self.assertEqual(x.dtype, y.dtype)
+            np.testing.assert_array_equal(x, y)
+
+    def test_frame_in_larger_buffer(self):
+        obj = {"x": np.arange(97, dtype="int16"), "y": "z"}
+        frame = pack_object(obj)
+        # frames are sliced out of the gathered buffer at any offset and
+        # may be followed by padding
+        buffer = np.zeros([frame.size + 131], dtype=np.uint8)
+        buffer[3 : 3 + frame.size] = frame
+        out = unpack_object(buffer[3 : 3 + frame.size])
+        np.testing.assert_array_equal(out["x"], obj["x"])
+        self.assertEqual(out["y"], "z")
+
+    def test_convert_tensor(self):
+        obj = {"x": np.arange(10, dtype="float32"), "y": [1, 2]}
+        tensor, size = convert_object_to_tensor(obj)
+        out = convert_tensor_to_object(tensor, size)
+        np.testing.assert_array_equal(out["x"], obj["x"])
+        self.assertEqual(out["y"], [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
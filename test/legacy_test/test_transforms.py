@@ -23,6 +23,7 @@ from PIL import Image
 
 import paddle
 import paddle.vision.transforms.functional as F
+import paddle.vision.transforms.functional_tensor as F_t
 from paddle.vision import image_load, set_image_backend
 from paddle.vision.datasets import DatasetFolder
 from paddle.vision.transforms import transforms
@@ -668,6 +669,72 @@ class TestTransformsTensor(TestTransformsCV2):
     test_color_jitter = None  # noqa: F811
 
 
+class TestBatchTransforms(unittest.TestCase):
+    def setUp(self):
+        self.imgs = paddle.rand([4, 3, 64, 64])
+
+    def test_resized_crop_batch(self):
+        boxes = np.array(
+            [[0, 0, 64, 64], [8, 4, 32, 48], [30, 20, 34, 40], [1, 2, 40, 32]]
+        )
+        out = F_t.resized_crop_batch(self.imgs, boxes, (16, 16))
+        self.assertEqual(out.shape, [4, 3, 16, 16])
+        for img, (i, j, h, w), result in zip(self.imgs, boxes, out):
+            expected = F.resize(F.crop(img, i, j, h, w), (16, 16))
+            np.testing.assert_allclose(
+                result.numpy(), expected.numpy(), rtol=1e-5, atol=1e-5
+            )
+
+    def test_erase_batch(self):
+        boxes = np.array(
+            [[0, 0, 0, 0], [8, 4, 10, 6], [60, 50, 4, 14], [0, 0, 64, 64]]
+        )
+        value = paddle.to_tensor([0.1, 0.2, 0.3]).reshape([1, 3, 1, 1])
+        out = F_t.erase_batch(self.imgs, boxes, value)
+        for img, (i, j, h, w), result in zip(self.imgs, boxes, out):
+            expected = F.erase(img, i, j, h, w, value[0])
+            np.testing.assert_array_equal(result.numpy(), expected.numpy())
+
+    def test_color_batch(self):
+        factors = np.array([0.0, 0.5, 1.0, 1.8])
+        hue_factors = np.array([-0.5, -0.1, 0.0, 0.3])
+        for adjust_batch, adjust, values in [
+            (F_t.adjust_brightness_batch, F.adjust_brightness, factors),
+            (F_t.adjust_contrast_batch, F.adjust_contrast, factors),
+            (F_t.adjust_saturation_batch, F.adjust_saturation, factors),
+            (F_t.adjust_hue_batch, F.adjust_hue, hue_factors),
+        ]:
+            out = adjust_batch(self.imgs, values)
+            for img, value, result in zip(self.imgs, values, out):
+                np.testing.assert_allclose(
+                    result.numpy(),
+                    adjust(img, value).numpy(),
+                    rtol=1e-5,
+                    atol=1e-5,
+                )
+
+    def test_transforms(self):
+        trans = transforms.Compose(
+            [
+                transforms.BatchRandomResizedCrop(32),
+                transforms.BatchColorJitter(0.4, 0.4, 0.4, 0.4),
+                transforms.Normalize(mean=[0.5, 0.5, 0.5], std=[0.5, 0.5, 0.5]),
+                transforms.BatchRandomErasing(value='random'),
+            ]
+        )
+        self.assertEqual(trans(self.imgs).shape, [4, 3, 32, 32])
+
+        out = transforms.BatchRandomErasing(prob=0.0)(self.imgs)
+        np.testing.assert_array_equal(out.numpy(), self.imgs.numpy())
+        out = transforms.BatchRandomErasing(prob=1.0, value=2.0)(self.imgs)
+        self.assertTrue(
+            ((out == 2.0).astype('int32').sum(axis=[1, 2, 3]) > 0).all()
+        )
+
+        with self.assertRaises(RuntimeError):
+            transforms.BatchColorJitter(0.4)(self.imgs[0])
+
+
 class TestFunctional(unittest.TestCase):
     def test_errors(self):
         with self.assertRaises(TypeError):
@@ -25,10 +25,15 @@ from test_case_base import (
     test_instruction_translator_cache_context,
 )
 
+import paddle
 from paddle.jit.sot.opcode_translator.custom_code import CustomCode
 from paddle.jit.sot.opcode_translator.executor.executor_cache import (
     OpcodeExecutorCache,
 )
+from paddle.jit.sot.utils import (
+    allow_dynamic_shape_guard,
+    max_cache_size_guard,
+)
 
 if TYPE_CHECKING:
     from types import FrameType
@@ -162,5 +167,63 @@ class TestCacheExceedLimit(TestCaseBase):
             self.assert_results(foo, input)
 
 
+def add_const(x, y):
+    return x + y
+
+
+class TestGuardTree(TestCaseBase):
+    def test_share_conditions(self):
+        x = paddle.randn([2, 3])
+        with allow_dynamic_shape_guard(
+            False
+        ), test_instruction_translator_cache_context() as ctx:
+            for y in range(3):
+                self.assert_results(add_const, x, y)
+            self.assertEqual(ctx.translate_count, 3)
+            guard_tree = ctx.cache[add_const.__code__]
+            self.assertEqual(len(guard_tree), 3)
+            # conditions of x are shared, translations differ only in y
+            self.assertEqual(len(guard_tree.root.children), 1)
+            self.assertEqual(len(guard_tree.root.children[0].children), 3)
+            for y in range(3):
+                self.assert_results(add_const, x, y)
+            self.assertEqual(ctx.translate_count, 3)
+
+    def test_evict_least_recently_hit(self):
+        x = paddle.randn([2, 3])
+        with allow_dynamic_shape_guard(False), max_cache_size_guard(
+            2
+        ), test_instruction_translator_cache_context() as ctx:
+            self.assert_results(add_const, x, 1)
+            self.assert_results(add_const, x, 2)
+            self.assert_results(add_const, x, 1)
+            self.assertEqual(ctx.translate_count, 2)
+            # y=2 is evicted
+            self.assert_results(add_const, x, 3)
+            self.assertEqual(ctx.translate_count, 3)
+            self.assertEqual(len(ctx.cache[add_const.__code__]), 2)
+            self.assert_results(add_const, x, 1)
+            self.assertEqual(ctx.translate_count, 3)
+            self.assert_results(add_const, x, 2)
+            self.assertEqual(ctx.translate_count, 4)
+
+    def test_fallback_after_evictions(self):
+        x = paddle.randn([2, 3])
+        with allow_dynamic_shape_guard(False), max_cache_size_guard(
+            2
+        ), test_instruction_translator_cache_context() as ctx:
+            for y in range(4):
+                self.assert_results(add_const, x, y)
+            self.assertEqual(ctx.translate_count, 4)
+            self.assertEqual(ctx.cache[add_const.__code__].num_evicted, 2)
+            # misses fall back to dygraph without translating
+            for y in range(4, 8):
+                self.assert_results(add_const, x, y)
+            self.assertEqual(ctx.translate_count, 4)
+            # hits are still served by the cached translations
+            self.assert_results(add_const, x, 3)
+            self.assertEqual(len(ctx.cache[add_const.__code__]), 2)
+
+
 if __name__ == '__main__':
     unittest.main()